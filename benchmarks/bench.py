@@ -0,0 +1,248 @@
+#Micro-benchmarks of the solving methods and search backends
+#Each benchmark is a function called many times on the same input, and reports :
+#- ns_per_call and calls_per_sec : the best of several rounds, each round lasting at least min_time seconds
+#- removed_per_ms : candidates removed per millisecond (for the human methods)
+#- peak_kib : peak memory allocated during one call (measured in a separate call, since tracemalloc slows everything down)
+#The inputs are the boards of solver.py, the candidate grids of the tests (every grid_before of tests/) and optionally a puzzle file
+#
+#Usage (from the root of the repository) :
+#    python -m benchmarks.bench run -o before.json
+#    python -m benchmarks.bench run -o after.json --filter "naked|x_wing" --corpus puzzles.txt --limit 200
+#    python -m benchmarks.bench compare before.json after.json --threshold 0.1
+import argparse
+import ast
+import glob
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+
+from sudoku_solver import human_solve, solver
+from sudoku_solver.boards import board_from_string, board_to_string, puzzle_string
+from sudoku_solver.cache import RESULTS
+from sudoku_solver.candidate_grid import CandidateGrid
+from sudoku_solver.propagation import propagate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BOARDS = ("easy", "medium", "difficult", "expert", "diabolical", "extreme", "two_sols")
+
+#The human methods all take a grid and return (grid, removed)
+def _propagate(grid):
+    return (grid, propagate(grid))
+
+METHODS = {
+    "propagate": _propagate,
+    "simple_elimination": human_solve.simple_elimination,
+    "hidden_singles": human_solve.hidden_singles,
+    "naked_pairs": human_solve.naked_pairs,
+    "naked_subsets": human_solve.naked_subsets,
+    "hidden_pairs": human_solve.hidden_pairs,
+    "hidden_subsets": human_solve.hidden_subsets,
+    "pointing_pairs": human_solve.pointing_pairs,
+    "box_line_reduction": human_solve.box_line_reduction,
+    "intersection_removal": human_solve.intersection_removal,
+    "x_wing": human_solve.x_wing,
+    "fish": human_solve.fish,
+    "forcing": human_solve.forcing,
+}
+
+#Every grid_before of the tests, with the name of its test
+def grid_fixtures(directory=os.path.join(ROOT, "tests")):
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(directory, "test_*.py"))):
+        with open(path) as f:
+            tree = ast.parse(f.read())
+        for function in ast.walk(tree):
+            if not isinstance(function, ast.FunctionDef):
+                continue
+            for node in ast.walk(function):
+                if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "grid_before" for t in node.targets):
+                    try:
+                        grid = ast.literal_eval(node.value)
+                    except ValueError:
+                        continue
+                    fixtures[os.path.basename(path)[:-3] + "." + function.name] = grid
+    #The same grid is often used by several tests of a file
+    unique = {}
+    for name, grid in fixtures.items():
+        if grid not in unique.values():
+            unique[name] = grid
+    return unique
+
+#Read up to limit puzzles from a file with one puzzle per line
+def corpus_puzzles(path, limit=None):
+    puzzles = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            puzzles.append(puzzle_string(line[:81]))
+            if len(puzzles) == limit:
+                break
+    return puzzles
+
+#A benchmark is a name, a function making the inputs of a round of n calls, and the function to call on each input
+#The inputs are made before the timing starts, so that copying the grids isn't measured
+class Benchmark:
+    __slots__ = ("name", "make_inputs", "call", "counts_removed")
+
+    def __init__(self, name, make_inputs, call, counts_removed=False):
+        self.name = name
+        self.make_inputs = make_inputs
+        self.call = call
+        self.counts_removed = counts_removed
+
+def _method_benchmark(name, method, grid):
+    return Benchmark(name, lambda n: [grid.copy() for _ in range(n)], method, True)
+
+def _solve_benchmark(name, grid, mode):
+    return Benchmark(name, lambda n: [grid.copy() for _ in range(n)], lambda g: (g, human_solve.solve(g, mode)[1]))
+
+def _search_benchmark(name, board, backend):
+    return Benchmark(name, lambda n: [board] * n, lambda b: next(solver.solutions(b, backend), None))
+
+def _count_benchmark(name, board, backend):
+    return Benchmark(name, lambda n: [board] * n, lambda b: solver.count_solutions(b, 2, backend))
+
+def _batch_benchmark(name, puzzles, call):
+    return Benchmark(name, lambda n: [puzzles] * n, call)
+
+def benchmarks(corpus=None, limit=None):
+    grids = {name: CandidateGrid.from_string(board_to_string(getattr(solver, name))) for name in BOARDS}
+    grids.update({name: CandidateGrid.from_list(grid) for name, grid in grid_fixtures().items()})
+    found = []
+    for method_name, method in METHODS.items():
+        for grid_name, grid in grids.items():
+            found.append(_method_benchmark("method/" + method_name + "/" + grid_name, method, grid))
+    for name in BOARDS:
+        for mode in ("scheduled", "sweep"):
+            found.append(_solve_benchmark("solve/" + mode + "/" + name, grids[name], mode))
+        for backend in sorted(solver.BACKENDS):
+            found.append(_search_benchmark("search/" + backend + "/" + name, getattr(solver, name), backend))
+            found.append(_count_benchmark("count/" + backend + "/" + name, getattr(solver, name), backend))
+    if corpus:
+        puzzles = corpus_puzzles(corpus, limit)
+        for backend in sorted(solver.BACKENDS):
+            if backend != "backtrack":
+                found.append(_batch_benchmark("corpus/" + backend, puzzles,
+                                              lambda p, backend=backend: [next(solver.solutions(board_from_string(s), backend), None) for s in p]))
+        try:
+            from sudoku_solver import vectorized
+        except ImportError:
+            vectorized = None
+        if vectorized is not None:
+            found.append(_batch_benchmark("corpus/vectorized", puzzles, vectorized.solve_batch))
+    return found
+
+#Time a benchmark : rounds of calls, the number of calls being chosen so that a round lasts at least min_time
+def measure(benchmark, min_time=0.2, repeat=3):
+    call = benchmark.call
+    n = 1
+    while True:
+        inputs = benchmark.make_inputs(n)
+        start = time.perf_counter_ns()
+        for x in inputs:
+            call(x)
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= min_time * 1e9 or n >= 1 << 20:
+            break
+        n = max(n * 2, int(n * min_time * 1e9 / max(elapsed, 1) * 1.2))
+    best = elapsed
+    for _ in range(repeat - 1):
+        inputs = benchmark.make_inputs(n)
+        start = time.perf_counter_ns()
+        for x in inputs:
+            call(x)
+        best = min(best, time.perf_counter_ns() - start)
+    ns = best / n
+    result = {"calls": n, "ns_per_call": round(ns, 1), "calls_per_sec": round(1e9 / ns, 1) if ns else None}
+    #One more call, for the candidates removed and the memory
+    x = benchmark.make_inputs(1)[0]
+    tracemalloc.start()
+    value = call(x)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result["peak_kib"] = round(peak / 1024, 1)
+    if benchmark.counts_removed:
+        removed = value[1]
+        result["removed"] = removed
+        result["removed_per_ms"] = round(removed / (ns / 1e6), 1) if ns else None
+    return result
+
+def run(pattern=None, corpus=None, limit=None, min_time=0.2, repeat=3, log=None):
+    #Every call would be a hit after the first one, so the results cache is turned off
+    RESULTS.configure(enabled=False)
+    selected = [b for b in benchmarks(corpus, limit) if pattern is None or re.search(pattern, b.name)]
+    results = {}
+    for benchmark in selected:
+        results[benchmark.name] = measure(benchmark, min_time, repeat)
+        if log:
+            print(benchmark.name + " : " + format(results[benchmark.name]["ns_per_call"], ",.0f") + " ns/call", file=log)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "min_time": min_time,
+        "repeat": repeat,
+        "results": results,
+    }
+
+#Compare two runs : return (name, old ns, new ns, ratio) for the benchmarks of both runs, and the names of the regressions
+#A regression is a benchmark whose time grew by more than threshold (0.1 = 10%)
+def compare(old, new, threshold=0.1):
+    rows = []
+    regressions = []
+    for name in sorted(set(old["results"]) & set(new["results"])):
+        before = old["results"][name]["ns_per_call"]
+        after = new["results"][name]["ns_per_call"]
+        ratio = after / before if before else float("inf")
+        rows.append((name, before, after, ratio))
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return (rows, regressions)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks of the sudoku solving methods and search backends")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks and write the results as JSON")
+    run_parser.add_argument("-o", "--output", default="-", help="JSON file, or - for the standard output (default)")
+    run_parser.add_argument("-f", "--filter", default=None, help="only run the benchmarks whose name matches this regular expression")
+    run_parser.add_argument("--corpus", default=None, help="file with one puzzle per line to benchmark the backends on")
+    run_parser.add_argument("--limit", type=int, default=100, help="puzzles read from the corpus (default: 100)")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="minimum duration of a round in seconds (default: 0.2)")
+    run_parser.add_argument("--repeat", type=int, default=3, help="rounds per benchmark, the best is kept (default: 3)")
+    compare_parser = commands.add_parser("compare", help="compare two JSON runs and fail if a benchmark got slower")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("-t", "--threshold", type=float, default=0.1, help="allowed slowdown (default: 0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run(args.filter, args.corpus, args.limit, args.min_time, args.repeat, sys.stderr)
+        text = json.dumps(report, indent=1, sort_keys=True)
+        if args.output == "-":
+            print(text)
+        else:
+            with open(args.output, "w") as f:
+                f.write(text + "\n")
+        return 0
+
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    rows, regressions = compare(old, new, args.threshold)
+    for name, before, after, ratio in rows:
+        flag = "  REGRESSION" if name in regressions else ""
+        print(name.ljust(60) + format(before, ">14,.0f") + format(after, ">14,.0f") + format(ratio, ">8.2f") + "x" + flag)
+    print(str(len(regressions)) + " regression(s) above " + format(args.threshold * 100, ".0f") + "% out of " + str(len(rows)) + " benchmarks")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
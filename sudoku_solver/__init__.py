@@ -0,0 +1,14 @@
+#Sudoku solving methods : human methods (human_solve), search backends (solver, dlx) and batch tools (batch, corpus, vectorized)
+#Importing the package does no work besides building the lookup tables of topology and candidate_grid :
+#the demos are run through the command line entry points (python -m sudoku_solver, or python -m sudoku_solver.<module>),
+#and the modules that need numpy (corpus, vectorized) or tkinter (gui) are only imported when asked for
+from .boards import puzzle_string, board_from_string, board_to_string
+from .candidate_grid import CandidateGrid, Contradiction
+from .propagation import propagate
+from .stats import SolveStats, StrategyRun
+from .cache import ResultCache, RESULTS
+from .solver import BACKENDS, solutions, count_solutions, has_unique_solution, solve_with
+
+__all__ = ["puzzle_string", "board_from_string", "board_to_string", "CandidateGrid", "Contradiction", "propagate", "SolveStats", "StrategyRun",
+           "ResultCache", "RESULTS",
+           "BACKENDS", "solutions", "count_solutions", "has_unique_solution", "solve_with"]
@@ -0,0 +1,35 @@
+#Command line entry point : python -m sudoku_solver <command> [arguments]
+#- human : solve a puzzle with the human methods and print the steps (see human_solve.py)
+#- search : print every solution of a puzzle found by backtracking (see solver.py)
+#- batch : solve a file of puzzles over several processes (see batch.py)
+#- rate : rate a file of puzzles with the human methods and print the histogram of the levels (see batch.py and rating.py)
+#- generate : make puzzles with a unique solution at a chosen level (see generator.py)
+#- gui : open the graphical interface (see gui.py)
+import sys
+
+COMMANDS = ("human", "search", "batch", "rate", "generate", "gui")
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print("usage: python -m sudoku_solver {" + ",".join(COMMANDS) + "} [arguments]", file=sys.stderr)
+        return 2
+    command, argv = argv[0], argv[1:]
+    #Only the module of the command is imported
+    if command == "human":
+        from .human_solve import main as run
+    elif command == "search":
+        from .solver import main as run
+    elif command == "batch":
+        from .batch import main as run
+    elif command == "rate":
+        from .batch import rate_main as run
+    elif command == "generate":
+        from .generator import main as run
+    else:
+        from .gui import main as run
+    run(argv)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+#Solve puzzle collections in batch over several processes
+#The input has one puzzle per line, as a string of 81 characters with 0 or . for the empty cells (the format of grid_from_string)
+#Blank lines and lines starting with # are skipped
+#The output has one line per puzzle : the solution as a string of 81 digits, or "no solution" / "invalid puzzle"
+#In unordered mode the lines are written as soon as they are solved, prefixed with the position of the puzzle in the input (from 0)
+#With a result store (see store.py), every puzzle is also saved with its number of solutions, its time and optionally its rating,
+#the puzzles already in the store are not solved again, and an interrupted run can be resumed from its last commit
+#
+#Usage : python -m sudoku_solver.batch puzzles.txt -o solutions.txt --workers 8 --chunksize 512
+#        cat puzzles.txt | python -m sudoku_solver.batch --unordered > solutions.txt
+#        python -m sudoku_solver.batch puzzles.txt -o solutions.txt --store results.db --rate --resume
+#The puzzles can also be rated instead of solved (see rate_file) : python -m sudoku_solver rate puzzles.txt -o ratings.txt
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from .boards import board_from_string, board_to_string, puzzle_string
+from .candidate_grid import Contradiction
+from .store import ResultStore, StoredResult
+from . import rating, solver
+
+NO_SOLUTION = "no solution"
+INVALID = "invalid puzzle"
+
+#Summary of a batch run
+#known is the number of puzzles that were found in the result store instead of being solved
+BatchReport = namedtuple("BatchReport", ["puzzles", "solved", "seconds", "known"], defaults=(0,))
+
+#Solve a single puzzle and return the line to write
+def solve_line(line, backend="mrv"):
+    try:
+        board = board_from_string(line)
+    except ValueError:
+        return INVALID
+    for solution in solver.solutions(board, backend):
+        return board_to_string(solution)
+    return NO_SOLUTION
+
+#Rating of a puzzle for the result store : the name of its level (see rating.py), None if it has no solution
+def rate_puzzle(puzzle):
+    try:
+        return rating.LEVELS[rating.grade(puzzle)]
+    except Contradiction:
+        return None
+
+#Solve a puzzle (string of 81 digits) for the result store : its first solution and whether there is a second one
+def solve_record(puzzle, backend="mrv", rate=False):
+    start = time.perf_counter()
+    found = solver.solutions(board_from_string(puzzle), backend)
+    first = next(found, None)
+    count = 0 if first is None else 1 if next(found, None) is None else 2
+    seconds = time.perf_counter() - start
+    return StoredResult(puzzle, None if first is None else board_to_string(first), count, rate_puzzle(puzzle) if rate else None,
+                        seconds, backend)
+
+#The line to write for a stored result (None for an invalid puzzle)
+def _record_line(record):
+    if record is None:
+        return INVALID
+    return NO_SOLUTION if record.solution is None else record.solution
+
+#Work done by a worker process : a whole chunk at a time so that the cost of sending the puzzles is shared
+def _solve_chunk(start, lines, backend):
+    return (start, [solve_line(line, backend) for line in lines])
+
+#Each worker process opens the store once, to read the puzzles that were already solved
+#With a single worker they are opened in the current process, solve_file closes them at the end
+_readers = {}
+
+def _reader(path):
+    if path not in _readers:
+        _readers[path] = ResultStore(path, readonly=True)
+    return _readers[path]
+
+def _close_readers():
+    for reader in _readers.values():
+        reader.close()
+    _readers.clear()
+
+#Work done by a worker process with a result store : the puzzles already in the store are read from it (unless recompute is set),
+#the others are solved. When rate is set, a stored puzzle that has a solution but no rating is rated (its solution is kept)
+#Return the StoredResult of every puzzle (None if invalid) with True for the ones to save
+def _solve_records(start, lines, backend, rate, path, recompute):
+    puzzles = []
+    for line in lines:
+        try:
+            puzzles.append(puzzle_string(line))
+        except ValueError:
+            puzzles.append(None)
+    known = {} if recompute else _reader(path).known(p for p in puzzles if p is not None)
+    results = []
+    for puzzle in puzzles:
+        if puzzle is None:
+            results.append((None, False))
+        elif puzzle in known:
+            record = known[puzzle]
+            if rate and record.rating is None and record.count:
+                results.append((record._replace(rating=rate_puzzle(puzzle)), True))
+            else:
+                results.append((record, False))
+        else:
+            results.append((solve_record(puzzle, backend, rate), True))
+    return (start, results)
+
+#Read the puzzles from a file and group them in chunks of chunksize puzzles (with the position of the first puzzle of the chunk)
+#The first skip puzzles are left out (their positions still count)
+def _chunks(source, chunksize, skip=0):
+    chunk = []
+    start = skip
+    for line in source:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if skip:
+            skip -= 1
+            continue
+        chunk.append(line)
+        if len(chunk) == chunksize:
+            yield (start, chunk)
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield (start, chunk)
+
+#Run work(start, lines, *args) on every chunk and generate what it returns, in the order of the chunks or as soon as they are ready
+#With more than one worker the chunks are sent to worker processes, only a few chunks per worker are in flight at any time so that the
+#input is read as the work goes instead of all at once
+def _run_chunks(chunks, work, args, workers, ordered=True):
+    if workers == 1:
+        for start, lines in chunks:
+            yield work(start, lines, *args)
+        return
+    in_flight = workers * 4
+    with ProcessPoolExecutor(workers) as pool:
+        if ordered:
+            pending = deque()
+            for start, lines in chunks:
+                pending.append(pool.submit(work, start, lines, *args))
+                if len(pending) >= in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        else:
+            pending = set()
+            for start, lines in chunks:
+                pending.add(pool.submit(work, start, lines, *args))
+                if len(pending) >= in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in pending:
+                yield future.result()
+
+#Solve every puzzle of source (an iterable of lines, like an open file) and write the results to output (a file open for writing)
+#- workers : number of processes (the number of cores by default), with 1 everything runs in the current process
+#- chunksize : number of puzzles sent to a worker at once, bigger chunks cost less to send but balance the work less evenly
+#- ordered : write the results in the order of the input, otherwise write them as soon as they are ready (with their position)
+#With a store (an open ResultStore) :
+#- the results are saved in it, in one transaction every commit_every puzzles, with the position reached by the run named run
+#- resume : skip the puzzles of the input that were done at the last commit of the run (nothing is written for them)
+#- recompute : solve the puzzles that are already in the store again, instead of reading their results
+#- rate : also rate the puzzles with the human methods (see rate_puzzle), including the ones stored earlier without a rating
+#  (a resumed run starts again from the beginning if the store has such puzzles, see resume_position)
+def solve_file(source, output, workers=None, chunksize=256, ordered=True, backend="mrv",
+               store=None, run=None, resume=False, recompute=False, rate=False, commit_every=10000):
+    solver.get_backend(backend)
+    workers = workers or os.cpu_count() or 1
+    puzzles = 0
+    solved = 0
+    known = 0
+    start_time = time.perf_counter()
+    if store is None:
+        work, args = _solve_chunk, (backend,)
+        skip = 0
+    else:
+        #The results committed so far must be visible to the workers
+        store.commit()
+        work, args = _solve_records, (backend, rate, store.path, recompute)
+        skip = resume_position(store, run, rate) if resume and run is not None else 0
+    #Position up to which every puzzle is done, and the chunks done after it (unordered mode)
+    position = committed = skip
+    finished = {}
+
+    def write(start, results):
+        nonlocal puzzles, solved, known, position, committed
+        if store is not None:
+            store.add(record for record, new in results if new)
+            known += sum(1 for record, new in results if record is not None and not new)
+            results = [_record_line(record) for record, _ in results]
+        for k, result in enumerate(results):
+            if ordered:
+                output.write(result + "\n")
+            else:
+                output.write(str(start + k) + " " + result + "\n")
+            if result != NO_SOLUTION and result != INVALID:
+                solved += 1
+        puzzles += len(results)
+        if store is not None:
+            finished[start] = start + len(results)
+            while position in finished:
+                position = finished.pop(position)
+            if position - committed >= commit_every:
+                #The output must be saved at least as far as the store, so that a resumed run can go on writing it
+                output.flush()
+                store.commit(run, position)
+                committed = position
+
+    try:
+        for start, results in _run_chunks(_chunks(source, chunksize, skip), work, args, workers, ordered):
+            write(start, results)
+    except BaseException:
+        #Like a crash : what wasn't committed is dropped, and a resumed run goes on from the last commit
+        if store is not None:
+            store.rollback()
+        raise
+    finally:
+        _close_readers()
+    if store is not None:
+        output.flush()
+        store.commit(run, position)
+    return BatchReport(puzzles, solved, time.perf_counter() - start_time, known)
+
+#Number of puzzles of its input that a resumed run can skip : the position of its last commit, or 0 when rating if the store has
+#puzzles with a solution but no rating (the puzzles done before may have been done without --rate, they have to be read again)
+def resume_position(store, run, rate=False):
+    if rate and store.unrated():
+        return 0
+    return store.position(run)
+
+#Work done by a worker process when rating : the ratings of the chunk are added up in a RatingSummary, and the lines to write are only made
+#if they are wanted (a line per puzzle : its level, its number of passes and the candidates removed by each technique)
+def _rate_chunk(start, lines, write_lines):
+    summary = rating.RatingSummary()
+    results = [] if write_lines else None
+    for line in lines:
+        try:
+            found = rating.rate(puzzle_string(line))
+        except ValueError:
+            summary.invalid += 1
+            result = INVALID
+        except Contradiction:
+            summary.no_solution += 1
+            result = NO_SOLUTION
+        else:
+            summary.add(found)
+            result = rating.LEVELS[found.level] + " " + str(found.passes) + " " + " ".join(str(n) for n in found.removed)
+        if write_lines:
+            results.append(result)
+    return (start, summary, results)
+
+#Rate every puzzle of source (see rating.py) and return the RatingSummary of the whole file
+#If output is given, a line is written for every puzzle (in the order of the input, or prefixed with its position when ordered is False)
+def rate_file(source, output=None, workers=None, chunksize=256, ordered=True):
+    workers = workers or os.cpu_count() or 1
+    summary = rating.RatingSummary()
+    for start, part, results in _run_chunks(_chunks(source, chunksize), _rate_chunk, (output is not None,), workers, ordered):
+        summary.merge(part)
+        if output is not None:
+            for k, result in enumerate(results):
+                output.write((result if ordered else str(start + k) + " " + result) + "\n")
+    return summary
+
+#Keep the first n lines of a file (the lines written by a run after its last commit are written again when it is resumed)
+def _keep_lines(path, n):
+    with open(path, "r+b") as f:
+        for _ in range(n):
+            if not f.readline():
+                break
+        f.truncate(f.tell())
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a file of sudoku puzzles (one 81 character puzzle per line) over several processes")
+    parser.add_argument("input", nargs="?", default="-", help="puzzle file, or - for the standard input (default)")
+    parser.add_argument("-o", "--output", default="-", help="solution file, or - for the standard output (default)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="number of processes (default: number of cores)")
+    parser.add_argument("-c", "--chunksize", type=int, default=256, help="puzzles sent to a process at once (default: 256)")
+    parser.add_argument("-u", "--unordered", action="store_true", help="write the solutions as soon as they are ready, prefixed with the puzzle position")
+    parser.add_argument("-b", "--backend", default="mrv", choices=sorted(solver.BACKENDS), help="search backend (default: mrv)")
+    parser.add_argument("-s", "--store", default=None, help="SQLite result store : the results are saved in it and the puzzles already in it are not solved again")
+    parser.add_argument("--run", default=None, help="name of the run in the store, to resume it (default: the path of the input)")
+    parser.add_argument("-r", "--resume", action="store_true", help="go on from the last commit of the run, appending to the output")
+    parser.add_argument("--recompute", action="store_true", help="solve the puzzles already in the store again")
+    parser.add_argument("--rate", action="store_true", help="also rate the puzzles with the human methods (saved in the store)")
+    parser.add_argument("--commit-every", type=int, default=10000, help="puzzles per transaction of the store (default: 10000)")
+    args = parser.parse_args(argv)
+    if args.store is None and (args.resume or args.rate or args.recompute):
+        parser.error("--resume, --rate and --recompute need a --store")
+    run = args.run
+    if run is None and args.input != "-":
+        run = os.path.abspath(args.input)
+    if args.resume and run is None:
+        parser.error("--resume needs a --run name when reading the standard input")
+
+    store = None if args.store is None else ResultStore(args.store)
+    mode = "w"
+    if args.resume and args.output != "-":
+        mode = "a"
+        #In order, the lines of the output are the puzzles done at the last commit (and the ones after it, which are written again)
+        #Unordered, the lines come with their position and some may be written twice
+        if not args.unordered and os.path.exists(args.output):
+            _keep_lines(args.output, resume_position(store, run, args.rate))
+    source = sys.stdin if args.input == "-" else open(args.input)
+    output = sys.stdout if args.output == "-" else open(args.output, mode)
+    try:
+        report = solve_file(source, output, args.workers, args.chunksize, not args.unordered, args.backend,
+                            store, run, args.resume, args.recompute, args.rate, args.commit_every)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+        if store is not None:
+            store.close()
+    rate = report.puzzles / report.seconds if report.seconds else 0
+    print(str(report.puzzles) + " puzzles (" + str(report.solved) + " solved, " + str(report.known) + " from the store) in "
+          + format(report.seconds, ".2f") + "s : " + format(rate, ".0f") + " puzzles/sec", file=sys.stderr)
+
+#Command line of the batch ratings : python -m sudoku_solver rate puzzles.txt
+def rate_main(argv=None):
+    parser = argparse.ArgumentParser(description="Rate a file of sudoku puzzles with the human methods and print the histogram of the levels")
+    parser.add_argument("input", nargs="?", default="-", help="puzzle file, or - for the standard input (default)")
+    parser.add_argument("-o", "--output", default=None, help="also write the rating of every puzzle to this file (- for the standard output)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="number of processes (default: number of cores)")
+    parser.add_argument("-c", "--chunksize", type=int, default=256, help="puzzles sent to a process at once (default: 256)")
+    parser.add_argument("-u", "--unordered", action="store_true", help="write the ratings as soon as they are ready, prefixed with the puzzle position")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    output = None if args.output is None else sys.stdout if args.output == "-" else open(args.output, "w")
+    start_time = time.perf_counter()
+    try:
+        summary = rate_file(source, output, args.workers, args.chunksize, not args.unordered)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not None and output is not sys.stdout:
+            output.close()
+    seconds = time.perf_counter() - start_time
+    #The summary goes to the standard error when the ratings go to the standard output
+    report = sys.stderr if output is sys.stdout else sys.stdout
+    if args.json:
+        print(json.dumps(summary.as_dict(), indent=1), file=report)
+    else:
+        print(summary.format(), file=report)
+    speed = summary.puzzles / seconds if seconds else 0
+    print(str(summary.puzzles) + " puzzles in " + format(seconds, ".2f") + "s : " + format(speed, ".0f") + " puzzles/sec", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
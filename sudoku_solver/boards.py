@@ -0,0 +1,23 @@
+#Conversions between the two puzzle formats used in the project :
+#- the 9x9 boards of solver.py (list of 9 lists of 9 ints, 0 for an empty cell)
+#- the 81 character strings of human_solve.py (one digit per cell in reading order, 0 for an empty cell)
+#Strings coming from puzzle collections often use "." for the empty cells, so both are accepted
+
+#Return the puzzle as a string of 81 digits with 0s for the empty cells, whatever its format
+def puzzle_string(puzzle):
+    if isinstance(puzzle, str):
+        numbers = puzzle.strip().replace(".", "0")
+    else:
+        numbers = "".join(str(n) for row in puzzle for n in row)
+    if len(numbers) != 81 or any(n not in "0123456789" for n in numbers):
+        raise ValueError("a puzzle must have 81 cells containing a digit, 0 or '.' : " + repr(puzzle))
+    return numbers
+
+#Transform a string of 81 digits into a 9x9 board
+def board_from_string(numbers):
+    numbers = puzzle_string(numbers)
+    return [[int(numbers[i*9+j]) for j in range(9)] for i in range(9)]
+
+#Transform a 9x9 board into a string of 81 digits
+def board_to_string(board):
+    return puzzle_string(board)
@@ -0,0 +1,133 @@
+#Cache of the results of the solving entry points
+#The same puzzles come back very often (daily puzzles, popular packs...), and a dictionary lookup costs much less than a search
+#The entries are kept in least recently used order : when there are more than max_entries entries, or when their (estimated) size goes over
+#max_bytes, the entries that were used the longest time ago are dropped
+#There is one cache per process (RESULTS), used by the functions of solver.py and by human_solve.solve :
+#- solver.py stores, for each puzzle (as a string of 81 digits), its first solution with the backend that found it and the number of
+#  solutions when it is known (0, 1, or 2 for "at least 2")
+#- human_solve.solve stores, for each grid of candidates and mode, the grid it reached, its number of steps and its statistics
+#Hits, misses and evictions are counted so that the hit rate can be exported (see metrics)
+import sys
+from collections import OrderedDict, namedtuple
+
+#What is known about a puzzle : its first solution (string of 81 digits, None if not known yet or if there is none), the backend that found it,
+#and the number of solutions (None if not known, 2 means at least 2)
+PuzzleResult = namedtuple("PuzzleResult", ["solution", "backend", "count"])
+
+#Result of human_solve.solve : the candidates reached (bytes of the array of cells, None if the grid had no solution), the number of steps
+#and the statistics of the run (SolveStats.as_dict, or None)
+HumanResult = namedtuple("HumanResult", ["cells", "steps", "stats"])
+
+#Fixed cost of an entry : the slot in the dictionary and the linked list of the OrderedDict, and the tuple
+ENTRY_OVERHEAD = 200
+
+#Estimated size of a key or value in bytes (strings, bytes, numbers, tuples, lists and dicts of them)
+def _sizeof(value):
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(k) + _sizeof(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+class ResultCache:
+    __slots__ = ("max_entries", "max_bytes", "enabled", "hits", "misses", "evictions", "bytes", "_entries")
+
+    def __init__(self, max_entries=100000, max_bytes=64 << 20, enabled=True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        #key -> (value, estimated size)
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    #Return the value of the key (and mark it as recently used), or None
+    #If usable is given, an entry only counts as a hit if usable(value) is True (the entry doesn't know the answer otherwise)
+    def get(self, key, usable=None):
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None or (usable is not None and not usable(entry[0])):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    #Look at an entry without counting it and without changing the order
+    def peek(self, key):
+        entry = self._entries.get(key)
+        return None if entry is None else entry[0]
+
+    def put(self, key, value):
+        if not self.enabled:
+            return
+        size = ENTRY_OVERHEAD + _sizeof(key) + _sizeof(value)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        #An entry bigger than the whole cache is not kept
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self.bytes += size
+        self._shrink()
+
+    #Drop the least recently used entries until the cache is within its limits
+    def _shrink(self):
+        while self._entries and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+            _, (_, dropped) = self._entries.popitem(last=False)
+            self.bytes -= dropped
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    #Change the limits (dropping the entries over the new limits) or turn the cache on and off
+    def configure(self, max_entries=None, max_bytes=None, enabled=None):
+        if max_entries is not None:
+            self.max_entries = max_entries
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if enabled is not None:
+            self.enabled = enabled
+        self._shrink()
+
+    #Counters to export to a metrics system
+    def metrics(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_metrics(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+#The cache of the process
+RESULTS = ResultCache()
+
+#Add what was learned about a puzzle to its entry (the first solution found is kept)
+def record_puzzle(key, solution=None, backend=None, count=None):
+    old = RESULTS.peek(key)
+    if old is not None:
+        if old.solution is not None:
+            solution, backend = old.solution, old.backend
+        if count is None:
+            count = old.count
+    RESULTS.put(key, PuzzleResult(solution, backend, count))
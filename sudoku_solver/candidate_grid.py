@@ -0,0 +1,254 @@
+#Compact representation of a candidate grid for the human solving methods
+#Instead of a list of lists of lists, the grid is a flat array of 81 cells (cell index = row*9 + col)
+#Each cell holds a 9 bit mask : bit d-1 is set if the digit d is still a candidate for the cell
+#This way checking for a candidate is a bitwise and, removing candidates is a bitwise and with the complement, and comparing or
+#merging the candidates of several cells is a single integer operation instead of building lists or sets
+from array import array
+from functools import wraps
+from .topology import UNITS, CELL_UNITS, ALL_UNITS, UNIT_BITS
+
+#Mask with all 9 digits set
+ALL_DIGITS = 0x1FF
+
+#Lookup tables indexed by mask, computed once at import
+#BIT[d] is the mask of the digit d (BIT[0] is 0 so that an empty cell of the string format maps to no digit)
+BIT = tuple(0 if d == 0 else 1 << (d-1) for d in range(10))
+#POPCOUNT[mask] is the number of candidates in the mask
+POPCOUNT = tuple(bin(mask).count("1") for mask in range(512))
+#DIGITS[mask] is the sorted tuple of the digits in the mask
+DIGITS = tuple(tuple(d for d in range(1,10) if mask & BIT[d]) for mask in range(512))
+#VALUE[mask] is the digit of a mask with a single candidate, 0 otherwise
+VALUE = tuple(DIGITS[mask][0] if POPCOUNT[mask] == 1 else 0 for mask in range(512))
+
+#Transform a list of digits (the candidates of a cell in the list format) into a mask
+def mask_from_digits(digits):
+    mask = 0
+    for d in digits:
+        mask |= BIT[d]
+    return mask
+
+#Raised when the grid can't be completed : a cell has no candidate left or a digit has no place left in a unit
+class Contradiction(Exception):
+    pass
+
+class CandidateGrid:
+    #Besides the candidates, the grid keeps up to date everything the propagation engine (see propagation.py) needs, so that
+    #nothing has to be recounted by scanning the whole grid :
+    #- unsolved : number of cells that don't have exactly one candidate
+    #- remaining : number of candidates left to remove to solve the puzzle (same as candidates_left in human_solve)
+    #- counts : for each unit and digit (index unit*9 + digit-1), the number of cells of the unit where the digit is a candidate
+    #- singles : cells that were reduced to a single candidate (or to none) and whose peers haven't been cleaned yet
+    #- hidden : unit/digit indices whose count dropped to 1 (or 0) and haven't been looked at yet
+    #It also records which units and digits lost candidates (dirty_units is a 27 bit mask, dirty_digits a 9 bit mask), so that the
+    #scheduler in human_solve.solve can rerun a method only where something changed since its last run
+    #trace is the Trace recording the removals (see trace.py), None when nothing is recorded
+    #trail is the undo log of the snapshots (see snapshot), None when there is no snapshot
+    __slots__ = ("cells", "unsolved", "remaining", "counts", "singles", "hidden", "dirty_units", "dirty_digits", "trace", "trail")
+
+    def __init__(self, cells=None):
+        #By default every cell contains every digit
+        if cells is None:
+            self.cells = array("H", [ALL_DIGITS]) * 81
+        else:
+            self.cells = array("H", cells)
+        self.trace = None
+        self.trail = None
+        self.recount()
+
+    #Recompute the counters from the candidates
+    #Every solved cell and every unit/digit with a single position is queued so that a first propagation looks at them
+    def recount(self):
+        cells = self.cells
+        self.unsolved = 0
+        self.remaining = 0
+        self.singles = []
+        for i in range(81):
+            n = POPCOUNT[cells[i]]
+            self.remaining += n - 1
+            if n != 1:
+                self.unsolved += 1
+            if n <= 1:
+                self.singles.append(i)
+        self.counts = array("B", bytes(243))
+        self.hidden = []
+        for u in range(27):
+            for i in UNITS[u]:
+                for d in DIGITS[cells[i]]:
+                    self.counts[u*9 + d-1] += 1
+            for k in range(u*9, u*9+9):
+                if self.counts[k] <= 1:
+                    self.hidden.append(k)
+        self.dirty_units = ALL_UNITS
+        self.dirty_digits = ALL_DIGITS
+
+    #Replace the candidates (an array of 81 masks, or its bytes) and recount
+    def set_cells(self, cells):
+        if isinstance(cells, bytes):
+            self.cells = array("H")
+            self.cells.frombytes(cells)
+        else:
+            self.cells = array("H", cells)
+        #The snapshots can't undo this
+        self.trail = None
+        self.recount()
+
+    #Build a grid from a string of 81 digits with 0s for the empty cells (same format as grid_from_string in human_solve)
+    #Empty cells directly get all the candidates, like grid_from_string followed by fill_candidates
+    @classmethod
+    def from_string(cls, numbers):
+        return cls([BIT[int(n)] or ALL_DIGITS for n in numbers[:81]])
+
+    #Build a grid from the list of lists of lists format used by human_solve
+    #A cell containing only a 0 (before fill_candidates) gets all the candidates, an empty cell (a contradiction) stays without any
+    @classmethod
+    def from_list(cls, grid):
+        cells = []
+        for row in grid:
+            for cell in row:
+                cells.append(ALL_DIGITS if len(cell) == 1 and cell[0] == 0 else mask_from_digits(cell))
+        return cls(cells)
+
+    #Convert the grid back to the list of lists of lists format
+    def to_list(self):
+        cells = self.cells
+        return [[list(DIGITS[cells[i*9+j]]) for j in range(9)] for i in range(9)]
+
+    #Write the candidates back into an existing list grid, modifying it in place
+    def write_to(self, grid):
+        cells = self.cells
+        for i in range(9):
+            for j in range(9):
+                grid[i][j] = list(DIGITS[cells[i*9+j]])
+        return grid
+
+    #Convert the grid to a string of 81 digits with 0s for the unsolved cells
+    def to_string(self):
+        return "".join(str(VALUE[mask]) for mask in self.cells)
+
+    #Copy the grid with its counters and pending events, without recounting anything
+    def copy(self):
+        grid = CandidateGrid.__new__(CandidateGrid)
+        grid.cells = array("H", self.cells)
+        grid.unsolved = self.unsolved
+        grid.remaining = self.remaining
+        grid.counts = array("B", self.counts)
+        grid.singles = list(self.singles)
+        grid.hidden = list(self.hidden)
+        grid.dirty_units = self.dirty_units
+        grid.dirty_digits = self.dirty_digits
+        #The copy isn't recorded and has no snapshot
+        grid.trace = None
+        grid.trail = None
+        return grid
+
+    def __eq__(self, other):
+        return isinstance(other, CandidateGrid) and self.cells == other.cells
+
+    def __repr__(self):
+        return "CandidateGrid(" + repr(self.to_string()) + ")"
+
+    #Remove the digits of mask from the cell and return the number of candidates actually removed
+    #Every candidate removal goes through here so that the counters stay up to date and the propagation engine is told about
+    #cells reduced to a single candidate and digits left with a single position in a unit
+    def eliminate(self, index, mask):
+        cells = self.cells
+        old = cells[index]
+        common = old & mask
+        if not common:
+            return 0
+        new = old ^ common
+        cells[index] = new
+        if self.trail is not None:
+            self.trail.append(index)
+            self.trail.append(old)
+        if self.trace is not None:
+            self.trace.record(index, common, new)
+        removed = POPCOUNT[common]
+        self.remaining -= removed
+        self.dirty_units |= UNIT_BITS[index]
+        self.dirty_digits |= common
+        left = POPCOUNT[new]
+        if left <= 1:
+            if left == 1:
+                self.unsolved -= 1
+            elif POPCOUNT[old] == 1:
+                self.unsolved += 1
+            self.singles.append(index)
+        counts = self.counts
+        for u in CELL_UNITS[index]:
+            for d in DIGITS[common]:
+                k = u*9 + d-1
+                counts[k] -= 1
+                if counts[k] <= 1:
+                    self.hidden.append(k)
+        return removed
+
+    #Only keep the digits of mask in the cell and return the number of candidates removed
+    def assign(self, index, mask):
+        return self.eliminate(index, self.cells[index] & ~mask)
+
+    #Snapshots, to try a deduction and go back (see forcing in human_solve) without copying the grid :
+    #while there is a snapshot, eliminate logs the cell and its old candidates in the trail (2 integers per removal), and rollback undoes
+    #the log back to the snapshot, restoring the counters cell by cell. The snapshot itself is the length of the trail and a copy of the
+    #queues of the propagation engine, which are empty at a fixed point
+    #Snapshots can be nested (and are then rolled back or released in the reverse order), the trail is dropped with the outermost one
+    def snapshot(self):
+        outermost = self.trail is None
+        if outermost:
+            self.trail = array("H")
+        return (len(self.trail), outermost, list(self.singles), list(self.hidden), self.dirty_units, self.dirty_digits)
+
+    #Go back to the grid of the snapshot
+    def rollback(self, snapshot):
+        mark, outermost, singles, hidden, dirty_units, dirty_digits = snapshot
+        trail = self.trail
+        cells = self.cells
+        counts = self.counts
+        for k in range(len(trail) - 2, mark - 2, -2):
+            index = trail[k]
+            old = trail[k + 1]
+            new = cells[index]
+            cells[index] = old
+            restored = old & ~new
+            self.remaining += POPCOUNT[restored]
+            if POPCOUNT[new] == 1:
+                self.unsolved += 1
+            if POPCOUNT[old] == 1:
+                self.unsolved -= 1
+            for u in CELL_UNITS[index]:
+                for d in DIGITS[restored]:
+                    counts[u*9 + d-1] += 1
+        del trail[mark:]
+        self.singles = singles
+        self.hidden = hidden
+        self.dirty_units = dirty_units
+        self.dirty_digits = dirty_digits
+        if outermost:
+            self.trail = None
+
+    #The candidates removed since the snapshot, as {cell: mask of the removed digits}
+    def changes(self, snapshot):
+        trail = self.trail
+        cells = self.cells
+        removed = {}
+        for k in range(snapshot[0], len(trail), 2):
+            index = trail[k]
+            removed[index] = removed.get(index, 0) | (trail[k + 1] & ~cells[index])
+        return removed
+
+    #Keep the changes made since the snapshot
+    def release(self, snapshot):
+        if snapshot[1]:
+            self.trail = None
+
+#The solving methods are written for CandidateGrid, but they have always accepted the list of lists of lists format
+#This decorator converts a list grid to a CandidateGrid, runs the method and writes the result back into the list grid,
+#so that callers (and the tests) using the list format keep working unchanged
+def accepts_lists(method):
+    @wraps(method)
+    def wrapper(grid, *args, **kwargs):
+        if isinstance(grid, CandidateGrid):
+            return method(grid, *args, **kwargs)
+        candidates, removed = method(CandidateGrid.from_list(grid), *args, **kwargs)
+        return (candidates.write_to(grid), removed)
+    return wrapper
@@ -0,0 +1,85 @@
+#Zero-copy access to large puzzle files
+#Parsing a puzzle file line by line (with int() on every character, like grid_from_string) costs more than solving easy puzzles,
+#and holding millions of puzzles as Python strings costs gigabytes
+#Instead, the file is memory-mapped and seen as a NumPy uint8 array of shape (N, 81) : nothing is read or copied until the puzzles are used,
+#and only the pages that are actually used are loaded by the system
+#The file must have fixed-width records : 81 characters per puzzle (digits, with 0 or . for the empty cells), followed by "\n" or "\r\n"
+#(or no separator at all), the last newline being optional
+#A corpus can be cut into shards, each shard only maps its own part of the file so that worker processes can each open their own
+import os
+import numpy as np
+
+ZERO = ord("0")
+DOT = ord(".")
+
+#Find the size of a record (81 characters and the line separator) from the start of the file
+def _record_size(path):
+    with open(path, "rb") as f:
+        start = f.read(83)
+    if len(start) < 81:
+        raise ValueError(path + " doesn't contain a puzzle of 81 characters")
+    if start[81:83] == b"\r\n":
+        return 83
+    if start[81:82] == b"\n":
+        return 82
+    return 81
+
+class PuzzleCorpus:
+    __slots__ = ("path", "record_size", "start", "stop", "records", "_map")
+
+    #Map the records start to stop (all of them by default) of the file
+    def __init__(self, path, start=0, stop=None):
+        self.path = path
+        self.record_size = record_size = _record_size(path)
+        size = os.path.getsize(path)
+        #The last record may not have its line separator
+        total = (size + record_size - 81) // record_size
+        if size != total * record_size and size != total * record_size - (record_size - 81):
+            raise ValueError(path + " doesn't have fixed-width records of 81 characters")
+        start, stop, _ = slice(start, stop).indices(total)
+        stop = max(start, stop)
+        self.start = start
+        self.stop = stop
+        if stop == start:
+            self._map = None
+            self.records = np.zeros((0, 81), dtype=np.uint8)
+            return
+        #Only map the bytes of our records, the last one without its separator
+        length = (stop - start) * record_size - (record_size - 81)
+        self._map = np.memmap(path, dtype=np.uint8, mode="r", offset=start * record_size, shape=(length,))
+        #View of the characters of each puzzle, skipping the separators : no copy is made
+        self.records = np.lib.stride_tricks.as_strided(self._map, shape=(stop - start, 81), strides=(record_size, 1), writeable=False)
+
+    def __len__(self):
+        return self.stop - self.start
+
+    #Digits of some puzzles (0 for the empty cells) as a uint8 array of shape (n, 81)
+    #Only the requested puzzles are decoded, so a worker can go through its part of the corpus piece by piece
+    def __getitem__(self, index):
+        chars = self.records[index]
+        digits = chars - ZERO
+        digits[chars == DOT] = 0
+        return digits
+
+    #Puzzles as strings of 81 digits with 0s for the empty cells (the format of grid_from_string)
+    def strings(self, start=0, stop=None):
+        chars = self.records[start:stop].tobytes().decode("ascii").replace(".", "0")
+        return [chars[i:i+81] for i in range(0, len(chars), 81)]
+
+    #Cut the corpus in count shards of (almost) the same size and return the shard number k
+    #The shard maps its own part of the file, and can be sent to another process cheaply (only the path and the bounds are sent)
+    def shard(self, k, count):
+        size = len(self)
+        return PuzzleCorpus(self.path, self.start + size * k // count, self.start + size * (k+1) // count)
+
+    def shards(self, count):
+        return [self.shard(k, count) for k in range(count)]
+
+    def __reduce__(self):
+        return (PuzzleCorpus, (self.path, self.start, self.stop))
+
+    def __repr__(self):
+        return "PuzzleCorpus(" + repr(self.path) + ", " + str(self.start) + ", " + str(self.stop) + ")"
+
+def load(path):
+    return PuzzleCorpus(path)
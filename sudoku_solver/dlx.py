@@ -0,0 +1,177 @@
+#Second search backend : Algorithm X with Dancing Links (DLX)
+#A sudoku is an exact cover problem : we have to choose 81 (cell, digit) rows among 729 so that each of the 324 constraints is covered exactly once
+#The constraints (columns) are :
+#- 0 to 80 : each cell contains a digit
+#- 81 to 161 : each row contains each digit
+#- 162 to 242 : each column contains each digit
+#- 243 to 323 : each box contains each digit
+#Algorithm X always branches on the column with the fewest remaining rows, which holds up much better than cell by cell backtracking
+#on puzzles with very few clues
+#The links are stored in flat lists indexed by node number instead of one Python object per node :
+#node 0 is the root, nodes 1 to 324 are the column headers, and each of the 729 rows is made of 4 consecutive nodes
+from .boards import puzzle_string
+from .topology import ROW_OF, COL_OF, BOX_OF
+
+COLUMNS = 324
+
+#Columns covered by the row "digit d (0 to 8) in cell c"
+def _row_columns(c, d):
+    return (c, 81 + ROW_OF[c]*9 + d, 162 + COL_OF[c]*9 + d, 243 + BOX_OF[c]*9 + d)
+
+#The empty links are the same for every puzzle, so they are built once (on first use) and copied for each search
+_template = None
+
+def _build_template():
+    global _template
+    nodes = 1 + COLUMNS + 729*4
+    left = list(range(-1, nodes-1))
+    right = list(range(1, nodes+1))
+    up = list(range(nodes))
+    down = list(range(nodes))
+    column = list(range(nodes))
+    row = [-1] * nodes
+    size = [0] * (COLUMNS + 1)
+    #Circular list of the column headers around the root
+    left[0] = COLUMNS
+    right[COLUMNS] = 0
+    node = COLUMNS + 1
+    for c in range(81):
+        for d in range(9):
+            first = node
+            for col in _row_columns(c, d):
+                header = col + 1
+                #Circular list of the nodes of the row
+                left[node] = node - 1 if node != first else first + 3
+                right[node] = node + 1 if node != first + 3 else first
+                #Insert the node at the bottom of its column
+                up[node] = up[header]
+                down[node] = header
+                down[up[header]] = node
+                up[header] = node
+                column[node] = header
+                row[node] = c*9 + d
+                size[header] += 1
+                node += 1
+    _template = (left, right, up, down, column, row, size)
+    return _template
+
+class DancingLinks:
+    __slots__ = ("left", "right", "up", "down", "column", "row", "size", "solution")
+
+    def __init__(self):
+        template = _template or _build_template()
+        self.left, self.right, self.up, self.down = [links[:] for links in template[:4]]
+        #The column and row of each node never change, they can be shared
+        self.column = template[4]
+        self.row = template[5]
+        self.size = template[6][:]
+        self.solution = []
+
+    #Remove a column and all the rows that cover it
+    def cover(self, header):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    #Put back a column and its rows, in the exact reverse order of cover
+    def uncover(self, header):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    #Choose the row "digit d in cell c" before searching (for the givens)
+    #Return False if one of its columns is already covered, which means the givens contradict each other
+    def select(self, c, d):
+        first = COLUMNS + 1 + (c*9 + d)*4
+        for node in range(first, first + 4):
+            header = self.column[node]
+            #A covered column has been removed from the list of headers
+            if self.right[self.left[header]] != header:
+                return False
+            self.cover(header)
+        self.solution.append(c*9 + d)
+        return True
+
+    #Generate the exact covers one at a time, as lists of row numbers (c*9 + d)
+    def search(self):
+        right, down, column, size = self.right, self.down, self.column, self.size
+        if right[0] == 0:
+            yield list(self.solution)
+            return
+        #Choose the column with the fewest rows
+        header = right[0]
+        best = header
+        while header:
+            if size[header] < size[best]:
+                best = header
+                if size[best] <= 1:
+                    break
+            header = right[header]
+        if size[best] == 0:
+            return
+        self.cover(best)
+        i = down[best]
+        while i != best:
+            self.solution.append(self.row[i])
+            j = right[i]
+            while j != i:
+                self.cover(column[j])
+                j = right[j]
+            yield from self.search()
+            j = self.left[i]
+            while j != i:
+                self.uncover(column[j])
+                j = self.left[j]
+            self.solution.pop()
+            i = down[i]
+        self.uncover(best)
+
+#Generate the solutions of a puzzle one at a time
+#The puzzle can be a 9x9 board or a string of 81 characters, and the solutions are given in the same format
+def solutions(puzzle):
+    numbers = puzzle_string(puzzle)
+    links = DancingLinks()
+    for c in range(81):
+        if numbers[c] != "0" and not links.select(c, int(numbers[c]) - 1):
+            return
+    for rows in links.search():
+        digits = ["0"] * 81
+        for r in rows:
+            digits[r//9] = str(r%9 + 1)
+        if isinstance(puzzle, str):
+            yield "".join(digits)
+        else:
+            yield [[int(digits[i*9+j]) for j in range(9)] for i in range(9)]
+
+#Return the first solution of the puzzle (in the same format), or None if it has no solution
+def solve(puzzle):
+    for solution in solutions(puzzle):
+        return solution
+    return None
+
+#Count the solutions of the puzzle, stopping as soon as limit solutions have been found (if a limit is given)
+def count(puzzle, limit=None):
+    found = 0
+    for _ in solutions(puzzle):
+        found += 1
+        if found == limit:
+            break
+    return found
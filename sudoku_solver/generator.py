@@ -0,0 +1,208 @@
+#Generator of puzzles with a unique solution, graded by the human methods
+#A puzzle is made from a random solved grid by removing clues in random order, a group of symmetric cells at a time, and putting them back
+#when the puzzle gets a second solution : the solutions are counted with an early exit at the second one, so each check is a single search
+#The puzzle (minimal for its symmetry : no group can be removed) is then graded (see rating.py), and kept if it has the chosen level
+#The work is shared between processes, each one making a chunk of attempts with its own random generator
+#
+#Usage : python -m sudoku_solver generate -n 1000 --level hidden_subsets --symmetry rotational -o puzzles.txt --workers 8
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .boards import board_to_string
+from .rating import LEVELS, grade, level_index
+from . import solver
+
+#A generated puzzle : the puzzle and its solution (strings of 81 digits), its level (name in LEVELS) and its number of clues
+GeneratedPuzzle = namedtuple("GeneratedPuzzle", ["puzzle", "solution", "level", "clues"])
+
+#Summary of a generation : puzzles kept, puzzles made (including those of the wrong level) and duration
+GenerationReport = namedtuple("GenerationReport", ["puzzles", "attempts", "seconds"])
+
+#Default limit of the command line on the puzzles made for each puzzle asked for : the hardest levels can take hundreds of them each
+ATTEMPTS_PER_PUZZLE = 1000
+
+#Symmetries of the clues : the cells a cell goes to
+SYMMETRIES = {
+    "none": lambda i, j: [],
+    #Half turn around the center
+    "rotational": lambda i, j: [(8 - i, 8 - j)],
+    #Quarter turns around the center
+    "quarter": lambda i, j: [(j, 8 - i), (8 - i, 8 - j), (8 - j, i)],
+    #Left-right mirror
+    "mirror": lambda i, j: [(i, 8 - j)],
+    #Main diagonal
+    "diagonal": lambda i, j: [(j, i)],
+}
+
+#The groups of cells that are removed together for a symmetry
+def _orbits(symmetry):
+    if symmetry not in SYMMETRIES:
+        raise ValueError("unknown symmetry : " + str(symmetry) + " (choose from " + ", ".join(SYMMETRIES) + ")")
+    seen = set()
+    orbits = []
+    for c in range(81):
+        if c in seen:
+            continue
+        i, j = divmod(c, 9)
+        orbit = sorted({c} | {k * 9 + l for k, l in SYMMETRIES[symmetry](i, j)})
+        seen.update(orbit)
+        orbits.append(orbit)
+    return orbits
+
+#A random solved grid (string of 81 digits) : the three boxes of the diagonal don't share any unit, so they can be filled at random,
+#then the search completes the grid and the digits are shuffled (the search always tries the smallest digit first)
+def random_grid(rng, backend="mrv"):
+    board = [[0] * 9 for _ in range(9)]
+    for b in range(3):
+        digits = rng.sample(range(1, 10), 9)
+        for k in range(9):
+            board[b*3 + k//3][b*3 + k%3] = digits[k]
+    solution = next(solver.BACKENDS[backend](board))
+    names = [0] + rng.sample(range(1, 10), 9)
+    return "".join(str(names[n]) for row in solution for n in row)
+
+#Does the board have a single solution ? The search stops at the second solution
+#The backend is called directly : the cache of solver.py would fill up with boards that are never seen again
+#(setting up the propagation engine costs more than the whole search on these boards, which have many clues)
+def _unique(board, backend):
+    found = solver.BACKENDS[backend](board)
+    return next(found, None) is not None and next(found, None) is None
+
+#Remove the clues of a solved grid as long as the solution stays unique, return the puzzle (string of 81 digits)
+def dig(solution, rng, symmetry="rotational", backend="mrv"):
+    board = [[int(solution[i*9+j]) for j in range(9)] for i in range(9)]
+    orbits = _orbits(symmetry)
+    rng.shuffle(orbits)
+    for orbit in orbits:
+        for c in orbit:
+            board[c // 9][c % 9] = 0
+        if not _unique(board, backend):
+            for c in orbit:
+                board[c // 9][c % 9] = int(solution[c])
+    return board_to_string(board)
+
+#Make one puzzle, whatever its level
+def make_puzzle(rng, symmetry="rotational", backend="mrv"):
+    solution = random_grid(rng, backend)
+    puzzle = dig(solution, rng, symmetry, backend)
+    return GeneratedPuzzle(puzzle, solution, LEVELS[grade(puzzle)], 81 - puzzle.count("0"))
+
+#Work done by a worker process : make attempts puzzles with its own random generator, and return the ones that have one of the levels
+#(every level if levels is None)
+def _generate_chunk(seed, attempts, levels, symmetry, backend):
+    rng = random.Random(seed)
+    found = []
+    for _ in range(attempts):
+        puzzle = make_puzzle(rng, symmetry, backend)
+        if levels is None or puzzle.level in levels:
+            found.append(puzzle)
+    return found
+
+#Generate n puzzles (GeneratedPuzzle) with one of the chosen levels (names or indexes in LEVELS, None for any level)
+#- symmetry : one of SYMMETRIES, for the pattern of the clues
+#- workers : number of processes (the number of cores by default)
+#- chunksize : attempts (puzzles made, whatever their level) given to a process at once, at most n
+#- seed : for the same seed, chunksize and arguments the same puzzles are made (whatever the number of workers)
+#- max_attempts : give up after this many puzzles made (the hardest levels are rare, see the report), None to go on until n are found
+#The work is handed out as attempts and not as a number of puzzles to find : all the processes look for the rare levels until n are found,
+#and the puzzles come chunk after chunk, so the first ones come before the end
+#The arguments are checked at the call, the puzzles are only made when they are asked for
+def generate(n, levels=None, symmetry="rotational", workers=None, seed=None, chunksize=8, backend="mrv", max_attempts=None, report=None):
+    if levels is not None:
+        levels = frozenset(LEVELS[level_index(level)] for level in levels)
+    _orbits(symmetry)
+    solver.get_backend(backend)
+    workers = workers or os.cpu_count() or 1
+    return _generate(n, levels, symmetry, workers, seed, max(1, min(chunksize, n)), backend, max_attempts, report)
+
+#The chunks of attempts : (seed, number of attempts), until max_attempts are given out
+def _attempt_chunks(seed, chunksize, max_attempts):
+    seeds = random.Random(seed)
+    given = 0
+    while max_attempts is None or given < max_attempts:
+        attempts = chunksize if max_attempts is None else min(chunksize, max_attempts - given)
+        given += attempts
+        yield (seeds.getrandbits(64), attempts)
+
+def _generate(n, levels, symmetry, workers, seed, chunksize, backend, max_attempts, report):
+    chunks = _attempt_chunks(seed, chunksize, max_attempts)
+    args = (levels, symmetry, backend)
+    start_time = time.perf_counter()
+    made = 0
+    attempts = 0
+    pool = None
+    if workers == 1:
+        results = ((_generate_chunk(chunk_seed, count, *args), count) for chunk_seed, count in chunks)
+    else:
+        pool = ProcessPoolExecutor(workers)
+        results = _pooled(pool, chunks, args, workers)
+    try:
+        #The chunks are taken in order, so the puzzles don't depend on which process finishes first
+        for found, tried in results if n > 0 else ():
+            attempts += tried
+            found = found[:n - made]
+            made += len(found)
+            yield from found
+            if made == n:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if report is not None:
+            report.append(GenerationReport(made, attempts, time.perf_counter() - start_time))
+
+#Results of the chunks made by the pool, in order, with a couple of chunks per process in flight
+def _pooled(pool, chunks, args, workers):
+    pending = deque()
+    for chunk_seed, count in chunks:
+        pending.append((pool.submit(_generate_chunk, chunk_seed, count, *args), count))
+        if len(pending) >= workers * 2:
+            future, count = pending.popleft()
+            yield (future.result(), count)
+    while pending:
+        future, count = pending.popleft()
+        yield (future.result(), count)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate sudoku puzzles with a unique solution, graded by the human methods")
+    parser.add_argument("-n", "--count", type=int, default=10, help="number of puzzles (default: 10)")
+    parser.add_argument("-l", "--level", action="append", choices=LEVELS, help="level of the puzzles, can be given several times (default: any)")
+    parser.add_argument("-s", "--symmetry", default="rotational", choices=sorted(SYMMETRIES), help="symmetry of the clues (default: rotational)")
+    parser.add_argument("-o", "--output", default="-", help="puzzle file, or - for the standard output (default)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="number of processes (default: number of cores)")
+    parser.add_argument("-c", "--chunksize", type=int, default=8, help="puzzles made by a process at once (default: 8)")
+    parser.add_argument("-m", "--max-attempts", type=int, default=None,
+                        help="give up after this many puzzles made, whatever their level (default: " + str(ATTEMPTS_PER_PUZZLE) + " per puzzle asked for)")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random generator, to make the same puzzles again")
+    parser.add_argument("-b", "--backend", default="mrv", choices=sorted(solver.BACKENDS), help="search backend for the uniqueness checks (default: mrv)")
+    parser.add_argument("--solutions", action="store_true", help="also write the solution, the level and the number of clues of every puzzle")
+    args = parser.parse_args(argv)
+    max_attempts = ATTEMPTS_PER_PUZZLE * args.count if args.max_attempts is None else args.max_attempts
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    report = []
+    try:
+        for puzzle in generate(args.count, args.level, args.symmetry, args.workers, args.seed, args.chunksize, args.backend,
+                               max_attempts, report):
+            if args.solutions:
+                output.write(" ".join([puzzle.puzzle, puzzle.solution, puzzle.level, str(puzzle.clues)]) + "\n")
+            else:
+                output.write(puzzle.puzzle + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    puzzles, attempts, seconds = report[0]
+    rate = puzzles / seconds if seconds else 0
+    print(str(puzzles) + " puzzles (" + str(attempts) + " made) in " + format(seconds, ".2f") + "s : " + format(rate, ".1f") + " puzzles/sec",
+          file=sys.stderr)
+    if puzzles < args.count:
+        sys.exit("error : gave up after " + str(attempts) + " puzzles made, " + str(args.count - puzzles)
+                 + " puzzles of the level are missing (see --max-attempts)")
+
+if __name__ == "__main__":
+    main()
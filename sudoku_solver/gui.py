@@ -0,0 +1,173 @@
+#Graphical interface : python -m sudoku_solver gui [puzzle] [--backend mrv]
+#The solve runs in a SolveWorker (see worker.py), never in the Tk thread : the window polls the queue of the worker with after(), applies
+#the removals to its own copy of the candidates and redraws only the cells that changed, once per frame, so it stays responsive
+#and the solve can be cancelled at any time
+import argparse
+import tkinter as tk
+from array import array
+
+from .boards import board_to_string, puzzle_string
+from .candidate_grid import CandidateGrid, BIT, DIGITS, POPCOUNT, VALUE
+from .worker import SolveWorker
+from . import solver
+
+#Time between two polls of the worker (in ms) : about one frame at 60 Hz
+FRAME = 16
+#Messages handled per poll at most, the rest waits for the next frame so a fast solve can't freeze the window
+MAX_MESSAGES = 64
+
+GIVEN_COLOR = 'black'
+FOUND_COLOR = 'blue'
+CANDIDATE_COLOR = 'gray'
+
+class GUI:
+    def __init__(self, puzzle=None, backend='mrv'):
+        self.root = tk.Tk()
+        self.root.title('Sudoku Solver')
+        self.root.geometry('600x600')
+        self.backend = backend
+
+        # Put a simple label for now
+        self.label = tk.Label(self.root, text='Sudoku Solver', font=('Calibri', 16))
+        self.label.pack()
+
+        # Create the puzzle
+        self.board = tk.Frame(self.root, bg='white')
+        self.board.pack()
+
+        # Create the 3*3 boxes
+        self.boxes = []
+        for r in range(3):
+            row = []
+            for col in range(3):
+                box = tk.Frame(self.board, highlightbackground='light blue', highlightthickness=2, width=150, height=150)
+                box.grid(row=r, column=col)
+                row.append(box)
+            self.boxes.append(row)
+
+        # Create the cells
+        self.cells = []
+        self.labels = []
+        for r in range(9):
+            row = []
+            for col in range(9):
+                cellFrame = tk.Frame(self.boxes[r//3][col//3], height=50, width=50, bg='white', highlightbackground='black', highlightthickness=1)
+                cellFrame.grid(row=r%3, column=col%3, sticky='nsew')
+                cellFrame.rowconfigure(0, minsize=50, weight=1)
+                cellFrame.columnconfigure(0, minsize=50, weight=1)
+                cell = tk.Label(cellFrame, bg='white')
+                cell.grid(row=0, column=0, sticky='nsew')
+                self.labels.append(cell)
+                row.append(cellFrame)
+            self.cells.append(row)
+
+        # Buttons and state of the solve
+        self.controls = tk.Frame(self.root)
+        self.controls.pack(pady=10)
+        self.solve_button = tk.Button(self.controls, text='Solve', command=self.solve, state='disabled')
+        self.solve_button.pack(side='left', padx=5)
+        self.cancel_button = tk.Button(self.controls, text='Cancel', command=self.cancel, state='disabled')
+        self.cancel_button.pack(side='left', padx=5)
+        self.status = tk.Label(self.root, text='no puzzle : give one on the command line')
+        self.status.pack()
+
+        #Candidates shown in the window (masks like CandidateGrid.cells), the givens and the cells to redraw at the next frame
+        self.grid = array('H', [0x1FF] * 81)
+        self.givens = set()
+        self.dirty = set()
+        self.worker = None
+        self.puzzle = None
+        if puzzle is not None:
+            self.load(puzzle)
+
+    #Show a new puzzle (board or string of 81 characters)
+    def load(self, puzzle):
+        self.cancel()
+        self.worker = None
+        self.puzzle = puzzle_string(puzzle)
+        self.grid = array('H', CandidateGrid.from_string(self.puzzle).cells)
+        self.givens = {c for c in range(81) if self.puzzle[c] != '0'}
+        self.dirty = set(range(81))
+        self.draw()
+        self.status.config(text='')
+        self.solve_button.config(state='normal')
+        self.cancel_button.config(state='disabled')
+
+    def solve(self):
+        if self.puzzle is None or (self.worker is not None and self.worker.running()):
+            return
+        self.load(self.puzzle)
+        self.worker = SolveWorker(self.puzzle, self.backend).start()
+        self.solve_button.config(state='disabled')
+        self.cancel_button.config(state='normal')
+        self.root.after(FRAME, self.poll, self.worker)
+
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.stop()
+
+    #Handle the messages of the worker that came since the last frame, then redraw the cells that changed
+    #A worker replaced by another one (a new puzzle was loaded) isn't polled anymore
+    def poll(self, worker):
+        if worker is not self.worker:
+            return
+        finished = False
+        for message in worker.drain(MAX_MESSAGES):
+            kind = message[0]
+            if kind == 'events':
+                grid = self.grid
+                for cell, removed, left in message[1]:
+                    grid[cell] = left
+                    self.dirty.add(cell)
+            elif kind == 'solution':
+                for c, digit in enumerate(message[1]):
+                    mask = BIT[int(digit)]
+                    if self.grid[c] != mask:
+                        self.grid[c] = mask
+                        self.dirty.add(c)
+            elif kind == 'status':
+                self.status.config(text=message[1] + '...')
+            else:
+                finished = True
+                if kind == 'done':
+                    self.status.config(text='solved' if message[1] else 'the human methods are stuck')
+                elif kind == 'cancelled':
+                    self.status.config(text='cancelled')
+                else:
+                    self.status.config(text='error : ' + message[1])
+        self.draw()
+        if finished:
+            self.solve_button.config(state='normal')
+            self.cancel_button.config(state='disabled')
+        else:
+            self.root.after(FRAME, self.poll, worker)
+
+    #Redraw the dirty cells : the digit once it is found, otherwise the candidates left
+    def draw(self):
+        for c in self.dirty:
+            mask = self.grid[c]
+            label = self.labels[c]
+            if POPCOUNT[mask] == 1:
+                color = GIVEN_COLOR if c in self.givens else FOUND_COLOR
+                label.config(text=str(VALUE[mask]), fg=color, font=('Calibri', 20))
+            else:
+                digits = DIGITS[mask]
+                text = '\n'.join(''.join(str(d) if d in digits else ' ' for d in range(k, k + 3)) for k in (1, 4, 7))
+                label.config(text=text, fg=CANDIDATE_COLOR, font=('Courier', 7))
+        self.dirty.clear()
+
+    def mainloop(self):
+        self.root.mainloop()
+        self.cancel()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a sudoku in a window")
+    parser.add_argument("puzzle", nargs="?", default=board_to_string(solver.extreme),
+                        help="puzzle : 81 digits or dots, 0 or . for an empty cell (default: the extreme board of solver.py)")
+    parser.add_argument("-b", "--backend", default="mrv", choices=sorted(solver.BACKENDS), help="search backend when the human methods are stuck (default: mrv)")
+    args = parser.parse_args(argv)
+    gui = GUI(args.puzzle, args.backend)
+    gui.mainloop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,630 @@
+#The idea is to implement several solving methods for a sudoku puzzle that can be performed by a human
+#The methods are:
+#0. Simple elimination
+#1. Naked candidates
+#2. Hidden candidates
+#3. Pointing pairs
+#4. Box/line reduction
+#5. X-wing (and the bigger fish)
+#6. Forcing (nishio and forcing chains from the cells with two candidates)
+#The methods will be applied in order until either no new digits can be found (in which case these techniques are not enough) or
+#the puzzle is completed
+
+easy = "860004000000900800304000067620045791539081406007029000003006000050400089000507602"
+puzzle = "100685070060010000590004060007060000010000007600090254000073091000050006800000300"
+
+#Here is how the puzzle will be represented and solved :
+#Each cell will be represented by a list of possible digits => in the begining given digits are alone, and empty cells contain all the digits
+#Each iteration will aim to reduce the number of digits in the cells, until only one digit is left in each cell
+#The grid is a list of lists of lists, with the first list representing the rows, the second the columns and the third the possible digits
+#The solving methods work on a more compact version of this grid (see candidate_grid.py) where each cell is a mask of its candidates
+#They still accept the list format : the grid is converted, solved and written back into the lists
+#The rows, columns, boxes and peers of each cell are precomputed in topology.py
+import argparse
+import time
+
+from .boards import puzzle_string
+from .cache import RESULTS, HumanResult
+from .candidate_grid import CandidateGrid, Contradiction, accepts_lists, ALL_DIGITS, BIT, POPCOUNT, DIGITS
+from .propagation import propagate
+from .stats import SolveStats
+from .trace import Trace
+from .topology import ROWS, COLS, UNITS, CELL_UNITS, PEERS, ALL_UNITS, SEGMENTS
+
+#===============================================================================================================================================
+
+#We will first need to define some helper functions to make our life easier
+#Transform the puzzle from a list of numbers, with 0s to represent empty cells, to a "grid" 
+def grid_from_string(numbers):
+    grid = []
+    for i in range(9):
+        row = []
+        for j in range(9):
+            row.append([int(numbers[i*9+j])])
+        grid.append(row)
+    return grid
+
+#Add possible candidates to a cell instead of zeros
+def fill_candidates(grid):
+    for i in range(9):
+        for j in range(9):
+            if grid[i][j][0] == 0:
+                grid[i][j] = [i for i in range(1,10)]
+    return grid
+
+#Print the grid in a nice way
+def print_grid(grid):
+    if isinstance(grid, CandidateGrid):
+        grid = grid.to_list()
+    for i in range(len(grid)):
+        if i % 3 == 0 and i != 0:
+            print("---------------------")
+        for j in range(len(grid[0])):
+            if j % 3 == 0 and j != 0:
+                print("| ", end = "")
+            if len(grid[i][j]) == 1:
+                print(str(grid[i][j][0]) + " ", end = "")
+            else:
+                print(". ", end = "")
+        print()
+
+#Number of cells already solved
+def cells_solved(grid):
+    if isinstance(grid, CandidateGrid):
+        return 81 - grid.unsolved
+    solved = 0
+    for i in range(len(grid)):
+        for j in range(len(grid[0])):
+            if len(grid[i][j]) == 1:
+                solved += 1
+    return solved
+
+#Number of cells left to solve
+def cells_left(grid):
+    return 81 - cells_solved(grid)
+
+#Number of candidates to remove to solve the puzzle
+def candidates_left(grid):
+    if isinstance(grid, CandidateGrid):
+        return grid.remaining
+    candidates = 0
+    for i in range(len(grid)):
+        for j in range(len(grid[0])):
+            #In each cell there are x digits and 1 is correct so we have to eliminate x-1 candidates
+            candidates += len(grid[i][j]) - 1 
+    return candidates
+
+#===============================================================================================================================================
+
+#Then we can define the different solving methods
+#To be able to track the number of candidates removed by each method, we will return a tuple with the grid and the number of candidates removed
+#This will also be helpful to know when to stop trying to solve the puzzle
+
+#===============================================================================================================================================
+
+#0. Simple elimination
+#The idea of this method is to look at each row, column and box and eliminate the digits that are already present
+@accepts_lists
+def simple_elimination(grid):
+    removed = 0
+    cells = grid.cells
+    for i in range(81):
+        #If the cell is solved, then we remove the number it contains from the corresponding row, column and box (its peers)
+        mask = cells[i]
+        if POPCOUNT[mask] == 1:
+            for k in PEERS[i]:
+                removed += grid.eliminate(k, mask)
+    return (grid,removed)
+
+#===============================================================================================================================================
+
+#1. Naked candidates
+#The idea is to look at remaining possible candidates in the cells : if there are n cells that contain the same n candidates, then we can remove them from other cells
+#There can be naked singles, pairs, triples and quads
+
+#1.1. Naked singles
+#Naked singles are cells that contain only one candidate => same as simple elimination
+
+#1.2. Naked subsets (pairs, triples and quads)
+#n cells of a unit whose candidates, all together, are only n digits : these digits have to go in these cells, so they can be removed from the
+#other cells of the unit
+#The cells are chosen one at a time and the union of their masks is kept : as soon as the union has more than size digits, adding more
+#cells can't make it smaller, so we stop there
+#Look for the subsets starting at the cell number start of the unit, with the cells chosen so far (as a bit mask of their positions in the
+#unit), the union of their candidates and their number
+def _naked_subsets(grid, unit, size, start=0, chosen=0, union=0, count=0):
+    removed = 0
+    cells = grid.cells
+    for i in range(start, 9):
+        mask = cells[unit[i]]
+        if POPCOUNT[mask] < 2:
+            continue
+        subset = union | mask
+        if POPCOUNT[subset] > size:
+            continue
+        if count and POPCOUNT[subset] == count + 1:
+            #Found : remove the digits from the other cells of the unit
+            members = chosen | (1 << i)
+            for l in range(9):
+                if not members & (1 << l):
+                    removed += grid.eliminate(unit[l], subset)
+        elif count + 1 < size:
+            removed += _naked_subsets(grid, unit, size, i + 1, chosen | (1 << i), subset, count + 1)
+    return removed
+
+#Like the other methods below, it can be restricted to some units (27 bit mask, see topology.py) and some digits (9 bit mask)
+#so that the scheduler in solve only reruns it where candidates changed
+#A naked subset can appear when any digit is removed from one of its cells, so the digits don't restrict the search
+@accepts_lists
+def naked_subsets(grid, units=ALL_UNITS, digits=ALL_DIGITS, size=4):
+    removed = 0
+    cells = grid.cells
+    for u in range(27):
+        if units & (1 << u):
+            unit = UNITS[u]
+            #Removing digits can make new subsets appear in the same unit, so we look again until nothing changes
+            while True:
+                #A subset must leave at least one unsolved cell of the unit to remove digits from
+                free = 0
+                for c in unit:
+                    if POPCOUNT[cells[c]] > 1:
+                        free += 1
+                if free < 3:
+                    break
+                rm = _naked_subsets(grid, unit, min(size, free - 1))
+                if not rm:
+                    break
+                removed += rm
+    return (grid, removed)
+
+#Naked pairs only
+@accepts_lists
+def naked_pairs(grid, units=ALL_UNITS, digits=ALL_DIGITS):
+    return naked_subsets(grid, units, digits, 2)
+
+#===============================================================================================================================================
+
+#2. Hidden candidates
+#This methods ressembles the naked candidates, but can find broader relationships between cells
+#The idea is to look at each row, column and box and look for n candidates that only appear in n cells (instead of looking for n cells that contain the same n candidates)
+#If we find such a relationship, then we can remove all other candidates from these cells
+#There exists hidden singles, pairs, triples and quads
+
+#1.1. Hidden singles
+#If a cell is the only one in its row, column or box to contain a certain candidate, then we can remove all the other candidates from this cell
+#With masks we don't have to look for each candidate in every other cell : we merge the other cells of the row, column and box into
+#a single mask and a candidate is alone if it is missing from one of these masks
+@accepts_lists
+def hidden_singles(grid):
+    removed = 0
+    cells = grid.cells
+    for i in range(81):
+        #If the cell is not solved yet then we check the row, col and box
+        mask = cells[i]
+        if POPCOUNT[mask] > 1:
+            #Digits that appear in the rest of all three units
+            everywhere = ALL_DIGITS
+            for u in CELL_UNITS[i]:
+                others = 0
+                for k in UNITS[u]:
+                    if k!=i:
+                        others |= cells[k]
+                everywhere &= others
+            #For each candidate in the cell, if it is missing from the rest of the row, column or box then we can solve the cell
+            for d in DIGITS[mask & ~everywhere]:
+                removed += grid.assign(i, BIT[d])
+                break
+    return (grid, removed)
+
+#1.2. Hidden subsets (singles, pairs, triples and quads)
+#n digits of a unit that, all together, can only go in n cells : these cells must hold these digits, so their other candidates can be removed
+#Instead of comparing the candidates of the cells, the unit is transposed : for each digit we build the mask of its positions in the unit
+#(9 bits, one per cell) and we look for n digits whose positions, all together, are only n cells
+#It is the same search as for the naked subsets with digits and cells swapped, and it takes care of the hidden triples that can be
+#mistaken for hidden pairs : in {2,5,6} {2,6} {2,5}, the positions of 5 and 6 together are 3 cells, so they are not a pair
+#Look for the subsets of the digits free[start:] with the digits chosen so far (mask), the union of their positions and their number
+def _hidden_subsets(grid, unit, positions, free, size, smallest, start=0, chosen=0, union=0, count=0):
+    removed = 0
+    for i in range(start, len(free)):
+        d = free[i]
+        subset = union | positions[d]
+        if POPCOUNT[subset] > size:
+            continue
+        if POPCOUNT[subset] == count + 1 and count + 1 >= smallest:
+            #Found : the cells of the subset can only hold the chosen digits
+            digits = chosen | BIT[d]
+            for p in DIGITS[subset]:
+                removed += grid.assign(unit[p-1], digits)
+        elif count + 1 < size:
+            removed += _hidden_subsets(grid, unit, positions, free, size, smallest, i + 1, chosen | BIT[d], subset, count + 1)
+    return removed
+
+#A hidden subset can only appear when positions of one of its digits are removed, so units without a changed digit are skipped
+@accepts_lists
+def hidden_subsets(grid, units=ALL_UNITS, digits=ALL_DIGITS, size=4, smallest=1):
+    removed = 0
+    cells = grid.cells
+    for u in range(27):
+        if units & (1 << u):
+            unit = UNITS[u]
+            #Positions are found again after every removal, which can make new subsets appear in the unit
+            while True:
+                #Positions of each digit in the unsolved cells (positions[d] is a 9 bit mask, bit p-1 for the cell number p of the unit)
+                positions = [0] * 10
+                unsolved = 0
+                placed = 0
+                for p in range(9):
+                    mask = cells[unit[p]]
+                    if POPCOUNT[mask] > 1:
+                        unsolved += 1
+                        for d in DIGITS[mask]:
+                            positions[d] |= BIT[p+1]
+                    else:
+                        placed |= mask
+                #The digits that are not placed yet, and the subsets that leave at least one unsolved cell of the unit
+                free = [d for d in DIGITS[ALL_DIGITS & ~placed] if positions[d]]
+                if unsolved < 2 or not digits & ~placed:
+                    break
+                rm = _hidden_subsets(grid, unit, positions, free, min(size, unsolved - 1), smallest)
+                if not rm:
+                    break
+                removed += rm
+    return (grid, removed)
+
+#Hidden pairs only
+@accepts_lists
+def hidden_pairs(grid, units=ALL_UNITS, digits=ALL_DIGITS):
+    return hidden_subsets(grid, units, digits, 2, 2)
+
+#===============================================================================================================================================
+
+#3. and 4. : Intersection removal
+#The next two methods are part of a technique called intersection removal
+#The idea is that if any one number occurs twice or thrice in just one unit (any row, column or box) then we can remove that number from the intersection of another unit
+#There are four types of intersection :
+#A Pair or Triple in a box - if they are aligned on a row, n can be removed from the rest of the row
+#A Pair or Triple in a box - if they are aligned on a column, n can be removed from the rest of the column
+#A Pair or Triple on a row - if they are all in the same box, n can be removed from the rest of the box
+#A Pair or Triple on a column - if they are all in the same box, n can be removed from the rest of the box
+#All four are checked at once on the 54 segments (the 3 cells shared by a box and a row or column, see topology.py) : for each segment we merge
+#the masks of the segment, of the rest of the box and of the rest of the line, and a single mask operation gives every number confined to the segment
+#The two methods below (pointing pairs and box/line reduction) are the two halves of this routine
+#A number aligned in a box can only appear when it is removed from the rest of the box, so the box has to be in the changed units (and the line
+#for box/line reduction)
+@accepts_lists
+def intersection_removal(grid, units=ALL_UNITS, digits=ALL_DIGITS, pointing=True, box_line=True):
+    removed = 0
+    cells = grid.cells
+    for box, line, segment, box_rest, line_rest in SEGMENTS:
+        check_box = pointing and units & (1 << box)
+        check_line = box_line and units & (1 << line)
+        if not check_box and not check_line:
+            continue
+        a, b, c = cells[segment[0]], cells[segment[1]], cells[segment[2]]
+        #Numbers that appear at least twice in the segment
+        twice = ((a & b) | (a & c) | (b & c)) & digits
+        if not twice:
+            continue
+        if check_box:
+            rest = 0
+            for l in box_rest:
+                rest |= cells[l]
+            #3. Pointing pairs : the number only appears in the segment within the box, so it can be removed from the rest of the line
+            confined = twice & ~rest
+            if confined:
+                for l in line_rest:
+                    removed += grid.eliminate(l, confined)
+        if check_line:
+            rest = 0
+            for l in line_rest:
+                rest |= cells[l]
+            #4. Box/line reduction : the number only appears in the segment within the line, so it can be removed from the rest of the box
+            confined = twice & ~rest
+            if confined:
+                for l in box_rest:
+                    removed += grid.eliminate(l, confined)
+    return (grid, removed)
+
+#===============================================================================================================================================
+
+#3. Pointing pairs
+#The idea is the following : we look at each box and if there a number appears twice or thrice in the box, on the same row or column, then we know that
+#this number MUST appear on that row or column, so we can remove it from the rest of the row or column on which it appears
+@accepts_lists
+def pointing_pairs(grid, units=ALL_UNITS, digits=ALL_DIGITS):
+    return intersection_removal(grid, units, digits, box_line=False)
+
+#===============================================================================================================================================
+
+#4. Box/line reduction
+#The idea is the exact same than with pointing pairs, but we look at rows and columns instead of boxes and remove from boxes instead of rows and columns
+@accepts_lists
+def box_line_reduction(grid, units=ALL_UNITS, digits=ALL_DIGITS):
+    return intersection_removal(grid, units, digits, pointing=False)
+
+#===============================================================================================================================================
+
+#5. X-wing, swordfish and jellyfish (fish)
+#This technique is a bit more complicated than the previous ones, but it is very powerful
+#Basically if a number appears only twice in two rows and the columns correspond, effectively forming a rectangle pattern, then the number can be removed from
+#all other cells in the two columns
+#Works the same way for columns where we remove from rows
+#It generalizes to n rows where the number only appears in n columns (all together) : n = 2 is the x-wing, 3 the swordfish and 4 the jellyfish
+#The number has to go once in each of the n rows, so it takes all of the n columns, and it can be removed from the other rows of these columns
+#For each row (or column) we build a mask of the columns (or rows) where the number appears, then the rows are chosen one at a time
+#like the cells of the naked subsets, keeping the union of their masks
+#Look for the fish of the lines found[start:] (line number and mask of its positions), with the lines chosen so far (as a mask) and the union of their positions
+def _fish(grid, bit, cross, found, size, start=0, chosen=0, union=0, count=0):
+    removed = 0
+    for i in range(start, len(found)):
+        line, positions = found[i]
+        cover = union | positions
+        if POPCOUNT[cover] > size:
+            continue
+        if count and POPCOUNT[cover] == count + 1:
+            #Found : remove the number from the other lines of the cross lines
+            lines = chosen | (1 << line)
+            for j in range(9):
+                if cover & (1 << j):
+                    for l in range(9):
+                        if not lines & (1 << l):
+                            removed += grid.eliminate(cross[j][l], bit)
+        elif count + 1 < size:
+            removed += _fish(grid, bit, cross, found, size, i + 1, chosen | (1 << line), cover, count + 1)
+    return removed
+
+#Every fish found is applied, even when there are several for the same number
+@accepts_lists
+def fish(grid, units=ALL_UNITS, digits=ALL_DIGITS, size=4):
+    removed = 0
+    cells = grid.cells
+    #We look at every number (the pattern spans the whole grid so only the digits matter)
+    for k in DIGITS[digits]:
+        bit = BIT[k]
+        #We start by looking at rows, then we do the exact same thing for columns
+        #(for columns, the "lines" are the columns and the "cross lines" are the rows)
+        for lines, cross in ((ROWS, COLS), (COLS, ROWS)):
+            found = []
+            for i in range(9):
+                #We look at each cell in the line and build the mask of the positions where the number appears
+                positions = 0
+                line = lines[i]
+                for j in range(9):
+                    if cells[line[j]] & bit:
+                        positions |= 1 << j
+                #Only the lines where the number appears between 2 and size times can be part of a fish
+                if 2 <= POPCOUNT[positions] <= size:
+                    found.append((i, positions))
+            if len(found) >= 2:
+                removed += _fish(grid, bit, cross, found, size)
+    return (grid, removed)
+
+@accepts_lists
+def x_wing(grid, units=ALL_UNITS, digits=ALL_DIGITS):
+    return fish(grid, units, digits, 2)
+
+#===============================================================================================================================================
+
+#6. Forcing : nishio and forcing chains
+#When nothing else works, a human can try a digit and see where it leads
+#Here it is bounded to the cells with two candidates : each candidate is placed in turn and the propagation engine follows the consequences
+#- if a candidate ends in a contradiction (a cell or a digit has no place left in a unit), it can be removed from the cell (nishio)
+#- if both candidates remove the same candidate from another cell, it goes whatever the digit of the cell is, so it can be removed (forcing chain)
+#The trials are undone with the snapshots of the grid (see CandidateGrid.snapshot) : only what a trial changed is restored, the grid isn't copied
+#A trial depends on the whole grid, not only on the units and digits that changed : units and digits are ignored, every cell with two
+#candidates is tried (at most max_cells of them) whenever the scheduler runs the method, that is when anything changed since its last run
+@accepts_lists
+def forcing(grid, units=ALL_UNITS, digits=ALL_DIGITS, max_cells=81):
+    removed = 0
+    cells = grid.cells
+    tried = 0
+    for i in range(81):
+        mask = cells[i]
+        if POPCOUNT[mask] != 2:
+            continue
+        if tried == max_cells:
+            break
+        tried += 1
+        #The candidates removed by each trial, None for a contradiction
+        outcomes = []
+        #The trials aren't recorded in the trace (see trace.py), only what is found
+        trace = grid.trace
+        grid.trace = None
+        for d in DIGITS[mask]:
+            snapshot = grid.snapshot()
+            try:
+                grid.assign(i, BIT[d])
+                propagate(grid)
+                outcomes.append(grid.changes(snapshot))
+            except Contradiction:
+                outcomes.append(None)
+            grid.rollback(snapshot)
+        grid.trace = trace
+        first, second = outcomes
+        if first is None and second is None:
+            raise Contradiction("no candidate of cell " + str(i) + " works")
+        if first is None or second is None:
+            removed += grid.eliminate(i, BIT[DIGITS[mask][0 if first is None else 1]])
+            continue
+        for k, gone in first.items():
+            common = gone & second.get(k, 0)
+            if common:
+                removed += grid.eliminate(k, common)
+    return (grid, removed)
+
+#===============================================================================================================================================
+
+#Define a solve function that will apply the different methods until the puzzle is solved or no more candidates can be removed
+#Simple elimination and hidden singles are replaced by the propagation engine (see propagation.py) : instead of sweeping the whole grid at
+#every pass, it only processes the cells and units where candidates were removed since the last pass, including by the other methods
+
+#The propagation engine, with the same signature as the other methods for the statistics
+def _propagate(grid):
+    return (grid, propagate(grid))
+
+#The other methods, from the cheapest to the most expensive
+STRATEGIES = (naked_subsets, hidden_subsets, intersection_removal, fish, forcing)
+
+#There are two ways of applying the methods :
+#- "sweep" : every pass applies every method on the whole grid, in a fixed order (the original behaviour, kept for comparison)
+#- "scheduled" : a method is only applied to the units and digits that changed since its last run, and as soon as a method makes
+#  progress we go back to the cheapest one, so the expensive methods only run when the cheap ones are stuck
+#Both return the number of passes (for the scheduler, a pass ends when a method makes progress)
+def _sweep(grid, stats=None):
+    left = grid.unsolved
+    removed = 1
+    steps = 0
+    while(left!=0 and removed!=0):
+        steps += 1
+        if stats is None:
+            removed = propagate(grid)
+            for strategy in STRATEGIES:
+                grid, rm = strategy(grid)
+                removed += rm
+        else:
+            grid, removed = stats.run(steps, "propagate", _propagate, grid)
+            for strategy in STRATEGIES:
+                grid, rm = stats.run(steps, strategy.__name__, strategy, grid)
+                removed += rm
+            stats.end_pass(grid)
+        #The grid keeps the number of unsolved cells up to date, no need to count them
+        left = grid.unsolved
+    return steps
+
+#The scheduler can also be given other methods (from the cheapest to the most expensive), and with fresh=False it only looks at what changed
+#since the grid was last at a fixed point (grid.dirty_units and grid.dirty_digits) instead of the whole grid, which is what the search in
+#hybrid.py needs after placing a digit
+def _scheduled(grid, stats=None, strategies=STRATEGIES, fresh=True):
+    #Units and digits that changed since the last run of each method, everything is dirty at the start
+    dirty_units = [ALL_UNITS if fresh else 0] * len(strategies)
+    dirty_digits = [ALL_DIGITS if fresh else 0] * len(strategies)
+    steps = 0
+    while grid.unsolved:
+        steps += 1
+        if stats is None:
+            propagate(grid)
+        else:
+            stats.run(steps, "propagate", _propagate, grid)
+        progress = False
+        for i in range(len(strategies)):
+            #Give the changes made since the last check to every method, then forget them
+            if grid.dirty_units:
+                for j in range(len(strategies)):
+                    dirty_units[j] |= grid.dirty_units
+                    dirty_digits[j] |= grid.dirty_digits
+                grid.dirty_units = 0
+                grid.dirty_digits = 0
+            #If nothing changed since the last run of the method, it can't find anything new
+            if not dirty_units[i] or not dirty_digits[i]:
+                continue
+            units = dirty_units[i]
+            digits = dirty_digits[i]
+            dirty_units[i] = 0
+            dirty_digits[i] = 0
+            if stats is None:
+                grid, rm = strategies[i](grid, units, digits)
+            else:
+                grid, rm = stats.run(steps, strategies[i].__name__, strategies[i], grid, units, digits)
+            if rm:
+                progress = True
+                break
+        if stats is not None:
+            stats.end_pass(grid)
+        if not progress:
+            break
+    return steps
+
+#Raise Contradiction if the puzzle turns out to have no solution, otherwise return the grid and the number of steps (see print_result to show them)
+#To know where the time goes, give a SolveStats object (see stats.py) : every run of a method is recorded in it
+#The results are kept in the cache of the process (see cache.py), keyed on the candidates and the mode : solving the same grid again only
+#copies the cached candidates into the grid
+#A run with a SolveStats object always solves (the point is to measure it), and stores its statistics with the result
+#To explain the solve, give a Trace object (see trace.py) : every candidate removed and every cell placed is recorded in it with the method
+#and the pass, and the intermediate grids can be rebuilt from it. A traced run also always solves
+def solve(grid, mode="scheduled", stats=None, trace=None):
+    #The methods are much faster on a CandidateGrid, so we convert the grid once instead of at every call
+    if not isinstance(grid, CandidateGrid):
+        grid = CandidateGrid.from_list(grid)
+    if mode == "sweep":
+        run = _sweep
+    elif mode == "scheduled":
+        run = _scheduled
+    else:
+        raise ValueError("unknown mode : " + str(mode))
+    key = ("human", mode, grid.cells.tobytes()) if RESULTS.enabled else None
+    if key is not None and stats is None and trace is None:
+        known = RESULTS.get(key)
+        if known is not None:
+            if known.cells is None:
+                raise Contradiction("the grid has no solution")
+            grid.set_cells(known.cells)
+            #The grid was at the end of a propagation, nothing is left to look at
+            grid.singles = []
+            grid.hidden = []
+            return (grid, known.steps)
+    #The trace takes the place of the statistics in the methods, and passes the runs on to them
+    recorder = stats
+    if trace is not None:
+        trace.stats = stats
+        trace.attach(grid)
+        recorder = trace
+    try:
+        if recorder is None:
+            steps = run(grid)
+        else:
+            if stats is not None:
+                stats.trajectory.append(grid.remaining)
+            start = time.perf_counter()
+            steps = run(grid, recorder)
+            if stats is not None:
+                stats.seconds += time.perf_counter() - start
+                stats.steps += steps
+    except Contradiction:
+        if key is not None:
+            RESULTS.put(key, HumanResult(None, 0, None))
+        raise
+    finally:
+        if trace is not None:
+            trace.detach(grid)
+    if key is not None:
+        RESULTS.put(key, HumanResult(grid.cells.tobytes(), steps, None if stats is None else stats.as_dict()))
+    return (grid, steps)
+
+#Print the result of solve
+def print_result(grid, steps):
+    if grid.unsolved == 0:
+        print("Solved in " + str(steps) + " steps")
+        print_grid(grid)
+    else:
+        print("Could not solve the puzzle with these methods")
+        print("Cells left : " + str(cells_left(grid)))
+        print("Final grid :")
+        print_grid(grid)
+
+#===============================================================================================================================================
+
+#Test the functions (only when the file is run : importing the module does no solving)
+#Usage : python -m sudoku_solver.human_solve [puzzle] [--mode sweep]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a sudoku puzzle with the human methods")
+    parser.add_argument("puzzle", nargs="?", default=puzzle, help="81 character puzzle with 0 or . for the empty cells (default: a demo puzzle)")
+    parser.add_argument("-s", "--stats", action="store_true", help="print the time spent and the candidates removed by each method")
+    parser.add_argument("-e", "--explain", action="store_true", help="print every candidate removed and every cell placed, with the method and the pass")
+    parser.add_argument("-m", "--mode", default="scheduled", choices=["scheduled", "sweep"], help="order of the methods (default: scheduled)")
+    args = parser.parse_args(argv)
+    grid = fill_candidates(grid_from_string(puzzle_string(args.puzzle)))
+    print()
+    print_grid(grid)
+    print()
+    stats = SolveStats() if args.stats else None
+    trace = Trace() if args.explain else None
+    print_result(*solve(grid, args.mode, stats, trace))
+    if trace is not None:
+        print()
+        print("\n".join(trace.explain()))
+    if stats is not None:
+        print()
+        print(stats.format())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#Search backend that propagates with the human methods at every node
+#The human methods alone stop when they are stuck (see human_solve.solve), and the search backends of solver.py guess without deducing anything
+#Here every node of the search tree is first reduced with the propagation engine and a chosen subset of the human methods (using the scheduler
+#of human_solve, which only looks at what changed since the parent node), then the search branches on the cell with the fewest candidates
+#Each branch works on a copy of the grid (81 cells and the unit counters, a few hundred bytes), so going back is just dropping the copy
+#More methods make each node more expensive but the tree smaller : with no methods it is a plain search with singles propagation,
+#with all of them most puzzles are solved at the root
+from .boards import puzzle_string
+from .candidate_grid import CandidateGrid, Contradiction, BIT, DIGITS, POPCOUNT
+from .human_solve import _scheduled, STRATEGIES
+from .propagation import propagate
+
+#Methods that can be chosen by name
+METHODS = {strategy.__name__: strategy for strategy in STRATEGIES}
+
+#On hard puzzles, hidden subsets and intersection removal save about 40% of the nodes for the same time, while naked subsets and fish
+#cost more than the nodes they save
+DEFAULT_METHODS = ("hidden_subsets", "intersection_removal")
+
+#Methods given by name or as functions, kept in the order of human_solve (from the cheapest to the most expensive)
+def _methods(methods):
+    chosen = []
+    for method in methods:
+        if isinstance(method, str):
+            if method not in METHODS:
+                raise ValueError("unknown method : " + method + " (choose from " + ", ".join(METHODS) + ")")
+            method = METHODS[method]
+        chosen.append(method)
+    order = {strategy: i for i, strategy in enumerate(STRATEGIES)}
+    return tuple(sorted(chosen, key=lambda m: order.get(m, len(order))))
+
+class HybridSearch:
+    __slots__ = ("methods", "nodes")
+
+    def __init__(self, methods=DEFAULT_METHODS):
+        self.methods = _methods(methods)
+        #Number of nodes visited so far, to compare the sizes of the trees
+        self.nodes = 0
+
+    #Generate the solved grids that can be reached from the grid
+    #fresh tells the scheduler to look at the whole grid (at the root) instead of only what changed
+    def search(self, grid, fresh=True):
+        self.nodes += 1
+        try:
+            _scheduled(grid, None, self.methods, fresh)
+            #The last method may have left cells to propagate
+            propagate(grid)
+        except Contradiction:
+            return
+        if grid.unsolved == 0:
+            yield grid
+            return
+        #Branch on the cell with the fewest candidates
+        cells = grid.cells
+        best = -1
+        best_count = 10
+        for i in range(81):
+            n = POPCOUNT[cells[i]]
+            if 1 < n < best_count:
+                best = i
+                best_count = n
+                if n == 2:
+                    break
+        for d in DIGITS[cells[best]]:
+            child = grid.copy()
+            child.assign(best, BIT[d])
+            yield from self.search(child, False)
+
+    #Generate the solutions of a puzzle one at a time
+    #The puzzle can be a 9x9 board or a string of 81 characters, and the solutions are given in the same format
+    def solutions(self, puzzle):
+        grid = CandidateGrid.from_string(puzzle_string(puzzle))
+        for solved in self.search(grid):
+            numbers = solved.to_string()
+            if isinstance(puzzle, str):
+                yield numbers
+            else:
+                yield [[int(numbers[i*9+j]) for j in range(9)] for i in range(9)]
+
+#Generate the solutions of the puzzle using the given methods at each node
+def solutions(puzzle, methods=DEFAULT_METHODS):
+    return HybridSearch(methods).solutions(puzzle)
+
+#Return the first solution of the puzzle (in the same format), or None if it has no solution
+def solve(puzzle, methods=DEFAULT_METHODS):
+    for solution in solutions(puzzle, methods):
+        return solution
+    return None
@@ -0,0 +1,41 @@
+#Constraint propagation driven by a work queue
+#Simple elimination and hidden singles used to rescan the whole grid at every pass, including cells that were solved many passes ago
+#Instead, the grid queues events as candidates are removed (see CandidateGrid.eliminate) :
+#- when a cell is reduced to a single candidate, only its 20 peers have to be cleaned
+#- when a digit is left with a single position in a unit, only that cell has to be solved
+#Cleaning the peers and solving the cells removes more candidates, which queues more events, until the queue is empty
+#The work done is proportional to the number of candidates actually removed instead of the size of the grid
+from .candidate_grid import Contradiction
+from .topology import UNITS, PEERS
+
+#Process the pending events of the grid until there are none left, and return the number of candidates removed
+#Raise Contradiction if a cell has no candidate left or a digit has no position left in a unit
+def propagate(grid):
+    removed = 0
+    cells = grid.cells
+    counts = grid.counts
+    singles = grid.singles
+    hidden = grid.hidden
+    while True:
+        #Naked singles first : they are the cheapest and usually produce the hidden singles
+        if singles:
+            i = singles.pop()
+            mask = cells[i]
+            if not mask:
+                raise Contradiction("cell " + str(i) + " has no candidate left")
+            for k in PEERS[i]:
+                if cells[k] & mask:
+                    removed += grid.eliminate(k, mask)
+        elif hidden:
+            k = hidden.pop()
+            #The count can only go down, so it is either 1 or 0 (if another position was removed since the event was queued)
+            if not counts[k]:
+                raise Contradiction("digit " + str(k%9 + 1) + " has no position left in unit " + str(k//9))
+            bit = 1 << (k%9)
+            for i in UNITS[k//9]:
+                if cells[i] & bit:
+                    if cells[i] != bit:
+                        removed += grid.assign(i, bit)
+                    break
+        else:
+            return removed
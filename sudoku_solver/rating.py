@@ -0,0 +1,133 @@
+#Difficulty of a puzzle : the hardest human method needed to solve it
+#The levels go from the propagation engine alone (naked and hidden singles, which replace simple_elimination and hidden_singles) through the
+#methods of human_solve.STRATEGIES in their order (naked_subsets covers the naked pairs, fish covers the x-wings...), and "search" for the
+#puzzles the human methods can't finish
+#The grid is solved on a ladder : a harder method is only added when the easier ones are stuck, so the level reached is the one needed
+#rate also counts the passes and the candidates removed by each method, for the batch ratings : it works in place on the CandidateGrid
+#with the propagation engine, and doesn't print, copy the grid or time anything
+from collections import namedtuple
+
+from .boards import puzzle_string
+from .candidate_grid import CandidateGrid
+from .human_solve import _scheduled, STRATEGIES
+
+LEVELS = ("singles",) + tuple(strategy.__name__ for strategy in STRATEGIES) + ("search",)
+
+#The methods whose removals are counted : the propagation engine and the strategies
+TECHNIQUES = ("propagate",) + tuple(strategy.__name__ for strategy in STRATEGIES)
+
+#Rating of a puzzle : its level (index in LEVELS), the number of passes of the scheduler, and the candidates removed by each technique
+#(tuple in the order of TECHNIQUES)
+Rating = namedtuple("Rating", ["level", "passes", "removed"])
+
+#Takes the place of SolveStats in the scheduler, only adding up the candidates removed by each method
+class _Tally:
+    __slots__ = ("removed",)
+
+    def __init__(self):
+        self.removed = dict.fromkeys(TECHNIQUES, 0)
+
+    def run(self, step, name, method, grid, *args):
+        grid, removed = method(grid, *args)
+        self.removed[name] += removed
+        return (grid, removed)
+
+    def end_pass(self, grid):
+        pass
+
+#Return the level of the puzzle (an index in LEVELS), raise Contradiction if it has no solution
+#A CandidateGrid is solved in place, a board or a string is converted first
+def grade(puzzle):
+    return rate(puzzle).level
+
+#Return the Rating of the puzzle, raise Contradiction if it has no solution
+#A CandidateGrid is solved in place, a board or a string is converted first
+def rate(puzzle):
+    grid = puzzle if isinstance(puzzle, CandidateGrid) else CandidateGrid.from_string(puzzle_string(puzzle))
+    tally = _Tally()
+    passes = 0
+    level = 0
+    while True:
+        #The methods added at this level look at the whole grid, the easier ones find nothing more on it
+        passes += _scheduled(grid, tally, STRATEGIES[:level])
+        if not grid.unsolved or level == len(STRATEGIES):
+            break
+        level += 1
+    if grid.unsolved:
+        level += 1
+    return Rating(level, passes, tuple(tally.removed.values()))
+
+#Ratings of many puzzles added up by level : the number of puzzles, a histogram of their number of passes and the candidates removed by
+#each technique, for each level (lists indexed like LEVELS), and the puzzles that couldn't be rated
+class RatingSummary:
+    __slots__ = ("levels", "passes", "removed", "invalid", "no_solution")
+
+    def __init__(self):
+        self.levels = [0] * len(LEVELS)
+        #For each level, {number of passes: number of puzzles}
+        self.passes = [{} for _ in LEVELS]
+        self.removed = [[0] * len(TECHNIQUES) for _ in LEVELS]
+        self.invalid = 0
+        self.no_solution = 0
+
+    @property
+    def puzzles(self):
+        return sum(self.levels) + self.invalid + self.no_solution
+
+    def add(self, rating):
+        level = rating.level
+        self.levels[level] += 1
+        passes = self.passes[level]
+        passes[rating.passes] = passes.get(rating.passes, 0) + 1
+        totals = self.removed[level]
+        for k, removed in enumerate(rating.removed):
+            totals[k] += removed
+
+    def merge(self, other):
+        for level in range(len(LEVELS)):
+            self.levels[level] += other.levels[level]
+            for passes, n in other.passes[level].items():
+                self.passes[level][passes] = self.passes[level].get(passes, 0) + n
+            for k in range(len(TECHNIQUES)):
+                self.removed[level][k] += other.removed[level][k]
+        self.invalid += other.invalid
+        self.no_solution += other.no_solution
+
+    def as_dict(self):
+        return {
+            "puzzles": self.puzzles,
+            "invalid": self.invalid,
+            "no_solution": self.no_solution,
+            "levels": {LEVELS[level]: {"puzzles": self.levels[level],
+                                       "passes": dict(sorted(self.passes[level].items())),
+                                       "removed": dict(zip(TECHNIQUES, self.removed[level]))}
+                       for level in range(len(LEVELS))},
+        }
+
+    #Table of the levels : share of the puzzles, passes (median and maximum) and candidates removed per puzzle by each technique
+    def format(self):
+        total = self.puzzles
+        lines = ["level".ljust(22) + "puzzles".rjust(10) + "%".rjust(7) + "passes".rjust(8) + "max".rjust(6)
+                 + "".join(name[:12].rjust(14) for name in TECHNIQUES)]
+        for level in range(len(LEVELS)):
+            n = self.levels[level]
+            if not n:
+                continue
+            histogram = sorted(self.passes[level].items())
+            seen = 0
+            for median, count in histogram:
+                seen += count
+                if seen * 2 >= n:
+                    break
+            lines.append(LEVELS[level].ljust(22) + str(n).rjust(10) + format(100 * n / total, ".1f").rjust(7) + str(median).rjust(8)
+                         + str(histogram[-1][0]).rjust(6) + "".join(format(removed / n, ".1f").rjust(14) for removed in self.removed[level]))
+        lines.append("invalid : " + str(self.invalid) + ", no solution : " + str(self.no_solution))
+        return "\n".join(lines)
+
+#The index in LEVELS of a level given by name or by index
+def level_index(level):
+    if isinstance(level, int) and 0 <= level < len(LEVELS):
+        return level
+    if level in LEVELS:
+        return LEVELS.index(level)
+    raise ValueError("unknown level : " + str(level) + " (choose from " + ", ".join(LEVELS) + ")")
@@ -0,0 +1,348 @@
+import argparse
+
+from . import dlx, hybrid
+from .boards import board_from_string, board_to_string, puzzle_string
+from .cache import RESULTS, record_puzzle
+from .candidate_grid import ALL_DIGITS, BIT, POPCOUNT, VALUE
+from .topology import PEER_COORDS, ROW_OF, COL_OF, BOX_OF, COORDS, UNITS
+
+#Start by defining the board : two different difficulties just to test the solver
+#0 means empty cell
+easy = [[8,6,0,0,0,4,0,0,0],
+        [0,0,0,9,0,0,8,0,0],
+        [3,0,4,0,0,0,0,6,7],
+        [6,2,0,0,4,5,7,9,1],
+        [5,3,9,0,8,1,4,0,6],
+        [0,0,7,0,2,9,0,0,0],
+        [0,0,3,0,0,6,0,0,0],
+        [0,5,0,4,0,0,0,8,9],
+        [0,0,0,5,0,7,6,0,2]]
+
+two_sols = [[9,0,6,0,7,0,4,0,3],
+            [0,0,0,4,0,0,2,0,0],
+            [0,7,0,0,2,3,0,1,0],
+            [5,0,0,0,0,0,1,0,0],
+            [0,4,0,2,0,8,0,6,0],
+            [0,0,3,0,0,0,0,0,5],
+            [0,3,0,7,0,0,0,5,0],
+            [0,0,7,0,0,5,0,0,0],
+            [4,0,5,0,1,0,7,0,8]]
+
+medium = [[0,8,0,0,5,0,0,9,0],
+          [0,0,0,6,0,0,2,0,3],
+          [4,2,7,0,0,3,0,6,0],
+          [0,0,8,1,6,2,0,0,0],
+          [0,3,0,0,0,9,0,8,0],
+          [0,0,0,5,0,0,0,0,0],
+          [2,5,6,8,0,1,3,7,0],
+          [0,4,0,0,0,0,1,0,0],
+          [0,0,0,0,4,0,0,2,0]]
+
+difficult = [[1,0,0,6,8,5,0,7,0],
+             [0,6,0,0,1,0,0,0,0],
+             [5,9,0,0,0,4,0,6,0],
+             [0,0,7,0,6,0,0,0,0],
+             [0,1,0,0,0,0,0,0,7],
+             [6,0,0,0,9,0,2,5,4],
+             [0,0,0,0,7,3,0,9,1],
+             [0,0,0,0,5,0,0,0,6],
+             [8,0,0,0,0,0,3,0,0]]
+
+expert = [[5,8,6,4,0,0,0,0,3],
+          [0,0,0,0,8,0,0,0,4],
+          [0,0,0,9,0,0,0,0,7],
+          [0,0,0,0,0,0,0,4,0],
+          [0,0,0,0,0,9,7,2,0],
+          [0,3,0,0,5,0,0,0,1],
+          [7,0,0,0,0,0,0,6,0],
+          [0,5,0,0,3,2,0,0,0],
+          [2,0,0,0,6,0,0,0,0]]
+
+diabolical = [[0,8,0,2,0,0,0,1,0],
+              [0,6,0,0,0,3,0,0,0],
+              [3,0,1,0,7,0,9,0,0],
+              [4,0,2,0,0,8,0,9,0],
+              [0,0,0,5,0,0,7,0,0],
+              [0,1,0,0,0,0,0,0,0],
+              [9,0,3,0,0,4,0,2,0],
+              [0,0,0,0,8,0,0,0,4],
+              [6,0,0,0,0,0,0,0,0]]
+
+extreme = [[0,0,1,0,0,3,0,0,2],
+           [0,2,0,0,4,0,0,1,0],
+           [7,0,0,9,0,0,5,0,0],
+           [4,0,0,8,0,0,6,0,0],
+           [0,1,0,0,7,0,0,4,0],
+           [0,0,3,0,0,4,0,0,8],
+           [0,0,2,0,0,7,0,0,5],
+           [0,9,0,0,5,0,0,6,0],
+           [6,0,0,3,0,0,8,0,0]]
+
+#Define helper functions
+#Print the board in a nice way
+def print_board(board):
+    for i in range(len(board)):
+        if i % 3 == 0 and i != 0:
+            print("---------------------")
+        for j in range(len(board[0])):
+            if j % 3 == 0 and j != 0:
+                print("| ", end = "")
+            if j == 8:
+                print(board[i][j])
+            else:
+                print(str(board[i][j]) + " ", end = "")
+
+#Test if a number is valid in a given position
+#The cells of the row, column and box (the peers of the cell) are precomputed in topology.py
+def isValid(i,j,n,board):
+    for (k,l) in PEER_COORDS[i*9+j]:
+        if board[k][l] == n:
+            return False
+    return True
+
+#Then define the actual solver
+#For this we will use a simple backtracking algorithm
+# => we try to fill each empty cell with a number and everytime we reach a dead end we backtrack
+#The search is a generator : every time all the cells are filled we give back a copy of the board, and the search only
+#continues if the caller asks for another solution
+def _backtrack_search(board):
+    #First we have to find the next empty cell
+    for i in range(len(board)):
+        for j in range(len(board[0])):
+            #If the cell is empty
+            if board[i][j] == 0:
+                #Then we try to fill it with a number
+                for n in range(1,10):
+                    #If the number is valid in this position
+                    if(isValid(i,j,n,board)):
+                        #Then we put it in the cell and recursively search the rest of the board
+                        board[i][j] = n
+                        yield from _backtrack_search(board)
+                        #Once the solutions with this number have been given, we have to backtrack
+                        board[i][j] = 0
+                return
+    #If all the cells are filled then a solution has been found
+    yield [row[:] for row in board]
+
+#Generate the solutions of the board one at a time, the board itself is not modified
+def _backtrack_solutions(board):
+    #The search only checks the digits it puts, a digit given twice in the same row, column or box means there is no solution
+    for i in range(9):
+        for j in range(9):
+            if board[i][j] != 0 and not isValid(i, j, board[i][j], board):
+                return
+    yield from _backtrack_search([row[:] for row in board])
+
+#Faster solver : minimum remaining values (MRV) backtracking
+#Instead of checking every number with isValid (which scans 20 cells), we keep for each row, column and box a mask of the digits
+#already used (bit d-1 for the digit d), updated when we place a digit and when we backtrack
+#The possible digits of a cell are then the digits missing from the masks of its row, column and box
+#Instead of filling the cells in order, we always fill the empty cell with the fewest possible digits : dead ends are found much earlier
+#and cells with a single possibility are filled without branching
+def _mrv_search(board, empties, rows, cols, boxes):
+    #If there are no empty cells left then we have a solution
+    if not empties:
+        yield [row[:] for row in board]
+        return
+    #Find the empty cell with the fewest possible digits
+    best = 0
+    best_free = 0
+    best_count = 10
+    for k in range(len(empties)):
+        c = empties[k]
+        free = ~(rows[ROW_OF[c]] | cols[COL_OF[c]] | boxes[BOX_OF[c]]) & ALL_DIGITS
+        count = POPCOUNT[free]
+        if count < best_count:
+            best, best_free, best_count = k, free, count
+            #We can't do better than a single possibility (and no possibility is a dead end)
+            if count <= 1:
+                break
+    if best_count == 0:
+        return
+    #Take the cell out of the empty cells (we swap it with the last one so that removing it is cheap)
+    c = empties[best]
+    empties[best] = empties[-1]
+    empties.pop()
+    i, j = COORDS[c]
+    r, l, b = ROW_OF[c], COL_OF[c], BOX_OF[c]
+    free = best_free
+    while free:
+        #Lowest possible digit of the mask
+        bit = free & -free
+        free ^= bit
+        rows[r] |= bit
+        cols[l] |= bit
+        boxes[b] |= bit
+        board[i][j] = VALUE[bit]
+        yield from _mrv_search(board, empties, rows, cols, boxes)
+        #Backtrack
+        rows[r] ^= bit
+        cols[l] ^= bit
+        boxes[b] ^= bit
+    board[i][j] = 0
+    #Put the cell back where it was
+    if best < len(empties):
+        empties.append(empties[best])
+        empties[best] = c
+    else:
+        empties.append(c)
+
+#Generate the solutions of the board one at a time, the board itself is not modified
+def _mrv_solutions(board):
+    board = [row[:] for row in board]
+    rows = [0] * 9
+    cols = [0] * 9
+    boxes = [0] * 9
+    empties = []
+    for c in range(81):
+        i, j = COORDS[c]
+        bit = BIT[board[i][j]]
+        if not bit:
+            empties.append(c)
+            continue
+        #A digit given twice in the same row, column or box means there is no solution
+        if (rows[ROW_OF[c]] | cols[COL_OF[c]] | boxes[BOX_OF[c]]) & bit:
+            return
+        rows[ROW_OF[c]] |= bit
+        cols[COL_OF[c]] |= bit
+        boxes[BOX_OF[c]] |= bit
+    yield from _mrv_search(board, empties, rows, cols, boxes)
+
+#Search backends that can be selected at runtime
+#Each one generates the solutions of a 9x9 board one at a time, without modifying the board
+#"dlx" (see dlx.py) models the sudoku as an exact cover problem, it is the safest choice for puzzles with very few clues
+#"hybrid" (see hybrid.py) runs the propagation engine and some of the human methods at every node
+BACKENDS = {
+    "backtrack": _backtrack_solutions,
+    "mrv": _mrv_solutions,
+    "dlx": dlx.solutions,
+    "hybrid": hybrid.solutions,
+}
+
+#Generate the solutions of the board one at a time, as 9x9 boards, using the chosen backend
+#A puzzle given as a string of 81 characters is read once here (the backends only take boards), and its solutions are given as strings
+#Nothing is computed until a solution is asked for, so stopping early (for example after the first one) saves the rest of the search
+#The results are kept in the cache of the process (see cache.py) : when every solution of the board is known (no solution or a single one),
+#they are given without searching
+def solutions(board, backend="mrv"):
+    search = get_backend(backend)
+    if isinstance(board, str):
+        return map(board_to_string, solutions(board_from_string(board), backend))
+    key = _cache_key(board)
+    if key is None:
+        return search(board)
+    known = RESULTS.get(key, _all_known)
+    if known is not None:
+        return iter([] if known.count == 0 else [board_from_string(known.solution)])
+    return _recorded(key, backend, search(board))
+
+#The generator function of a backend, or ValueError for an unknown name (every module choosing a backend checks it here)
+#The solvers check it before looking at the cache, so that a wrong name fails even for a known puzzle
+def get_backend(backend):
+    if backend not in BACKENDS:
+        raise ValueError("unknown backend : " + str(backend) + " (choose from " + ", ".join(BACKENDS) + ")")
+    return BACKENDS[backend]
+
+#The puzzle as the key of the cache (None when the cache is off or the board is not a valid puzzle, the backend will deal with it)
+def _cache_key(board):
+    if not RESULTS.enabled:
+        return None
+    try:
+        return puzzle_string(board)
+    except (ValueError, TypeError):
+        return None
+
+def _all_known(result):
+    return result.count is not None and result.count < 2
+
+_DIGIT_CHARACTERS = set("123456789")
+
+#Is numbers (string of 81 digits) a complete and valid grid with the givens of the puzzle ?
+def _is_solution(puzzle, numbers):
+    if any(given != "0" and given != n for given, n in zip(puzzle, numbers)):
+        return False
+    return all({numbers[c] for c in unit} == _DIGIT_CHARACTERS for unit in UNITS)
+
+#Pass the solutions through, recording the first one and the number of solutions when the search gets far enough to know it
+#The cache is shared by the backends : a first solution that isn't valid isn't recorded, nor anything else found by the same search
+def _recorded(key, backend, found):
+    count = 0
+    for solution in found:
+        count += 1
+        if count == 1:
+            numbers = puzzle_string(solution)
+            if not _is_solution(key, numbers):
+                yield solution
+                yield from found
+                return
+            record_puzzle(key, numbers, backend)
+        elif count == 2:
+            record_puzzle(key, count=2)
+        yield solution
+    record_puzzle(key, count=min(count, 2))
+
+#Count the solutions of the board, stopping as soon as limit solutions have been found (if a limit is given)
+#To know if a puzzle has a unique solution we only need limit=2 : the search stops at the second solution
+def count_solutions(board, limit=None, backend="mrv"):
+    get_backend(backend)
+    #The cache knows when there are at least 2 solutions
+    if limit is not None and limit <= 2:
+        key = _cache_key(board)
+        if key is not None and RESULTS.get(key, lambda result: result.count == 2) is not None:
+            return limit
+    found = 0
+    for _ in solutions(board, backend):
+        found += 1
+        if found == limit:
+            break
+    return found
+
+def has_unique_solution(board, backend="mrv"):
+    return count_solutions(board, limit=2, backend=backend) == 1
+
+#Fill the board with its first solution using the chosen backend
+#Return True if a solution was found and False if the board has no solution
+def solve_with(board, backend="mrv"):
+    if isinstance(board, str):
+        raise TypeError("solve_with fills a 9x9 board, a string can't be filled : use solutions() for a string")
+    #When there are several solutions the first one depends on the backend, so the cached one is only used if the same backend found it
+    get_backend(backend)
+    key = _cache_key(board)
+    if key is not None:
+        known = RESULTS.get(key, lambda result: result.solution is not None and (result.count == 1 or result.backend == backend))
+        if known is not None:
+            solution = board_from_string(known.solution)
+            for i in range(9):
+                board[i][:] = solution[i]
+            return True
+    for solution in solutions(board, backend):
+        for i in range(9):
+            board[i][:] = solution[i]
+        return True
+    return False
+
+def solve_mrv(board):
+    return solve_with(board, "mrv")
+
+#Print every solution of the board found by the simple backtracking algorithm, and return the number of solutions
+def solve(board):
+    found = 0
+    for solution in solutions(board, "backtrack"):
+        print_board(solution)
+        print("=====================")
+        found += 1
+    return found
+
+#Finally we can call the solver on a board (only when the file is run : importing the module does no solving)
+#Usage : python -m sudoku_solver.solver [puzzle]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print every solution of a sudoku puzzle found by backtracking")
+    parser.add_argument("puzzle", nargs="?", default=None, help="81 character puzzle with 0 or . for the empty cells (default: the extreme board)")
+    args = parser.parse_args(argv)
+    to_solve = extreme if args.puzzle is None else board_from_string(args.puzzle)
+    print_board(to_solve)
+    print("Solving board...")
+    solve(to_solve)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#Statistics of a run of human_solve.solve, to know which method costs the most on which kind of puzzle
+#Recording is opt-in : solve(grid, stats=SolveStats()) fills the object, and without it the methods are called directly
+#Every run of a method (including the propagation engine) is recorded as a StrategyRun, and the number of candidates left
+#is recorded at the end of every pass
+#A callback can be given to stream the runs somewhere else (a metrics system, a log...) as they happen
+import time
+from collections import namedtuple
+
+#One run of a method : the pass it belongs to (from 1), the name of the method, its duration, the candidates it removed,
+#and the candidates left after it
+StrategyRun = namedtuple("StrategyRun", ["step", "strategy", "seconds", "removed", "candidates_left"])
+
+#Totals of a method over the whole solve
+class StrategyTotals:
+    __slots__ = ("calls", "seconds", "removed", "no_effect")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.removed = 0
+        #Number of runs that didn't remove anything
+        self.no_effect = 0
+
+    def as_dict(self):
+        return {"calls": self.calls, "seconds": self.seconds, "removed": self.removed, "no_effect": self.no_effect}
+
+    def __repr__(self):
+        return "StrategyTotals(" + ", ".join(k + "=" + repr(v) for k, v in self.as_dict().items()) + ")"
+
+class SolveStats:
+    __slots__ = ("runs", "strategies", "trajectory", "steps", "seconds", "callback", "keep_runs")
+
+    #callback(run) is called after every run of a method
+    #keep_runs=False only keeps the totals, for long batches where the list of runs would grow too much
+    def __init__(self, callback=None, keep_runs=True):
+        self.runs = []
+        self.strategies = {}
+        #Candidates left at the start, then at the end of every pass
+        self.trajectory = []
+        self.steps = 0
+        self.seconds = 0.0
+        self.callback = callback
+        self.keep_runs = keep_runs
+
+    #Run method(grid, *args) and record it, return what the method returns
+    def run(self, step, name, method, grid, *args):
+        start = time.perf_counter()
+        grid, removed = method(grid, *args)
+        seconds = time.perf_counter() - start
+        totals = self.strategies.get(name)
+        if totals is None:
+            totals = self.strategies[name] = StrategyTotals()
+        totals.calls += 1
+        totals.seconds += seconds
+        totals.removed += removed
+        if not removed:
+            totals.no_effect += 1
+        record = StrategyRun(step, name, seconds, removed, grid.remaining)
+        if self.keep_runs:
+            self.runs.append(record)
+        if self.callback is not None:
+            self.callback(record)
+        return (grid, removed)
+
+    def end_pass(self, grid):
+        self.trajectory.append(grid.remaining)
+
+    def as_dict(self):
+        return {
+            "steps": self.steps,
+            "seconds": self.seconds,
+            "trajectory": list(self.trajectory),
+            "strategies": {name: totals.as_dict() for name, totals in self.strategies.items()},
+        }
+
+    #Table of the totals, the most expensive method first
+    def format(self):
+        lines = ["strategy".ljust(20) + "calls".rjust(8) + "no effect".rjust(11) + "removed".rjust(9) + "ms".rjust(10)]
+        for name, totals in sorted(self.strategies.items(), key=lambda item: -item[1].seconds):
+            lines.append(name.ljust(20) + str(totals.calls).rjust(8) + str(totals.no_effect).rjust(11) + str(totals.removed).rjust(9)
+                         + format(totals.seconds * 1000, ".3f").rjust(10))
+        lines.append("candidates left : " + " -> ".join(str(n) for n in self.trajectory))
+        return "\n".join(lines)
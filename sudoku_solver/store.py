@@ -0,0 +1,111 @@
+#Persistent store of the results of the batch runs, in a SQLite database (sqlite3 comes with Python, there is no server to run)
+#Each puzzle (string of 81 digits) has one row : its first solution, its number of solutions (0, 1 or 2 for "at least 2"), its rating,
+#the time spent solving it and the backend used
+#A run also records how far it got in its input : the results and the position are committed in the same transaction, so after a crash
+#the run started again with the same name goes on from the last commit, and nothing that was committed is solved again
+#The writes are grouped in transactions of many puzzles, since a transaction per puzzle would be limited by the syncs of the disk
+import os
+import sqlite3
+from collections import namedtuple
+from urllib.request import pathname2url
+
+#What is stored for a puzzle (solution is None when there is none, count is 2 for "at least 2", rating is None when it wasn't rated)
+StoredResult = namedtuple("StoredResult", ["puzzle", "solution", "count", "rating", "seconds", "backend"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    puzzle TEXT PRIMARY KEY,
+    solution TEXT,
+    count INTEGER,
+    rating TEXT,
+    seconds REAL,
+    backend TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS runs (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+"""
+
+#SQLite limits the number of parameters of a query
+MAX_PARAMETERS = 500
+
+class ResultStore:
+    __slots__ = ("path", "connection", "pending")
+
+    #readonly is for the worker processes, which only look up the puzzles already solved (the main process does all the writing)
+    def __init__(self, path, readonly=False):
+        self.path = path
+        if readonly:
+            #SQLite refuses every write on this connection, and doesn't create the database if it isn't there
+            self.connection = sqlite3.connect("file:" + pathname2url(os.path.abspath(path)) + "?mode=ro", uri=True)
+        else:
+            self.connection = sqlite3.connect(path)
+            self.connection.executescript(SCHEMA)
+            #With the write-ahead log the readers aren't blocked by the writer, and a commit only syncs the log
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+        #Results added since the last commit
+        self.pending = 0
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    #On an error the results that weren't committed are dropped, the position of the run stays at the last commit
+    def __exit__(self, kind, value, traceback):
+        if kind is None:
+            self.commit()
+        else:
+            self.rollback()
+        self.close()
+
+    def get(self, puzzle):
+        row = self.connection.execute("SELECT * FROM results WHERE puzzle = ?", (puzzle,)).fetchone()
+        return None if row is None else StoredResult(*row)
+
+    #Return {puzzle: StoredResult} for the puzzles of the list that are in the store
+    def known(self, puzzles):
+        puzzles = list(puzzles)
+        found = {}
+        for i in range(0, len(puzzles), MAX_PARAMETERS):
+            part = puzzles[i:i+MAX_PARAMETERS]
+            query = "SELECT * FROM results WHERE puzzle IN (" + ",".join("?" * len(part)) + ")"
+            for row in self.connection.execute(query, part):
+                found[row[0]] = StoredResult(*row)
+        return found
+
+    #Add or replace results (StoredResult), they are only saved by the next commit
+    def add(self, results):
+        cursor = self.connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)", results)
+        self.pending += max(cursor.rowcount, 0)
+
+    #Save the results added so far, and the position reached by the run in the same transaction
+    def commit(self, run=None, position=None):
+        if run is not None:
+            self.connection.execute("INSERT OR REPLACE INTO runs VALUES (?, ?)", (run, position))
+        self.connection.commit()
+        self.pending = 0
+
+    #Drop the results added since the last commit
+    def rollback(self):
+        self.connection.rollback()
+        self.pending = 0
+
+    #Number of puzzles of its input that the run had done at its last commit (0 for a new run)
+    def position(self, run):
+        row = self.connection.execute("SELECT position FROM runs WHERE name = ?", (run,)).fetchone()
+        return 0 if row is None else row[0]
+
+    #Is there a puzzle with a solution that wasn't rated ? (a puzzle without a solution has no rating)
+    def unrated(self):
+        return self.connection.execute("SELECT 1 FROM results WHERE rating IS NULL AND count > 0 LIMIT 1").fetchone() is not None
+
+    def results(self):
+        for row in self.connection.execute("SELECT * FROM results ORDER BY puzzle"):
+            yield StoredResult(*row)
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,47 @@
+#Shape of the sudoku grid, shared by both solvers
+#Cells are numbered from 0 to 80 in reading order (cell index = row*9 + col)
+#Every table is computed once at import as tuples of cell indices, so the solving methods never have to
+#rebuild rows, columns or boxes with coordinate arithmetic in their loops
+
+#Coordinates of each cell
+ROW_OF = tuple(c//9 for c in range(81))
+COL_OF = tuple(c%9 for c in range(81))
+BOX_OF = tuple((c//27)*3 + (c%9)//3 for c in range(81))
+COORDS = tuple((c//9, c%9) for c in range(81))
+
+#The 9 rows, 9 columns and 9 boxes, each as a tuple of 9 cell indices
+ROWS = tuple(tuple(c for c in range(81) if ROW_OF[c] == i) for i in range(9))
+COLS = tuple(tuple(c for c in range(81) if COL_OF[c] == i) for i in range(9))
+BOXES = tuple(tuple(c for c in range(81) if BOX_OF[c] == i) for i in range(9))
+
+#The 27 units : rows are units 0 to 8, columns 9 to 17 and boxes 18 to 26
+UNITS = ROWS + COLS + BOXES
+ROW_UNIT = 0
+COL_UNIT = 9
+BOX_UNIT = 18
+
+#The 3 units (row, column, box) of each cell
+CELL_UNITS = tuple((ROW_OF[c], COL_UNIT + COL_OF[c], BOX_UNIT + BOX_OF[c]) for c in range(81))
+
+#Sets of units are stored as 27 bit masks (bit u for unit u)
+ALL_UNITS = (1 << 27) - 1
+UNIT_BITS = tuple((1 << CELL_UNITS[c][0]) | (1 << CELL_UNITS[c][1]) | (1 << CELL_UNITS[c][2]) for c in range(81))
+
+#The 20 peers of each cell : the other cells of its row, column and box
+PEERS = tuple(tuple(sorted(set(UNITS[CELL_UNITS[c][0]] + UNITS[CELL_UNITS[c][1]] + UNITS[CELL_UNITS[c][2]]) - {c})) for c in range(81))
+PEER_COORDS = tuple(tuple(COORDS[p] for p in PEERS[c]) for c in range(81))
+
+#The 54 intersections between a box and a line (27 box/row and 27 box/column), each made of 3 cells
+#Each segment is a tuple (box unit, line unit, cells of the segment, rest of the box, rest of the line)
+def _segments():
+    segments = []
+    for line in range(18):
+        for box in range(BOX_UNIT, BOX_UNIT+9):
+            cells = tuple(c for c in UNITS[line] if c in UNITS[box])
+            if cells:
+                box_rest = tuple(c for c in UNITS[box] if c not in cells)
+                line_rest = tuple(c for c in UNITS[line] if c not in cells)
+                segments.append((box, line, cells, box_rest, line_rest))
+    return tuple(segments)
+
+SEGMENTS = _segments()
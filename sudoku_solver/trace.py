@@ -0,0 +1,112 @@
+#Record of the deductions of a solve, to explain it step by step or to look at any intermediate grid
+#Recording is opt-in : solve(grid, trace=Trace()) attaches the trace to the grid, and CandidateGrid.eliminate reports every removal to it
+#Each event is packed in a single unsigned 32 bit integer of an array (typecode "I"), so a trace costs 4 bytes per event and no Python object :
+#- bits 0-3 : the digit
+#- bits 4-10 : the cell (0 to 80)
+#- bit 11 : set for a placement (the cell was reduced to this digit), otherwise the digit was removed from the cell
+#- bits 12-15 : the method that made it (index in Trace.strategies, 0 for the removals made outside of the methods)
+#- bits 16-31 : the pass (from 1, 0 before the first pass)
+#The grid is copied once, at the start : any intermediate grid is rebuilt by replaying the removals on that copy
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+
+from .candidate_grid import CandidateGrid, BIT, DIGITS, POPCOUNT, VALUE
+
+PLACEMENT = 1 << 11
+MAX_STRATEGIES = 16
+
+#An event once unpacked
+TraceEvent = namedtuple("TraceEvent", ["strategy", "cell", "digit", "step", "placement"])
+
+class Trace:
+    __slots__ = ("events", "strategies", "start", "stats", "_ids", "_current")
+
+    #stats : a SolveStats object to fill at the same time (the trace takes its place in the scheduler and passes the runs on to it)
+    def __init__(self, stats=None):
+        self.events = array("I")
+        #Names of the methods, the index being the id stored in the events
+        self.strategies = ["outside"]
+        self._ids = {}
+        #Candidates of the grid when the recording started
+        self.start = None
+        self.stats = stats
+        #Strategy and pass bits of the events being recorded
+        self._current = 0
+
+    def __len__(self):
+        return len(self.events)
+
+    #Start recording the removals made in the grid (a trace records a single solve, the passes of another one would start again from 1)
+    def attach(self, grid):
+        if self.start is not None:
+            raise ValueError("the trace has already recorded a solve")
+        self.start = array("H", grid.cells)
+        grid.trace = self
+
+    def detach(self, grid):
+        grid.trace = None
+        self._current = 0
+
+    #Called by CandidateGrid.eliminate : the digits of removed were taken out of the cell, left are the candidates still there
+    def record(self, cell, removed, left):
+        base = self._current | cell << 4
+        events = self.events
+        for d in DIGITS[removed]:
+            events.append(base | d)
+        if POPCOUNT[left] == 1:
+            events.append(base | PLACEMENT | VALUE[left])
+
+    #Same interface as SolveStats for the scheduler of human_solve : run method(grid, *args), its events being marked with its name and the pass
+    def run(self, step, name, method, grid, *args):
+        strategy = self._ids.get(name)
+        if strategy is None:
+            if len(self.strategies) == MAX_STRATEGIES:
+                raise ValueError("a trace can't record more than " + str(MAX_STRATEGIES - 1) + " methods")
+            strategy = self._ids[name] = len(self.strategies)
+            self.strategies.append(name)
+        self._current = min(step, 0xFFFF) << 16 | strategy << 12
+        try:
+            if self.stats is None:
+                return method(grid, *args)
+            return self.stats.run(step, name, method, grid, *args)
+        finally:
+            self._current = 0
+
+    def end_pass(self, grid):
+        if self.stats is not None:
+            self.stats.end_pass(grid)
+
+    #The event at index i, unpacked
+    def event(self, i):
+        e = self.events[i]
+        return TraceEvent(self.strategies[e >> 12 & 15], e >> 4 & 127, e & 15, e >> 16, bool(e & PLACEMENT))
+
+    def __iter__(self):
+        for i in range(len(self.events)):
+            yield self.event(i)
+
+    #The grid after the first n events (all of them by default), rebuilt from the start of the trace
+    def grid(self, n=None):
+        cells = array("H", self.start)
+        for e in self.events[:n]:
+            if not e & PLACEMENT:
+                cells[e >> 4 & 127] &= ~BIT[e & 15]
+        return CandidateGrid(cells)
+
+    #Number of events recorded up to the end of the pass (the events are recorded in the order of the passes)
+    def pass_end(self, step):
+        return bisect_right(self.events, step << 16 | 0xFFFF)
+
+    #The grid at the end of a pass (0 for the grid before the first pass)
+    def grid_after(self, step):
+        return self.grid(self.pass_end(step))
+
+    #One line per event, to explain the solve : "pass 3, naked_subsets : r1c5 <> 7" or "pass 3, propagate : r1c5 = 7"
+    def explain(self, start=0, stop=None):
+        lines = []
+        for i in range(start, len(self.events) if stop is None else min(stop, len(self.events))):
+            event = self.event(i)
+            cell = "r" + str(event.cell // 9 + 1) + "c" + str(event.cell % 9 + 1)
+            lines.append("pass " + str(event.step) + ", " + event.strategy + " : " + cell + (" = " if event.placement else " <> ") + str(event.digit))
+        return lines
@@ -0,0 +1,130 @@
+#Propagation of many puzzles at once with NumPy
+#Most puzzles of a collection are solved by singles alone, and running Python loops over the cells of every puzzle is much slower than
+#applying each rule to the whole batch with array operations
+#The candidates of N puzzles are a boolean array of shape (N, 81, 9) : candidates[n, c, d-1] is True if d is a candidate of the cell c of the puzzle n
+#Each sweep applies, to every puzzle at once, the logic of :
+#- simple_elimination : digits of solved cells are removed from the other cells of their units
+#- hidden_singles : a digit with a single position in a unit is placed there
+#- pointing_pairs and box_line_reduction : a digit confined to a box/line segment in the box (or in the line) is removed from the rest of the line (or of the box)
+#Every deduction of a sweep is made from the same state, so they can all be applied together
+#Sweeps are repeated on the puzzles that changed until every puzzle is solved, stalled (no more progress) or contradicted,
+#and the stalled puzzles can then be finished by one of the search backends of solver.py
+import numpy as np
+
+from .topology import UNITS, CELL_UNITS, SEGMENTS
+from .boards import board_from_string, board_to_string
+from . import solver
+
+#Index tables for the array operations, built once at import
+#UNIT_CELLS[u] are the cells of the unit u
+UNIT_CELLS = np.array(UNITS, dtype=np.intp)
+#CELL_UNITS_INDEX[c] are the 3 units of the cell c, and CELL_POSITIONS[c] the position of c in each of them
+CELL_UNITS_INDEX = np.array(CELL_UNITS, dtype=np.intp)
+CELL_POSITIONS = np.array([[UNITS[u].index(c) for u in CELL_UNITS[c]] for c in range(81)], dtype=np.intp)
+#Segments : cells, box unit and line unit of each of the 54 segments
+SEGMENT_CELLS = np.array([segment[2] for segment in SEGMENTS], dtype=np.intp)
+SEGMENT_BOX = np.array([segment[0] for segment in SEGMENTS], dtype=np.intp)
+SEGMENT_LINE = np.array([segment[1] for segment in SEGMENTS], dtype=np.intp)
+#For each cell, the 4 segments whose rest of the line contains the cell, and the 4 segments whose rest of the box contains the cell
+CELL_LINE_REST = np.array([[s for s in range(54) if c in SEGMENTS[s][4]] for c in range(81)], dtype=np.intp)
+CELL_BOX_REST = np.array([[s for s in range(54) if c in SEGMENTS[s][3]] for c in range(81)], dtype=np.intp)
+
+#Candidates of a batch of puzzles given as a uint8 array of shape (N, 81) with 0 for the empty cells (see corpus.py)
+def candidates_from_digits(digits):
+    digits = np.asarray(digits, dtype=np.uint8)
+    candidates = digits[:, :, None] == np.arange(1, 10, dtype=np.uint8)
+    candidates[digits == 0] = True
+    return candidates
+
+def candidates_from_strings(puzzles):
+    digits = np.frombuffer("".join(puzzles).replace(".", "0").encode("ascii"), dtype=np.uint8).reshape(-1, 81) - ord("0")
+    return candidates_from_digits(digits)
+
+#One sweep over a batch : return the new candidates and a flag for each puzzle that can't be solved
+def _sweep(candidates):
+    counts = candidates.sum(2)
+    solved = counts == 1
+    #Candidates of each unit : shape (N, 27, 9 cells, 9 digits)
+    units = candidates[:, UNIT_CELLS, :]
+    positions = units.sum(2)
+    #Simple elimination : digits placed in the units of each cell are removed from the unsolved cells
+    placed = (units & solved[:, UNIT_CELLS, None]).sum(2)
+    placed_near = (placed[:, CELL_UNITS_INDEX, :] > 0).any(2)
+    #Hidden singles : the cell of a unit that holds the only position of a digit
+    single = units & (positions == 1)[:, :, None, :]
+    hidden = single[:, CELL_UNITS_INDEX, CELL_POSITIONS, :].any(2)
+    #Intersection removal : digits confined to a segment within the box (pointing) or within the line (box/line reduction)
+    in_segment = candidates[:, SEGMENT_CELLS, :].sum(2)
+    occupied = in_segment > 0
+    pointing = occupied & (in_segment == positions[:, SEGMENT_BOX, :])
+    box_line = occupied & (in_segment == positions[:, SEGMENT_LINE, :])
+    removed = pointing[:, CELL_LINE_REST, :].any(2) | box_line[:, CELL_BOX_REST, :].any(2)
+    #Apply everything : solved cells keep their digit, hidden singles replace the candidates of their cell
+    new = candidates & ~((placed_near | removed) & ~solved[:, :, None])
+    has_hidden = hidden.any(2)
+    new = np.where(has_hidden[:, :, None], new & hidden, new)
+    #Contradictions : a digit placed twice or missing from a unit, a cell required to hold two digits or left without candidates
+    broken = ((placed > 1) | (positions == 0)).any((1, 2)) | (hidden.sum(2) > 1).any(1) | ~new.any(2).all(1)
+    return new, broken
+
+#Result of the propagation of a batch
+class BatchPropagation:
+    __slots__ = ("candidates", "solved", "contradiction", "stalled", "sweeps")
+
+    def __init__(self, candidates, contradiction, sweeps):
+        self.candidates = candidates
+        self.contradiction = contradiction
+        self.solved = ~contradiction & (candidates.sum(2) == 1).all(1)
+        #Puzzles that reached a fixed point without being solved : a search has to take over
+        self.stalled = ~contradiction & ~self.solved
+        self.sweeps = sweeps
+
+    def __len__(self):
+        return len(self.candidates)
+
+    #Digits of the solved cells (0 for the others) as a uint8 array of shape (N, 81)
+    def digits(self):
+        single = self.candidates.sum(2) == 1
+        return np.where(single, self.candidates.argmax(2) + 1, 0).astype(np.uint8)
+
+    #Puzzles as strings of 81 digits with 0s for the unsolved cells
+    def strings(self):
+        chars = (self.digits() + ord("0")).tobytes().decode("ascii")
+        return [chars[i:i+81] for i in range(0, len(chars), 81)]
+
+#Propagate a batch of puzzles (candidates array of shape (N, 81, 9), see candidates_from_digits) until every puzzle reaches a fixed point
+#Only the puzzles that changed during the last sweep are swept again
+def propagate_batch(candidates, max_sweeps=None):
+    candidates = np.array(candidates, dtype=bool)
+    contradiction = np.zeros(len(candidates), dtype=bool)
+    active = np.arange(len(candidates))
+    sweeps = 0
+    while len(active) and (max_sweeps is None or sweeps < max_sweeps):
+        current = candidates[active]
+        new, broken = _sweep(current)
+        sweeps += 1
+        changed = (new != current).any((1, 2))
+        candidates[active] = new
+        contradiction[active[broken]] = True
+        #Puzzles that are broken, solved or didn't change are done
+        active = active[changed & ~broken]
+    return BatchPropagation(candidates, contradiction, sweeps)
+
+#Solve a batch of puzzles (strings of 81 characters) : propagation for the whole batch, then a search backend for the stalled puzzles
+#Return the solutions as strings, or None for the puzzles without solution
+def solve_batch(puzzles, backend="mrv"):
+    result = propagate_batch(candidates_from_strings(puzzles))
+    solutions = []
+    for k, numbers in enumerate(result.strings()):
+        if result.contradiction[k]:
+            solutions.append(None)
+        elif result.solved[k]:
+            solutions.append(numbers)
+        else:
+            #The search starts from the cells solved by the propagation
+            solution = None
+            for board in solver.solutions(board_from_string(numbers), backend):
+                solution = board_to_string(board)
+                break
+            solutions.append(solution)
+    return solutions
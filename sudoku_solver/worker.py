@@ -0,0 +1,146 @@
+#Solving in the background, for the graphical interface (see gui.py) : the window has to keep drawing and answering while a puzzle is solved
+#The worker runs in a thread and posts what it finds to a queue, that the window empties at its own pace :
+#- the human methods run in the thread, every removal goes through a Trace (see trace.py) that buffers the events and checks for a cancel
+#- if they get stuck, the search runs in a child process : a search can't be interrupted from the inside, but the process can be stopped
+#Messages (tuples) :
+#- ("events", [(cell, removed mask, candidates left), ...]) : candidates removed by the human methods, in order
+#- ("status", text) : what the worker is doing
+#- ("solution", string of 81 digits) : the solution found by the search
+#- ("done", solved) : the end, solved is True if every cell has a single digit
+#- ("cancelled",) or ("error", text) : the worker stopped early
+import multiprocessing
+import queue
+import threading
+
+from .boards import board_from_string, board_to_string, puzzle_string
+from .candidate_grid import CandidateGrid, Contradiction
+from .human_solve import solve
+from .trace import Trace
+from . import solver
+
+#Events sent to the queue at once : a message per removal would cost more than the removal itself
+BATCH = 256
+
+class Cancelled(Exception):
+    pass
+
+#Trace that doesn't keep the events but sends them to the queue by batches, and stops the solve when the worker is cancelled
+class _Reporter(Trace):
+    __slots__ = ("messages", "cancel", "buffer")
+
+    def __init__(self, messages, cancel):
+        Trace.__init__(self)
+        self.messages = messages
+        self.cancel = cancel
+        self.buffer = []
+
+    def record(self, cell, removed, left):
+        if self.cancel.is_set():
+            raise Cancelled()
+        self.buffer.append((cell, removed, left))
+        if len(self.buffer) >= BATCH:
+            self.flush()
+
+    def end_pass(self, grid):
+        self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.messages.put(("events", self.buffer))
+            self.buffer = []
+
+#Work done by the child process : the first solution of the board (string of 81 digits), or None
+def _search(numbers, backend, connection):
+    solution = next(solver.solutions(board_from_string(numbers), backend), None)
+    connection.send(None if solution is None else board_to_string(solution))
+    connection.close()
+
+class SolveWorker:
+    __slots__ = ("puzzle", "backend", "search", "messages", "cancel", "thread", "poll")
+
+    #puzzle : a board or a string of 81 characters
+    #search : finish with the search backend when the human methods are stuck
+    #poll : how often (in seconds) the thread checks for a cancel while the search process runs
+    def __init__(self, puzzle, backend="mrv", search=True, poll=0.05):
+        solver.get_backend(backend)
+        self.puzzle = puzzle_string(puzzle)
+        self.backend = backend
+        self.search = search
+        self.messages = queue.Queue()
+        self.cancel = threading.Event()
+        self.thread = None
+        self.poll = poll
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="sudoku-solver", daemon=True)
+        self.thread.start()
+        return self
+
+    #Ask the worker to stop, it posts ("cancelled",) when it has
+    def stop(self):
+        self.cancel.set()
+
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    #Wait for the end of the worker (for the tests and the scripts, the window never waits)
+    def join(self, timeout=None):
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    #The messages posted so far, at most limit of them (None for all), without waiting
+    def drain(self, limit=None):
+        found = []
+        while limit is None or len(found) < limit:
+            try:
+                found.append(self.messages.get_nowait())
+            except queue.Empty:
+                break
+        return found
+
+    def _run(self):
+        messages = self.messages
+        try:
+            messages.put(("status", "human methods"))
+            grid = CandidateGrid.from_string(self.puzzle)
+            reporter = _Reporter(messages, self.cancel)
+            try:
+                grid, _ = solve(grid, trace=reporter)
+            finally:
+                reporter.flush()
+            if grid.unsolved and self.search:
+                messages.put(("status", "search (" + self.backend + ")"))
+                solution = self._search(grid.to_string())
+                if solution is None:
+                    raise Contradiction("the puzzle has no solution")
+                messages.put(("solution", solution))
+                messages.put(("done", True))
+            else:
+                messages.put(("done", not grid.unsolved))
+        except Cancelled:
+            messages.put(("cancelled",))
+        except Contradiction as error:
+            messages.put(("error", str(error)))
+        #Any other failure must end the worker with a message too, the window waits for one
+        except Exception as error:
+            messages.put(("error", type(error).__name__ + " : " + str(error)))
+
+    #Run the search in a child process, stopping it if the worker is cancelled
+    #The process is started with "spawn" : forking a process with a Tk window and a thread running isn't safe
+    def _search(self, numbers):
+        context = multiprocessing.get_context("spawn")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_search, args=(numbers, self.backend, sender), daemon=True)
+        process.start()
+        sender.close()
+        try:
+            while not receiver.poll(self.poll):
+                if self.cancel.is_set():
+                    process.terminate()
+                    raise Cancelled()
+                if not process.is_alive() and not receiver.poll():
+                    raise Contradiction("the search process stopped without an answer")
+            return receiver.recv()
+        finally:
+            process.join()
+            receiver.close()
@@ -0,0 +1,130 @@
+import io
+import os
+import tempfile
+import unittest
+from sudoku_solver import batch
+from sudoku_solver.batch import solve_file, rate_file, rate_puzzle, NO_SOLUTION, INVALID
+from sudoku_solver.store import ResultStore
+from sudoku_solver.cache import RESULTS
+from sudoku_solver.boards import puzzle_string
+
+PUZZLES = ["860004000000900800304000067620045791539081406007029000003006000050400089000507602",
+           "1..685.7..6..1....59...4.6...7.6.....1......76...9.254....73.91....5...68.....3..",
+           "11" + "0"*79,
+           "12345"]
+SOLUTIONS = ["865274913172963854394158267628345791539781426417629538243896175756412389981537642",
+             "132685479764219538598734162427568913915342687683197254256473891349851726871926345",
+             NO_SOLUTION,
+             INVALID]
+
+class TestBatch(unittest.TestCase):
+
+    def run_batch(self, **options):
+        source = io.StringIO("# comment line\n" + "\n".join(PUZZLES) + "\n\n")
+        output = io.StringIO()
+        report = solve_file(source, output, chunksize=1, **options)
+        return report, output.getvalue().splitlines()
+
+    def test_ordered(self):
+        for workers in [1, 2]:
+            report, lines = self.run_batch(workers=workers)
+            self.assertEqual(lines, SOLUTIONS)
+            self.assertEqual(report.puzzles, 4)
+            self.assertEqual(report.solved, 2)
+
+    def test_unordered(self):
+        #The lines can come in any order but are prefixed with the position of the puzzle
+        _, lines = self.run_batch(workers=2, ordered=False)
+        results = dict(line.split(" ", 1) for line in lines)
+        self.assertEqual([results[str(k)] for k in range(4)], SOLUTIONS)
+
+    def test_backend(self):
+        #In this process the cache of the results would give the solutions found by the other tests
+        RESULTS.clear()
+        _, lines = self.run_batch(workers=1, backend="dlx")
+        self.assertEqual(lines, SOLUTIONS)
+
+    def test_rate_file(self):
+        for workers in [1, 2]:
+            output = io.StringIO()
+            summary = rate_file(PUZZLES, output, workers=workers, chunksize=1)
+            self.assertEqual((summary.puzzles, summary.invalid, summary.no_solution), (4, 1, 1))
+            self.assertEqual(summary.levels[:2], [1, 1])
+            lines = output.getvalue().splitlines()
+            self.assertEqual(lines[2:], [NO_SOLUTION, INVALID])
+            self.assertTrue(lines[0].startswith("singles 1 "))
+        #Without an output only the summary is made
+        self.assertEqual(rate_file(PUZZLES, workers=1).as_dict(), summary.as_dict())
+
+class TestBatchStore(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = ResultStore(os.path.join(directory.name, "results.db"))
+        self.addCleanup(self.store.close)
+
+    def run_batch(self, source, **options):
+        output = io.StringIO()
+        report = solve_file(source, output, workers=1, chunksize=1, store=self.store, run="test", commit_every=2, **options)
+        return report, output.getvalue().splitlines()
+
+    def test_store(self):
+        report, lines = self.run_batch(PUZZLES, rate=True)
+        self.assertEqual(lines, SOLUTIONS)
+        self.assertEqual(report.known, 0)
+        results = {result.puzzle: result for result in self.store.results()}
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[PUZZLES[0]].solution, SOLUTIONS[0])
+        self.assertEqual(results[PUZZLES[0]].count, 1)
+        self.assertEqual(results[PUZZLES[0]].rating, "singles")
+        self.assertEqual(results["11" + "0"*79].count, 0)
+        self.assertEqual(self.store.position("test"), 4)
+        #The second time every valid puzzle is read from the store
+        report, lines = self.run_batch(PUZZLES)
+        self.assertEqual(lines, SOLUTIONS)
+        self.assertEqual(report.known, 3)
+
+    def test_resume(self):
+        def crashing():
+            yield from PUZZLES[:3]
+            raise KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            self.run_batch(crashing())
+        #The third puzzle was solved after the last commit
+        self.assertEqual(self.store.position("test"), 2)
+        self.assertEqual(len(self.store), 2)
+        report, lines = self.run_batch(PUZZLES, resume=True)
+        self.assertEqual(lines, SOLUTIONS[2:])
+        self.assertEqual((report.puzzles, report.known), (2, 0))
+        self.assertEqual(self.store.position("test"), 4)
+
+    def test_readers_closed(self):
+        self.run_batch(PUZZLES)
+        self.assertEqual(batch._readers, {})
+
+    def test_rate_later(self):
+        #The puzzles stored without a rating are rated by a run with --rate, even when it resumes
+        def crashing():
+            yield from PUZZLES[:3]
+            raise KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            self.run_batch(crashing())
+        report, lines = self.run_batch(PUZZLES, resume=True, rate=True)
+        self.assertEqual(lines, SOLUTIONS)
+        self.assertEqual((report.puzzles, report.known), (4, 0))
+        ratings = {result.puzzle: result.rating for result in self.store.results()}
+        self.assertEqual(ratings, {PUZZLES[0]: "singles", puzzle_string(PUZZLES[1]): rate_puzzle(PUZZLES[1]), "11" + "0"*79: None})
+        self.assertFalse(self.store.unrated())
+        #Everything is rated now, so the next resumed run skips what was done
+        report, lines = self.run_batch(PUZZLES, resume=True, rate=True)
+        self.assertEqual(lines, [])
+
+    def test_rating(self):
+        self.assertEqual(rate_puzzle(PUZZLES[0]), "singles")
+        self.assertEqual(rate_puzzle("11" + "0"*79), None)
+        self.assertEqual(rate_puzzle("0" * 81), "search")
+
+
+if __name__ == '__main__':
+    unittest.main()
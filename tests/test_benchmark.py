@@ -0,0 +1,28 @@
+import unittest
+from benchmarks.bench import grid_fixtures, benchmarks, measure, compare
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_fixtures(self):
+        fixtures = grid_fixtures()
+        self.assertIn("test_xwing.test_grid_rows", fixtures)
+        for grid in fixtures.values():
+            self.assertEqual(len(grid), 9)
+
+    def test_measure(self):
+        benchmark = [b for b in benchmarks() if b.name == "method/naked_pairs/test_naked_candidates.test_grid"][0]
+        result = measure(benchmark, min_time=0.001, repeat=1)
+        self.assertGreater(result["calls"], 0)
+        self.assertGreater(result["ns_per_call"], 0)
+        self.assertEqual(result["removed"], 14)
+        self.assertIn("peak_kib", result)
+
+    def test_compare(self):
+        old = {"results": {"a": {"ns_per_call": 100.0}, "b": {"ns_per_call": 100.0}, "c": {"ns_per_call": 100.0}}}
+        new = {"results": {"a": {"ns_per_call": 105.0}, "b": {"ns_per_call": 150.0}, "d": {"ns_per_call": 1.0}}}
+        rows, regressions = compare(old, new, 0.1)
+        self.assertEqual([row[0] for row in rows], ["a", "b"])
+        self.assertEqual(regressions, ["b"])
+
+if __name__ == '__main__':
+    unittest.main()
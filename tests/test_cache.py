@@ -0,0 +1,142 @@
+import unittest
+from unittest import mock
+from sudoku_solver.cache import ResultCache, RESULTS, PuzzleResult
+from sudoku_solver.candidate_grid import CandidateGrid, Contradiction
+from sudoku_solver.human_solve import solve
+from sudoku_solver.boards import board_from_string, board_to_string
+from sudoku_solver.solver import solve_with, solutions, count_solutions, has_unique_solution, easy, two_sols, BACKENDS
+
+PUZZLE = "100685070060010000590004060007060000010000007600090254000073091000050006800000300"
+
+class TestResultCache(unittest.TestCase):
+
+    def test_lru(self):
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        #b is the least recently used
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.metrics()["hits"], 1)
+        self.assertEqual(cache.metrics()["misses"], 1)
+        self.assertEqual(cache.metrics()["evictions"], 1)
+
+    def test_memory_ceiling(self):
+        cache = ResultCache(max_bytes=2000)
+        for i in range(100):
+            cache.put(str(i), "x" * 81)
+        self.assertLessEqual(cache.bytes, 2000)
+        self.assertIn("99", cache)
+        self.assertEqual(len(cache) + cache.evictions, 100)
+        cache.configure(max_entries=1)
+        self.assertEqual(len(cache), 1)
+
+    def test_usable(self):
+        cache = ResultCache()
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a", lambda value: value > 1))
+        self.assertEqual(cache.metrics()["misses"], 1)
+
+class TestSolverCache(unittest.TestCase):
+
+    def setUp(self):
+        RESULTS.configure(enabled=True)
+        RESULTS.clear()
+        RESULTS.reset_metrics()
+
+    def test_solve_with(self):
+        board = [row[:] for row in easy]
+        self.assertTrue(solve_with(board))
+        self.assertEqual(RESULTS.metrics()["hits"], 0)
+        again = [row[:] for row in easy]
+        self.assertTrue(solve_with(again))
+        self.assertEqual(again, board)
+        self.assertEqual(RESULTS.metrics()["hits"], 1)
+        #The number of solutions isn't known yet, another backend could find another solution
+        self.assertTrue(solve_with([row[:] for row in easy], "dlx"))
+        self.assertEqual(RESULTS.metrics()["hits"], 1)
+        with self.assertRaises(ValueError):
+            solve_with(again, "quantum")
+
+    def test_uniqueness(self):
+        self.assertTrue(has_unique_solution(easy))
+        self.assertEqual(RESULTS.peek(board_to_string(easy)).count, 1)
+        self.assertEqual(list(solutions(easy)), [next(solutions(easy, "dlx"))])
+        self.assertEqual(count_solutions(two_sols, limit=2), 2)
+        self.assertEqual(RESULTS.peek(board_to_string(two_sols)).count, 2)
+        hits = RESULTS.hits
+        self.assertFalse(has_unique_solution(two_sols))
+        self.assertEqual(RESULTS.hits, hits + 1)
+        #Enumerating every solution still searches
+        self.assertEqual(count_solutions(two_sols), 2)
+
+    def test_string_puzzle(self):
+        solution = board_to_string(next(solutions(board_from_string(PUZZLE))))
+        for backend in BACKENDS:
+            for enabled in (False, True):
+                RESULTS.configure(enabled=enabled)
+                RESULTS.clear()
+                self.assertEqual(list(solutions(PUZZLE, backend)), [solution])
+                self.assertEqual(count_solutions("0" * 81, limit=2, backend=backend), 2)
+                self.assertEqual(count_solutions(PUZZLE, backend=backend), 1)
+        RESULTS.configure(enabled=True)
+        self.assertEqual(RESULTS.peek(PUZZLE), PuzzleResult(solution, "hybrid", 1))
+        board = board_from_string(PUZZLE)
+        self.assertTrue(solve_with(board, "backtrack"))
+        self.assertEqual(board_to_string(board), solution)
+        with self.assertRaises(TypeError):
+            solve_with(PUZZLE)
+
+    def test_conflicting_givens(self):
+        #The solution of easy with two 8s in the first row
+        board = [row[:] for row in easy]
+        self.assertTrue(solve_with(board))
+        board[0][1] = 8
+        RESULTS.clear()
+        for backend in ("backtrack", "mrv", "dlx"):
+            self.assertEqual(count_solutions(board, backend=backend), 0)
+            self.assertFalse(has_unique_solution(board, backend))
+        #A wrong solution given by a backend isn't shared with the others
+        RESULTS.clear()
+        with mock.patch.dict(BACKENDS, wrong=lambda board: iter([[row[:] for row in board]])):
+            self.assertEqual(count_solutions(board, backend="wrong"), 1)
+        self.assertIsNone(RESULTS.peek(board_to_string(board)))
+        self.assertEqual(count_solutions(board, backend="mrv"), 0)
+        self.assertFalse(has_unique_solution(board, "dlx"))
+
+    def test_no_solution(self):
+        board = board_from_string("11" + "0" * 79)
+        self.assertEqual(count_solutions(board), 0)
+        self.assertEqual(RESULTS.peek("11" + "0" * 79), PuzzleResult(None, None, 0))
+        self.assertEqual(list(solutions(board)), [])
+        self.assertEqual(RESULTS.metrics()["hits"], 1)
+
+    def test_disabled(self):
+        RESULTS.configure(enabled=False)
+        try:
+            solve_with([row[:] for row in easy])
+            self.assertEqual(len(RESULTS), 0)
+        finally:
+            RESULTS.configure(enabled=True)
+
+    def test_human_solve(self):
+        grid, steps = solve(CandidateGrid.from_string(PUZZLE))
+        cached, cached_steps = solve(CandidateGrid.from_string(PUZZLE))
+        self.assertEqual(cached, grid)
+        self.assertEqual(cached_steps, steps)
+        self.assertEqual(cached.unsolved, 0)
+        self.assertEqual(RESULTS.metrics()["hits"], 1)
+        #The mode is part of the key
+        solve(CandidateGrid.from_string(PUZZLE), "sweep")
+        self.assertEqual(RESULTS.metrics()["hits"], 1)
+
+    def test_human_contradiction(self):
+        for _ in range(2):
+            with self.assertRaises(Contradiction):
+                solve(CandidateGrid.from_string("11" + "0" * 79))
+        self.assertEqual(RESULTS.metrics()["hits"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
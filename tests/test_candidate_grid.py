@@ -0,0 +1,45 @@
+import unittest
+from sudoku_solver.candidate_grid import CandidateGrid, Contradiction, ALL_DIGITS, BIT
+from sudoku_solver.propagation import propagate
+from sudoku_solver.human_solve import grid_from_string, fill_candidates, cells_solved, candidates_left
+
+class TestCandidateGrid(unittest.TestCase):
+
+    def test_list_round_trip(self):
+        #Converting a list grid to a CandidateGrid and back should give the same grid
+        grid = fill_candidates(grid_from_string("100685070060010000590004060007060000010000007600090254000073091000050006800000300"))
+        grid[0][1] = [2, 3]
+        self.assertEqual(CandidateGrid.from_list(grid).to_list(), grid)
+
+    def test_empty_cell(self):
+        #Only a cell containing a 0 gets all the candidates, a cell without any candidate is a contradiction
+        grid = grid_from_string("860004000000900800304000067620045791539081406007029000003006000050400089000507602")
+        self.assertEqual(CandidateGrid.from_list(grid).cells[2], ALL_DIGITS)
+        grid = fill_candidates(grid)
+        grid[0][2] = []
+        candidates = CandidateGrid.from_list(grid)
+        self.assertEqual(candidates.to_list(), grid)
+        with self.assertRaises(Contradiction):
+            propagate(candidates)
+
+    def test_from_string(self):
+        #Building from a string should be the same as grid_from_string followed by fill_candidates
+        numbers = "860004000000900800304000067620045791539081406007029000003006000050400089000507602"
+        grid = CandidateGrid.from_string(numbers)
+        self.assertEqual(grid, CandidateGrid.from_list(fill_candidates(grid_from_string(numbers))))
+        self.assertEqual(grid.to_string(), numbers)
+        self.assertEqual(cells_solved(grid), cells_solved(grid.to_list()))
+        self.assertEqual(candidates_left(grid), candidates_left(grid.to_list()))
+
+    def test_eliminate_and_assign(self):
+        #Removing candidates should return the number of candidates actually removed
+        grid = CandidateGrid()
+        self.assertEqual(grid.eliminate(0, BIT[1] | BIT[2]), 2)
+        self.assertEqual(grid.eliminate(0, BIT[1]), 0)
+        self.assertEqual(grid.cells[0], ALL_DIGITS & ~(BIT[1] | BIT[2]))
+        self.assertEqual(grid.assign(0, BIT[5]), 6)
+        self.assertEqual(grid.to_list()[0][0], [5])
+
+
+if __name__ == '__main__':
+    unittest.main()
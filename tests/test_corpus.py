@@ -0,0 +1,55 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+try:
+    import numpy
+    from sudoku_solver.corpus import PuzzleCorpus
+except ImportError:
+    numpy = None
+
+PUZZLES = ["860004000000900800304000067620045791539081406007029000003006000050400089000507602",
+           "1..685.7..6..1....59...4.6...7.6.....1......76...9.254....73.91....5...68.....3..",
+           "586400003000080004000900007000000040000009720030050001700000060050032000200060000"]
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestCorpus(unittest.TestCase):
+
+    def write(self, separator, last=True):
+        f = tempfile.NamedTemporaryFile("wb", suffix=".txt", delete=False)
+        f.write(separator.join(PUZZLES).encode() + (separator.encode() if last else b""))
+        f.close()
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def test_separators(self):
+        for separator in ["\n", "\r\n", ""]:
+            for last in [True, False]:
+                corpus = PuzzleCorpus(self.write(separator, last))
+                self.assertEqual(len(corpus), 3)
+                self.assertEqual(corpus.records.shape, (3, 81))
+                self.assertEqual(corpus.strings(), [p.replace(".", "0") for p in PUZZLES])
+
+    def test_digits(self):
+        corpus = PuzzleCorpus(self.write("\n"))
+        digits = corpus[1:2]
+        self.assertEqual(digits.dtype, numpy.uint8)
+        self.assertEqual(digits[0].tolist(), [int(n) for n in PUZZLES[1].replace(".", "0")])
+
+    def test_shards(self):
+        corpus = PuzzleCorpus(self.write("\n"))
+        shards = corpus.shards(2)
+        self.assertEqual([len(shard) for shard in shards], [1, 2])
+        self.assertEqual(shards[0].strings() + shards[1].strings(), corpus.strings())
+        #A shard is sent to another process by path and bounds only
+        copy = pickle.loads(pickle.dumps(shards[1]))
+        self.assertEqual(copy.strings(), shards[1].strings())
+
+    def test_bad_size(self):
+        with self.assertRaises(ValueError):
+            PuzzleCorpus(self.write("\n\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from sudoku_solver import dlx
+from sudoku_solver.boards import board_from_string
+
+class TestDLX(unittest.TestCase):
+
+    def test_string_and_board(self):
+        #The solutions come back in the same format as the puzzle
+        puzzle = "860004000000900800304000067620045791539081406007029000003006000050400089000507602"
+        solution = "865274913172963854394158267628345791539781426417629538243896175756412389981537642"
+        self.assertEqual(dlx.solve(puzzle), solution)
+        self.assertEqual(dlx.solve(puzzle.replace("0", ".")), solution)
+        self.assertEqual(dlx.solve(board_from_string(puzzle)), board_from_string(solution))
+
+    def test_count(self):
+        #two_sols from solver.py
+        puzzle = "906070403000400200070023010500000100040208060003000005030700050007005000405010708"
+        self.assertEqual(dlx.count(puzzle), 2)
+        self.assertEqual(dlx.count(puzzle, limit=1), 1)
+        self.assertEqual(len(list(dlx.solutions(puzzle))), 2)
+
+    def test_low_clues(self):
+        #17 clues, the minimum for a unique solution
+        self.assertEqual(dlx.count("000000010400000000020000000000050407008000300001090000300400200050100000000806000"), 1)
+
+    def test_no_solution(self):
+        self.assertIsNone(dlx.solve("11" + "0"*79))
+        self.assertEqual(dlx.count("11" + "0"*79), 0)
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            dlx.solve("123")
+
+
+if __name__ == '__main__':
+    unittest.main()
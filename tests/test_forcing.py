@@ -0,0 +1,102 @@
+import unittest
+from sudoku_solver.human_solve import forcing, _scheduled, _sweep, STRATEGIES
+from sudoku_solver.rating import LEVELS, grade
+from sudoku_solver.candidate_grid import CandidateGrid, BIT, POPCOUNT
+from sudoku_solver.trace import Trace
+
+#A puzzle that the other methods can't finish
+PUZZLE = "000000604300701500000060080006003009017902350500800200080030000009105008601000000"
+SOLUTION = "178259634364781592925364187246513879817942356593876241482637915739125468651498723"
+#A puzzle where forcing has to try cells far from the last changes
+FAR = "008000401200507000006040000000700105050300070000000086080009000400000002000083640"
+
+def stuck_grid():
+    grid = CandidateGrid.from_string(PUZZLE)
+    _scheduled(grid, None, STRATEGIES[:-1])
+    return grid
+
+class TestForcing(unittest.TestCase):
+
+    def test_forcing(self):
+        grid = stuck_grid()
+        left = grid.remaining
+        self.assertGreater(grid.unsolved, 0)
+        grid, removed = forcing(grid)
+        self.assertGreater(removed, 0)
+        self.assertEqual(grid.remaining, left - removed)
+        #Only wrong candidates are removed
+        self.assertTrue(all(grid.cells[i] & BIT[int(d)] for i, d in enumerate(SOLUTION)))
+        #The counters are the same as for a new grid with these candidates
+        fresh = CandidateGrid(grid.cells)
+        self.assertEqual((grid.counts, grid.unsolved), (fresh.counts, fresh.unsolved))
+        self.assertIsNone(grid.trail)
+
+    def test_bounded(self):
+        grid = stuck_grid()
+        _, removed = forcing(grid, max_cells=0)
+        self.assertEqual(removed, 0)
+
+    def test_solve(self):
+        grid = CandidateGrid.from_string(PUZZLE)
+        _scheduled(grid)
+        self.assertEqual(grid.to_string(), SOLUTION)
+
+    def test_far_from_changes(self):
+        scheduled = CandidateGrid.from_string(FAR)
+        _scheduled(scheduled)
+        sweep = CandidateGrid.from_string(FAR)
+        _sweep(sweep)
+        self.assertEqual(scheduled.unsolved, 0)
+        self.assertEqual(scheduled, sweep)
+        self.assertEqual(LEVELS[grade(FAR)], "forcing")
+
+    def test_list_format(self):
+        grid = stuck_grid()
+        expected, removed = forcing(grid.copy())
+        grid_list, removed_list = forcing(grid.to_list())
+        self.assertEqual(removed_list, removed)
+        self.assertEqual(grid_list, expected.to_list())
+
+    def test_trace(self):
+        grid = stuck_grid()
+        trace = Trace()
+        trace.attach(grid)
+        _, removed = forcing(grid)
+        trace.detach(grid)
+        #Only the candidates actually removed are recorded, not the trials
+        self.assertEqual(sum(1 for event in trace if not event.placement), removed)
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_rollback(self):
+        grid = stuck_grid()
+        before = grid.copy()
+        counts = grid.counts.tobytes()
+        outer = grid.snapshot()
+        cell = next(i for i in range(81) if POPCOUNT[grid.cells[i]] == 2)
+        grid.assign(cell, grid.cells[cell] & -grid.cells[cell])
+        inner = grid.snapshot()
+        other = next(i for i in range(81) if POPCOUNT[grid.cells[i]] > 1)
+        grid.assign(other, grid.cells[other] & -grid.cells[other])
+        self.assertEqual(grid.changes(inner), {other: before.cells[other] & ~grid.cells[other]})
+        self.assertEqual(set(grid.changes(outer)), {cell, other})
+        grid.rollback(inner)
+        self.assertIsNotNone(grid.trail)
+        grid.rollback(outer)
+        self.assertIsNone(grid.trail)
+        self.assertEqual(grid, before)
+        self.assertEqual((grid.counts.tobytes(), grid.unsolved, grid.remaining), (counts, before.unsolved, before.remaining))
+
+    def test_release(self):
+        grid = stuck_grid()
+        snapshot = grid.snapshot()
+        cell = next(i for i in range(81) if POPCOUNT[grid.cells[i]] == 2)
+        grid.assign(cell, grid.cells[cell] & -grid.cells[cell])
+        grid.release(snapshot)
+        self.assertIsNone(grid.trail)
+        self.assertEqual(POPCOUNT[grid.cells[cell]], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import io
+import random
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from sudoku_solver.generator import generate, make_puzzle, random_grid, main, _attempt_chunks, _orbits, SYMMETRIES
+from sudoku_solver.rating import LEVELS, grade
+from sudoku_solver.solver import count_solutions
+from sudoku_solver.boards import board_from_string
+
+def is_solved_grid(numbers):
+    board = board_from_string(numbers)
+    units = [board[i] for i in range(9)] + [[board[i][j] for i in range(9)] for j in range(9)]
+    units += [[board[b//3*3 + k//3][b%3*3 + k%3] for k in range(9)] for b in range(9)]
+    return all(sorted(unit) == list(range(1, 10)) for unit in units)
+
+class TestGenerator(unittest.TestCase):
+
+    def test_orbits(self):
+        sizes = {"none": 81, "rotational": 41, "quarter": 21, "mirror": 45, "diagonal": 45}
+        for symmetry in SYMMETRIES:
+            orbits = _orbits(symmetry)
+            self.assertEqual(len(orbits), sizes[symmetry])
+            self.assertEqual(sorted(c for orbit in orbits for c in orbit), list(range(81)))
+        with self.assertRaises(ValueError):
+            _orbits("spiral")
+
+    def test_random_grid(self):
+        rng = random.Random(0)
+        grids = {random_grid(rng) for _ in range(5)}
+        self.assertEqual(len(grids), 5)
+        self.assertTrue(all(is_solved_grid(grid) for grid in grids))
+
+    def test_make_puzzle(self):
+        rng = random.Random(1)
+        for symmetry in SYMMETRIES:
+            puzzle = make_puzzle(rng, symmetry)
+            self.assertEqual(count_solutions(board_from_string(puzzle.puzzle), limit=2), 1)
+            self.assertTrue(all(p == "0" or p == s for p, s in zip(puzzle.puzzle, puzzle.solution)))
+            self.assertEqual(puzzle.clues, 81 - puzzle.puzzle.count("0"))
+            self.assertEqual(LEVELS[grade(puzzle.puzzle)], puzzle.level)
+            #The clues have the symmetry
+            for orbit in _orbits(symmetry):
+                self.assertEqual(len({puzzle.puzzle[c] == "0" for c in orbit}), 1)
+
+    def test_generate(self):
+        report = []
+        puzzles = list(generate(5, levels=["naked_subsets", "hidden_subsets"], workers=1, seed=7, chunksize=2, report=report))
+        self.assertEqual(len(puzzles), 5)
+        self.assertTrue(all(puzzle.level in ("naked_subsets", "hidden_subsets") for puzzle in puzzles))
+        self.assertEqual(report[0].puzzles, 5)
+        self.assertGreaterEqual(report[0].attempts, 5)
+        #The same seed gives the same puzzles, whatever the number of processes
+        self.assertEqual(list(generate(5, levels=["naked_subsets", "hidden_subsets"], workers=2, seed=7, chunksize=2)), puzzles)
+
+    def test_chunks(self):
+        #The attempts are handed out in chunks, at most n at once so that a few puzzles are shared between the processes
+        self.assertEqual([count for _, count in _attempt_chunks(0, 3, 8)], [3, 3, 2])
+        report = []
+        self.assertEqual(len(list(generate(2, workers=1, seed=1, chunksize=8, report=report))), 2)
+        self.assertEqual(report[0].attempts, 2)
+
+    def test_max_attempts(self):
+        report = []
+        puzzles = list(generate(4, levels=["search"], workers=1, seed=3, chunksize=2, max_attempts=3, report=report))
+        self.assertLessEqual(len(puzzles), 3)
+        self.assertEqual(report[0].attempts, 3)
+        #The arguments are checked at the call
+        with self.assertRaises(ValueError):
+            generate(1, levels=["x_wing"])
+        with self.assertRaises(ValueError):
+            generate(1, symmetry="spiral")
+        with self.assertRaises(ValueError):
+            generate(1, backend="quantum")
+
+    def test_command_line(self):
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(io.StringIO()):
+            main(["-n", "2", "-j", "1", "--seed", "5"])
+            self.assertEqual(len(output.getvalue().splitlines()), 2)
+            #The search level is too rare to be found in 2 puzzles made
+            with self.assertRaises(SystemExit) as raised:
+                main(["-n", "1", "-l", "search", "-m", "2", "-j", "1", "--seed", "5"])
+        self.assertIn("gave up after 2 puzzles made", str(raised.exception.code))
+
+
+if __name__ == '__main__':
+    unittest.main()
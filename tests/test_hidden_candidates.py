@@ -1,5 +1,5 @@
 import unittest
-from human_solve import hidden_singles, hidden_pairs
+from sudoku_solver.human_solve import hidden_singles, hidden_pairs, hidden_subsets
 
 #For the hidden candidates there are some special cases, especially for hidden pairs, because we have to check that they are not part
 #of triples, that we are not able to recognize (by choice)
@@ -142,5 +142,30 @@ class TestHiddenPairs(unittest.TestCase):
         #Check that the number of removed candidates is as expected
         self.assertEqual(removed, expected_rm)
 
+class TestHiddenSubsets(unittest.TestCase):
+
+    def triple_grid(self):
+        #1, 2 and 3 only appear in the cells 0, 3 and 6 of the first row (each in a different box)
+        grid = [[list(range(1, 10)) for j in range(9)] for i in range(9)]
+        grid[0] = [[1, 2, 4, 5], [4, 5, 6, 7, 8, 9], [4, 5, 6, 7, 8, 9], [2, 3, 6], [4, 5, 6, 7, 8, 9], [4, 5, 6, 7, 8, 9],
+                   [1, 3, 7, 8], [4, 5, 6, 7, 8, 9], [4, 5, 6, 7, 8, 9]]
+        return grid
+
+    def test_triple(self):
+        grid, removed = hidden_subsets(self.triple_grid())
+        self.assertEqual(removed, 5)
+        self.assertEqual([grid[0][0], grid[0][3], grid[0][6]], [[1, 2], [2, 3], [1, 3]])
+        #The pairs are not enough
+        self.assertEqual(hidden_pairs(self.triple_grid())[1], 0)
+
+    def test_singles(self):
+        #A hidden single is a subset of one digit
+        grid = [[list(range(1, 10)) for j in range(9)] for i in range(9)]
+        for j in range(1, 9):
+            grid[0][j] = list(range(2, 10))
+        grid, removed = hidden_subsets(grid, size=1)
+        self.assertEqual(removed, 8)
+        self.assertEqual(grid[0][0], [1])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
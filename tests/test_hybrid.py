@@ -0,0 +1,52 @@
+import unittest
+from sudoku_solver import hybrid
+from sudoku_solver.boards import board_to_string
+from sudoku_solver.solver import solutions, easy, two_sols, extreme
+from sudoku_solver.cache import RESULTS
+
+#A puzzle with 17 givens, and one that needs a lot of guessing
+SPARSE = "000000010400000000020000000000050407008000300001090000300400200050100000000806000"
+HARD = "000000039000001005003050800008090006070002000100400000009080050020000600400700000"
+
+#The solutions of dlx are searched for, not taken from the cache of the results (see cache.py)
+def setUpModule():
+    RESULTS.configure(enabled=False)
+
+def tearDownModule():
+    RESULTS.configure(enabled=True)
+
+class TestHybrid(unittest.TestCase):
+
+    def test_same_solution(self):
+        for methods in [(), hybrid.DEFAULT_METHODS, tuple(hybrid.METHODS)]:
+            for board in [easy, extreme]:
+                self.assertEqual(hybrid.solve(board, methods), next(solutions(board, "dlx")))
+            for numbers in [SPARSE, HARD]:
+                self.assertEqual(hybrid.solve(numbers, methods), next(solutions(numbers, "dlx")))
+
+    def test_fewer_nodes(self):
+        #More methods at each node make the tree smaller
+        sizes = []
+        for methods in [(), hybrid.DEFAULT_METHODS, tuple(hybrid.METHODS)]:
+            search = hybrid.HybridSearch(methods)
+            next(search.solutions(HARD))
+            sizes.append(search.nodes)
+        self.assertGreater(sizes[0], sizes[1])
+        self.assertGreaterEqual(sizes[1], sizes[2])
+
+    def test_every_solution(self):
+        found = list(hybrid.solutions(board_to_string(two_sols)))
+        self.assertEqual(sorted(found), sorted(solutions(board_to_string(two_sols), "dlx")))
+
+    def test_no_solution(self):
+        self.assertIsNone(hybrid.solve("11" + "0" * 79))
+
+    def test_methods(self):
+        #Given by name or as functions, in any order, they run from the cheapest to the most expensive
+        search = hybrid.HybridSearch(["fish", hybrid.METHODS["naked_subsets"]])
+        self.assertEqual(search.methods, (hybrid.METHODS["naked_subsets"], hybrid.METHODS["fish"]))
+        with self.assertRaises(ValueError):
+            hybrid.HybridSearch(["guessing"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+#Cold import budget in milliseconds, can be changed for slow machines
+BUDGET = float(os.environ.get("SUDOKU_IMPORT_BUDGET_MS", "300"))
+
+#Import the modules in a fresh interpreter and print the time it took, then whether the DLX links were built
+SCRIPT = """
+import time
+start = time.perf_counter()
+import sudoku_solver, sudoku_solver.human_solve, sudoku_solver.solver, sudoku_solver.dlx, sudoku_solver.batch
+print((time.perf_counter() - start) * 1000)
+print(sudoku_solver.dlx._template is None)
+"""
+
+class TestImportTime(unittest.TestCase):
+
+    def test_cold_import(self):
+        result = subprocess.run([sys.executable, "-c", SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True)
+        #Importing prints nothing and doesn't solve anything
+        lines = result.stdout.split()
+        self.assertEqual(len(lines), 2, result.stdout)
+        self.assertEqual(lines[1], "True")
+        self.assertLess(float(lines[0]), BUDGET, "cold import took " + lines[0] + "ms (budget : " + str(BUDGET) + "ms)")
+
+if __name__ == '__main__':
+    unittest.main()
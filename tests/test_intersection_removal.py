@@ -1,5 +1,5 @@
 import unittest
-from human_solve import pointing_pairs, box_line_reduction
+from sudoku_solver.human_solve import pointing_pairs, box_line_reduction, intersection_removal
 
 class TestPointingPairs(unittest.TestCase):
     
@@ -101,5 +101,27 @@ class TestBoxLineReduction(unittest.TestCase):
         self.assertEqual(removed, expected_rm)
 
 
+class TestIntersectionRemoval(unittest.TestCase):
+
+    def both_grid(self):
+        grid = [[list(range(1, 10)) for j in range(9)] for i in range(9)]
+        #In the first box, 1 only appears in the first row (pointing pair)
+        for i in range(1, 3):
+            for j in range(3):
+                grid[i][j] = list(range(2, 10))
+        grid[0][2] = list(range(2, 10))
+        #In the fifth row, 2 only appears in the middle box (box/line reduction)
+        for j in [0, 1, 2, 5, 6, 7, 8]:
+            grid[4][j] = [1] + list(range(3, 10))
+        return grid
+
+    def test_both(self):
+        self.assertEqual(pointing_pairs(self.both_grid())[1], 6)
+        self.assertEqual(box_line_reduction(self.both_grid())[1], 6)
+        grid, removed = intersection_removal(self.both_grid())
+        self.assertEqual(removed, 12)
+        self.assertEqual([j for j in range(9) if 1 in grid[0][j]], [0, 1])
+        self.assertEqual([(i, j) for i in range(3, 6) for j in range(3, 6) if 2 in grid[i][j]], [(4, 3), (4, 4)])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
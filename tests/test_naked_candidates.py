@@ -1,5 +1,5 @@
 import unittest
-from human_solve import naked_pairs
+from sudoku_solver.human_solve import naked_pairs, naked_subsets
 
 class TestNakedCandidates(unittest.TestCase):
     
@@ -50,6 +50,31 @@ class TestNakedCandidates(unittest.TestCase):
         #Check that the number of removed candidates is as expected
         self.assertEqual(removed, expected_rm)
 
+    def subset_grid(self, first_row):
+        #The first row starts with the given cells, every other cell has all the candidates
+        grid = [[list(range(1, 10)) for j in range(9)] for i in range(9)]
+        grid[0][:len(first_row)] = [list(cell) for cell in first_row]
+        return grid
+
+    def test_triple(self):
+        #No two cells have the same candidates, but the 3 cells only have 3 digits together
+        grid = self.subset_grid([[1, 2], [2, 3], [1, 3]])
+        self.assertEqual(naked_pairs(self.subset_grid([[1, 2], [2, 3], [1, 3]]))[1], 0)
+        grid, removed = naked_subsets(grid)
+        #The 3 cells are in the same row and the same box
+        self.assertEqual(removed, 36)
+        self.assertEqual(grid[0][3:], [[4, 5, 6, 7, 8, 9]] * 6)
+        self.assertEqual(grid[1][:3], [[4, 5, 6, 7, 8, 9]] * 3)
+        self.assertEqual(grid[0][:3], [[1, 2], [2, 3], [1, 3]])
+        self.assertEqual(grid[1][3], list(range(1, 10)))
+
+    def test_quad(self):
+        grid, removed = naked_subsets(self.subset_grid([[1, 2], [2, 3], [3, 4], [1, 4]]))
+        self.assertEqual(removed, 20)
+        self.assertEqual(grid[0][4:], [[5, 6, 7, 8, 9]] * 5)
+        #Restricted to triples, nothing is found
+        self.assertEqual(naked_subsets(self.subset_grid([[1, 2], [2, 3], [3, 4], [1, 4]]), size=3)[1], 0)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,35 @@
+import unittest
+from sudoku_solver.candidate_grid import CandidateGrid, Contradiction
+from sudoku_solver.propagation import propagate
+
+class TestPropagation(unittest.TestCase):
+
+    def test_singles_solve_easy_puzzle(self):
+        #The easy puzzle only needs naked and hidden singles
+        grid = CandidateGrid.from_string("860004000000900800304000067620045791539081406007029000003006000050400089000507602")
+        propagate(grid)
+        self.assertEqual(grid.unsolved, 0)
+        self.assertEqual(grid.remaining, 0)
+        self.assertEqual(grid.to_string(), "865274913172963854394158267628345791539781426417629538243896175756412389981537642")
+
+    def test_counters_are_incremental(self):
+        #After propagation the counters kept by the grid should be the same as the ones computed from scratch
+        grid = CandidateGrid.from_string("100685070060010000590004060007060000010000007600090254000073091000050006800000300")
+        removed = propagate(grid)
+        self.assertGreater(removed, 0)
+        fresh = CandidateGrid(grid.cells)
+        self.assertEqual(grid.unsolved, fresh.unsolved)
+        self.assertEqual(grid.remaining, fresh.remaining)
+        self.assertEqual(grid.counts, fresh.counts)
+        #Nothing is left to do, so a second propagation removes nothing
+        self.assertEqual(propagate(grid), 0)
+
+    def test_contradiction(self):
+        #Two 1s in the first row
+        grid = CandidateGrid.from_string("11" + "0"*79)
+        with self.assertRaises(Contradiction):
+            propagate(grid)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from sudoku_solver.rating import LEVELS, TECHNIQUES, RatingSummary, grade, rate, level_index
+from sudoku_solver.candidate_grid import CandidateGrid, Contradiction
+from sudoku_solver.solver import easy, difficult, expert, extreme
+
+class TestGrade(unittest.TestCase):
+
+    def test_levels(self):
+        self.assertEqual(LEVELS[grade(easy)], "singles")
+        self.assertEqual(LEVELS[grade(difficult)], "naked_subsets")
+        self.assertEqual(LEVELS[grade(expert)], "intersection_removal")
+        self.assertEqual(LEVELS[grade(extreme)], "fish")
+        self.assertEqual(LEVELS[grade("0" * 81)], "search")
+
+    def test_in_place(self):
+        grid = CandidateGrid.from_string("".join(str(n) for row in extreme for n in row))
+        grade(grid)
+        self.assertEqual(grid.unsolved, 0)
+
+    def test_no_solution(self):
+        with self.assertRaises(Contradiction):
+            grade("11" + "0" * 79)
+
+    def test_level_index(self):
+        self.assertEqual(level_index("fish"), LEVELS.index("fish"))
+        self.assertEqual(level_index(0), 0)
+        with self.assertRaises(ValueError):
+            level_index("x_wing")
+
+class TestRate(unittest.TestCase):
+
+    def test_rate(self):
+        rating = rate(extreme)
+        self.assertEqual(LEVELS[rating.level], "fish")
+        self.assertEqual(len(rating.removed), len(TECHNIQUES))
+        removed = dict(zip(TECHNIQUES, rating.removed))
+        self.assertGreater(removed["fish"], 0)
+        #Every candidate is removed in the end
+        self.assertEqual(sum(rating.removed), CandidateGrid.from_string("".join(str(n) for row in extreme for n in row)).remaining)
+        self.assertEqual(rate(easy).passes, 1)
+        self.assertEqual(rate(easy).removed[1:], (0,) * (len(TECHNIQUES) - 1))
+
+    def test_summary(self):
+        summary = RatingSummary()
+        for board in [easy, easy, extreme]:
+            summary.add(rate(board))
+        other = RatingSummary()
+        other.add(rate(difficult))
+        other.invalid += 1
+        summary.merge(other)
+        self.assertEqual(summary.puzzles, 5)
+        result = summary.as_dict()
+        self.assertEqual(result["levels"]["singles"]["puzzles"], 2)
+        self.assertEqual(result["levels"]["singles"]["passes"], {1: 2})
+        self.assertEqual(result["levels"]["fish"]["removed"]["fish"], dict(zip(TECHNIQUES, rate(extreme).removed))["fish"])
+        self.assertEqual(result["levels"]["naked_subsets"]["puzzles"], 1)
+        self.assertEqual(result["invalid"], 1)
+        self.assertIn("fish", summary.format())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from human_solve import simple_elimination
+from sudoku_solver.human_solve import simple_elimination
 
 class TestSimpleElimination(unittest.TestCase):
     
@@ -0,0 +1,31 @@
+import unittest
+from sudoku_solver.candidate_grid import CandidateGrid
+from sudoku_solver.human_solve import solve
+
+class TestSolve(unittest.TestCase):
+
+    def solve_string(self, numbers, mode):
+        grid, _ = solve(CandidateGrid.from_string(numbers), mode)
+        return grid
+
+    def test_modes_agree(self):
+        #The scheduler should reach the same grid as the fixed order sweeps, solved or not
+        for numbers in ["100685070060010000590004060007060000010000007600090254000073091000050006800000300",
+                        "586400003000080004000900007000000040000009720030050001700000060050032000200060000",
+                        "001003002020040010700900500400800600010070040003004008002007005090050060600300800",
+                        #The human methods get stuck on this one, forcing included
+                        "100007090030020008009600501005300900010080002600004000300000010040000007007000300"]:
+            self.assertEqual(self.solve_string(numbers, "scheduled"), self.solve_string(numbers, "sweep"))
+        self.assertGreater(self.solve_string(numbers, "scheduled").unsolved, 0)
+
+    def test_solved(self):
+        grid = self.solve_string("100685070060010000590004060007060000010000007600090254000073091000050006800000300", "scheduled")
+        self.assertEqual(grid.unsolved, 0)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self.solve_string("0"*81, "fastest")
+
+
+if __name__ == '__main__':
+    unittest.main()
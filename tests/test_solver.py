@@ -0,0 +1,85 @@
+import unittest
+from sudoku_solver.solver import solve_mrv, solve_with, solutions, count_solutions, has_unique_solution, BACKENDS, two_sols, easy, medium, difficult, expert, diabolical, extreme
+from sudoku_solver.topology import UNITS
+from sudoku_solver.cache import RESULTS
+
+#The cache of the results (see cache.py) is turned off : a result found by one backend would be given to the next ones without searching,
+#and they have to be tested. The cache has its own tests in test_cache.py
+def setUpModule():
+    RESULTS.configure(enabled=False)
+
+def tearDownModule():
+    RESULTS.configure(enabled=True)
+
+#Check that a board is a complete and valid solution of the puzzle
+def is_solution(puzzle, board):
+    cells = [board[i][j] for i in range(9) for j in range(9)]
+    givens = [puzzle[i][j] for i in range(9) for j in range(9)]
+    if any(given != 0 and given != cell for given, cell in zip(givens, cells)):
+        return False
+    return all(sorted(cells[c] for c in unit) == list(range(1,10)) for unit in UNITS)
+
+class TestMRV(unittest.TestCase):
+
+    def test_bundled_boards(self):
+        for puzzle in [easy, medium, difficult, expert, diabolical, extreme]:
+            board = [row[:] for row in puzzle]
+            self.assertTrue(solve_mrv(board))
+            self.assertTrue(is_solution(puzzle, board))
+
+    def test_no_solution(self):
+        #Two 5s in the first column
+        board = [row[:] for row in easy]
+        board[1][0] = 5
+        self.assertFalse(solve_mrv(board))
+        self.assertEqual(board[1][0], 5)
+
+
+class TestBackends(unittest.TestCase):
+
+    def test_every_backend(self):
+        for backend in BACKENDS:
+            board = [row[:] for row in extreme]
+            self.assertTrue(solve_with(board, backend))
+            self.assertTrue(is_solution(extreme, board))
+
+    def test_invalid_puzzle(self):
+        #The solution of easy with two 8s in the first row : every cell is filled but the board isn't valid
+        board = [row[:] for row in easy]
+        self.assertTrue(solve_with(board))
+        board[0][1] = 8
+        for backend in BACKENDS:
+            self.assertEqual(count_solutions(board, backend=backend), 0)
+            self.assertFalse(has_unique_solution(board, backend))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            solve_with([row[:] for row in easy], "quantum")
+
+
+class TestSolutions(unittest.TestCase):
+
+    def test_count(self):
+        for backend in BACKENDS:
+            self.assertEqual(count_solutions(two_sols, backend=backend), 2)
+            self.assertEqual(count_solutions(two_sols, limit=1, backend=backend), 1)
+            self.assertEqual(count_solutions(easy, limit=2, backend=backend), 1)
+
+    def test_unique(self):
+        self.assertFalse(has_unique_solution(two_sols))
+        self.assertTrue(has_unique_solution(extreme))
+
+    def test_lazy_generator(self):
+        #The solutions are different valid boards and the puzzle itself is left untouched
+        before = [row[:] for row in two_sols]
+        found = solutions(two_sols)
+        first = next(found)
+        second = next(found)
+        self.assertNotEqual(first, second)
+        self.assertTrue(is_solution(two_sols, first) and is_solution(two_sols, second))
+        self.assertEqual(list(found), [])
+        self.assertEqual(two_sols, before)
+
+
+if __name__ == '__main__':
+    unittest.main()
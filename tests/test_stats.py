@@ -0,0 +1,54 @@
+import unittest
+from sudoku_solver.candidate_grid import CandidateGrid
+from sudoku_solver.human_solve import solve, STRATEGIES
+from sudoku_solver.stats import SolveStats
+
+PUZZLE = "100685070060010000590004060007060000010000007600090254000073091000050006800000300"
+#Needs more than singles, and the human methods (forcing included) get stuck on it
+HARD = "100007090030020008009600501005300900010080002600004000300000010040000007007000300"
+
+class TestStats(unittest.TestCase):
+
+    def test_same_result(self):
+        for mode in ["scheduled", "sweep"]:
+            for numbers in [PUZZLE, HARD]:
+                grid, steps = solve(CandidateGrid.from_string(numbers), mode)
+                stats = SolveStats()
+                measured, measured_steps = solve(CandidateGrid.from_string(numbers), mode, stats)
+                self.assertEqual(measured, grid)
+                self.assertEqual(measured_steps, steps)
+                self.assertEqual(stats.steps, steps)
+                if numbers == HARD:
+                    self.assertGreater(grid.unsolved, 0)
+
+    def test_totals(self):
+        grid = CandidateGrid.from_string(HARD)
+        start = grid.remaining
+        stats = SolveStats()
+        grid, steps = solve(grid, "sweep", stats)
+        #Every method runs once per pass in sweep mode
+        self.assertEqual(set(stats.strategies), {"propagate"} | {s.__name__ for s in STRATEGIES})
+        for totals in stats.strategies.values():
+            self.assertEqual(totals.calls, steps)
+            self.assertLessEqual(totals.no_effect, totals.calls)
+        #The candidates removed add up, and the trajectory goes from the start to the end
+        self.assertEqual(sum(t.removed for t in stats.strategies.values()), start - grid.remaining)
+        self.assertEqual(stats.trajectory[0], start)
+        self.assertEqual(stats.trajectory[-1], grid.remaining)
+        self.assertEqual(len(stats.trajectory), steps + 1)
+        self.assertEqual(stats.trajectory, sorted(stats.trajectory, reverse=True))
+        self.assertEqual(len(stats.runs), sum(t.calls for t in stats.strategies.values()))
+        self.assertIn("naked_subsets", stats.as_dict()["strategies"])
+
+    def test_callback(self):
+        runs = []
+        stats = SolveStats(callback=runs.append, keep_runs=False)
+        solve(CandidateGrid.from_string(PUZZLE), "scheduled", stats)
+        self.assertEqual(stats.runs, [])
+        self.assertEqual(len(runs), sum(t.calls for t in stats.strategies.values()))
+        self.assertEqual(runs[0].step, 1)
+        self.assertEqual(runs[0].strategy, "propagate")
+        self.assertEqual(runs[-1].candidates_left, 0)
+
+if __name__ == '__main__':
+    unittest.main()
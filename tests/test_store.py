@@ -0,0 +1,55 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from sudoku_solver.store import ResultStore, StoredResult
+
+RESULT = StoredResult("860004000000900800304000067620045791539081406007029000003006000050400089000507602",
+                      "865274913172963854394158267628345791539781426417629538243896175756412389981537642", 1, "singles", 0.001, "mrv")
+
+class TestResultStore(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "results.db")
+
+    def test_commit(self):
+        store = ResultStore(self.path)
+        store.add([RESULT])
+        self.assertEqual(store.pending, 1)
+        self.assertEqual(store.get(RESULT.puzzle), RESULT)
+        store.commit("run", 10)
+        store.add([RESULT._replace(puzzle="0" * 81, solution=None, count=2)])
+        #Closing without a commit drops what was added since the last one
+        store.close()
+        with ResultStore(self.path) as store:
+            self.assertEqual(len(store), 1)
+            self.assertEqual(store.position("run"), 10)
+            self.assertEqual(store.position("other run"), 0)
+            self.assertEqual(list(store.results()), [RESULT])
+
+    def test_known(self):
+        with ResultStore(self.path) as store:
+            puzzles = [str(i).zfill(81) for i in range(1200)]
+            store.add(RESULT._replace(puzzle=p) for p in puzzles[::2])
+            found = store.known(puzzles)
+            self.assertEqual(sorted(found), sorted(puzzles[::2]))
+            self.assertEqual(found[puzzles[0]].solution, RESULT.solution)
+
+    def test_readonly(self):
+        with ResultStore(self.path) as store:
+            store.add([RESULT])
+        reader = ResultStore(self.path, readonly=True)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.get(RESULT.puzzle), RESULT)
+        with self.assertRaises(sqlite3.OperationalError):
+            reader.add([RESULT._replace(puzzle="0" * 81)])
+        #A missing database isn't created
+        with self.assertRaises(sqlite3.OperationalError):
+            ResultStore(self.path + "-missing", readonly=True)
+        self.assertFalse(os.path.exists(self.path + "-missing"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+from sudoku_solver.topology import UNITS, CELL_UNITS, PEERS, SEGMENTS, ROW_OF, COL_OF, BOX_OF
+
+class TestTopology(unittest.TestCase):
+
+    def test_units(self):
+        #27 units of 9 distinct cells, and every cell belongs to exactly 3 units
+        self.assertEqual(len(UNITS), 27)
+        for unit in UNITS:
+            self.assertEqual(len(set(unit)), 9)
+        for c in range(81):
+            self.assertEqual([u for u in range(27) if c in UNITS[u]], list(CELL_UNITS[c]))
+
+    def test_peers(self):
+        #Each cell has 20 peers : the cells sharing its row, column or box
+        for c in range(81):
+            expected = [p for p in range(81) if p!=c and (ROW_OF[p]==ROW_OF[c] or COL_OF[p]==COL_OF[c] or BOX_OF[p]==BOX_OF[c])]
+            self.assertEqual(list(PEERS[c]), expected)
+
+    def test_segments(self):
+        #54 box/line intersections of 3 cells, the rest of the box and of the line complete the units
+        self.assertEqual(len(SEGMENTS), 54)
+        for box, line, cells, box_rest, line_rest in SEGMENTS:
+            self.assertEqual(len(cells), 3)
+            self.assertEqual(sorted(cells + box_rest), list(UNITS[box]))
+            self.assertEqual(sorted(cells + line_rest), list(UNITS[line]))
+
+
+if __name__ == '__main__':
+    unittest.main()
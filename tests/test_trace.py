@@ -0,0 +1,60 @@
+import unittest
+from sudoku_solver.trace import Trace
+from sudoku_solver.candidate_grid import CandidateGrid, VALUE
+from sudoku_solver.human_solve import solve
+from sudoku_solver.stats import SolveStats
+from sudoku_solver.boards import board_to_string
+from sudoku_solver.solver import extreme
+
+class TestTrace(unittest.TestCase):
+
+    def setUp(self):
+        self.start = CandidateGrid.from_string(board_to_string(extreme))
+        self.trace = Trace()
+        self.grid, self.steps = solve(self.start.copy(), trace=self.trace)
+
+    def test_record(self):
+        self.assertEqual(self.trace.events.itemsize, 4)
+        self.assertIsNone(self.grid.trace)
+        removals = [event for event in self.trace if not event.placement]
+        placements = [event for event in self.trace if event.placement]
+        self.assertEqual(len(removals), self.start.remaining)
+        #Every cell left empty in the puzzle is placed once, with its solution
+        self.assertEqual(len(placements), self.start.unsolved)
+        for event in placements:
+            self.assertEqual(VALUE[self.grid.cells[event.cell]], event.digit)
+        self.assertEqual({event.strategy for event in self.trace}, {"propagate", "naked_subsets", "fish"})
+        self.assertEqual(self.trace.event(len(self.trace) - 1).step, self.steps)
+
+    def test_replay(self):
+        self.assertEqual(self.trace.grid(0), self.start)
+        self.assertEqual(self.trace.grid(), self.grid)
+        self.assertEqual(self.trace.grid_after(0), self.start)
+        #The candidates only go down, one removal at a time
+        previous = self.start.remaining
+        for step in range(1, self.steps):
+            grid = self.trace.grid_after(step)
+            self.assertLessEqual(grid.remaining, previous)
+            previous = grid.remaining
+            end = self.trace.pass_end(step)
+            self.assertTrue(all(event.step <= step for event in map(self.trace.event, range(end))))
+        self.assertEqual(self.trace.grid(10).remaining, self.start.remaining - sum(1 for i in range(10) if not self.trace.event(i).placement))
+
+    def test_explain(self):
+        lines = self.trace.explain(0, 2)
+        self.assertEqual(len(lines), 2)
+        self.assertRegex(lines[0], r"^pass 1, propagate : r\dc\d <> \d$")
+        self.assertTrue(any(" = " in line for line in self.trace.explain()))
+
+    def test_with_stats(self):
+        stats = SolveStats()
+        trace = Trace()
+        solve(self.start.copy(), stats=stats, trace=trace)
+        self.assertEqual(len(trace), len(self.trace))
+        self.assertEqual(sum(totals.removed for totals in stats.strategies.values()), self.start.remaining)
+        with self.assertRaises(ValueError):
+            solve(self.start.copy(), trace=trace)
+
+
+if __name__ == '__main__':
+    unittest.main()
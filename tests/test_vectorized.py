@@ -0,0 +1,45 @@
+import unittest
+
+try:
+    import numpy
+    from sudoku_solver import vectorized
+except ImportError:
+    numpy = None
+
+from sudoku_solver.boards import board_from_string, board_to_string
+from sudoku_solver import solver
+
+EASY = board_to_string(solver.easy)
+EXTREME = board_to_string(solver.extreme)
+BROKEN = "11" + EASY[2:]
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestVectorized(unittest.TestCase):
+
+    def test_candidates(self):
+        candidates = vectorized.candidates_from_strings([EASY, EXTREME.replace("0", ".")])
+        self.assertEqual(candidates.shape, (2, 81, 9))
+        for k, puzzle in enumerate([EASY, EXTREME]):
+            for c, n in enumerate(puzzle):
+                expected = [True] * 9 if n == "0" else [d == int(n) for d in range(1, 10)]
+                self.assertEqual(candidates[k, c].tolist(), expected)
+
+    def test_propagate_batch(self):
+        result = vectorized.propagate_batch(vectorized.candidates_from_strings([EASY, EXTREME, BROKEN]))
+        self.assertEqual(result.solved.tolist(), [True, False, False])
+        self.assertEqual(result.stalled.tolist(), [False, True, False])
+        self.assertEqual(result.contradiction.tolist(), [False, False, True])
+        self.assertEqual(result.strings()[0], board_to_string(next(solver.solutions(board_from_string(EASY)))))
+        #The propagation never removes the solution
+        solution = next(solver.solutions(board_from_string(EXTREME)))
+        digits = [n - 1 for row in solution for n in row]
+        self.assertTrue(result.candidates[1][numpy.arange(81), digits].all())
+
+    def test_solve_batch(self):
+        solutions = vectorized.solve_batch([EASY, EXTREME, BROKEN])
+        self.assertIsNone(solutions[2])
+        for puzzle, solution in zip([EASY, EXTREME], solutions):
+            self.assertEqual(solution, board_to_string(next(solver.solutions(board_from_string(puzzle)))))
+
+if __name__ == "__main__":
+    unittest.main()
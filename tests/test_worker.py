@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+from sudoku_solver.worker import SolveWorker, Cancelled, _Reporter
+from sudoku_solver.candidate_grid import CandidateGrid
+
+EASY = "860004000000900800304000067620045791539081406007029000003006000050400089000507602"
+SOLUTION = "865274913172963854394158267628345791539781426417629538243896175756412389981537642"
+
+def run(worker):
+    worker.start()
+    worker.join(60)
+    return worker.drain()
+
+class TestSolveWorker(unittest.TestCase):
+
+    def test_human(self):
+        messages = run(SolveWorker(EASY))
+        self.assertEqual(messages[0], ("status", "human methods"))
+        self.assertEqual(messages[-1], ("done", True))
+        #Replaying the events gives the solution
+        grid = CandidateGrid.from_string(EASY)
+        for message in messages:
+            if message[0] == "events":
+                for cell, removed, left in message[1]:
+                    self.assertEqual(grid.cells[cell] & ~removed, left)
+                    grid.eliminate(cell, removed)
+        self.assertEqual(grid.to_string(), SOLUTION)
+
+    def test_search(self):
+        messages = run(SolveWorker("0" * 81, search=False))
+        self.assertEqual(messages[-1], ("done", False))
+        messages = run(SolveWorker("0" * 81, "dlx"))
+        self.assertEqual(messages[-3], ("status", "search (dlx)"))
+        kind, solution = messages[-2]
+        self.assertEqual(kind, "solution")
+        self.assertEqual(sorted(solution[:9]), list("123456789"))
+        self.assertEqual(messages[-1], ("done", True))
+
+    def test_no_solution(self):
+        messages = run(SolveWorker("11" + "0" * 79))
+        self.assertEqual(messages[-1][0], "error")
+
+    def test_failure(self):
+        #Every method run by the scheduler goes through the trace of the worker
+        with mock.patch.object(_Reporter, "run", side_effect=RuntimeError("broken method")):
+            worker = SolveWorker(EASY)
+            messages = run(worker)
+        self.assertEqual(messages[-1], ("error", "RuntimeError : broken method"))
+        self.assertFalse(worker.running())
+
+    def test_cancel(self):
+        worker = SolveWorker(EASY)
+        worker.stop()
+        self.assertEqual(run(worker)[-1], ("cancelled",))
+        self.assertFalse(worker.running())
+        #The search process is stopped
+        worker = SolveWorker("0" * 81, poll=0.01)
+        worker.stop()
+        with self.assertRaises(Cancelled):
+            worker._search("0" * 81)
+
+    def test_drain(self):
+        worker = SolveWorker(EASY)
+        worker.start()
+        worker.join(60)
+        first = worker.drain(2)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(worker.drain()[-1], ("done", True))
+        self.assertEqual(worker.drain(), [])
+        with self.assertRaises(ValueError):
+            SolveWorker(EASY, "quantum")
+
+
+if __name__ == '__main__':
+    unittest.main()
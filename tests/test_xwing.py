@@ -1,5 +1,5 @@
 import unittest
-from human_solve import x_wing
+from sudoku_solver.human_solve import x_wing, fish
 
 class TestXWing(unittest.TestCase):
     
@@ -100,5 +100,33 @@ class TestXWing(unittest.TestCase):
         self.assertEqual(removed, expected_rm)
 
 
+class TestFish(unittest.TestCase):
+
+    def fish_grid(self, lines):
+        #1 only appears in the given columns of the given rows, every other cell has all the candidates
+        grid = [[list(range(1, 10)) for j in range(9)] for i in range(9)]
+        for i, columns in lines.items():
+            for j in range(9):
+                if j not in columns:
+                    grid[i][j] = list(range(2, 10))
+        return grid
+
+    def test_swordfish(self):
+        lines = {0: [0, 3], 3: [3, 6], 6: [0, 6]}
+        self.assertEqual(x_wing(self.fish_grid(lines))[1], 0)
+        grid, removed = fish(self.fish_grid(lines))
+        self.assertEqual(removed, 18)
+        for i in range(9):
+            for j in [0, 3, 6]:
+                self.assertEqual(1 in grid[i][j], j in lines.get(i, []))
+
+    def test_several_x_wings(self):
+        #Two x-wings for the same number are both applied
+        grid, removed = x_wing(self.fish_grid({0: [0, 1], 1: [0, 1], 4: [4, 7], 5: [4, 7]}))
+        #Rows 0, 1, 4 and 5 are already cleared, 5 rows are left in each of the 4 columns
+        self.assertEqual(removed, 4 * 5)
+        for j in [0, 1, 4, 7]:
+            self.assertEqual([i for i in range(9) if 1 in grid[i][j]], [0, 1] if j < 2 else [4, 5])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file